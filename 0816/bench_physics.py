@@ -0,0 +1,189 @@
+"""tile_physics のマイクロベンチマーク（ウィンドウ不要）。
+
+    python bench_physics.py
+    python bench_physics.py --speeds 1.2 12 --entities 1 200 --frames 300
+
+メモリ上のタイルマップ（ランダムな足場＋外周の壁）を作り、
+タイルソース（live / grid）× 移動方式（旧: 1pxずつ / sweep）で
+速度ごと・エンティティ数ごとに1フレーム分の移動（X と Y）にかかる時間を測る。
+旧方式は各ゲームに貼り付けてあった move_*_with_pushback と同じもの。
+"""
+import argparse
+import random
+import time
+
+from tile_physics import TILE_SOURCES
+
+TILE_SIZE = 8
+MAP_W = 256
+MAP_H = 256
+WALL_UV = (2, 2)
+TILE_TO_TILETYPE = {WALL_UV: 1}
+BLOCKING_TYPES = {1}
+ENTITY_SIZE = 16
+
+PERCENTILES = (50, 90, 99)
+
+
+class MemoryTilemap:
+    """pyxel.Tilemap の pget / pset だけを持つ、メモリ上のタイルマップ"""
+
+    def __init__(self, cols, rows):
+        self.cols = cols
+        self.rows = rows
+        self.data = [(0, 0)] * (cols * rows)
+
+    def pget(self, x, y):
+        if 0 <= x < self.cols and 0 <= y < self.rows:
+            return self.data[y * self.cols + x]
+        return (0, 0)
+
+    def pset(self, x, y, uv):
+        if 0 <= x < self.cols and 0 <= y < self.rows:
+            self.data[y * self.cols + x] = tuple(uv)
+
+
+def make_tilemap(seed):
+    """外周を壁で囲み、中にランダムな足場を置いたマップ"""
+    rng = random.Random(seed)
+    cols = MAP_W // TILE_SIZE
+    rows = MAP_H // TILE_SIZE
+    tm = MemoryTilemap(cols, rows)
+    for x in range(cols):
+        tm.pset(x, 0, WALL_UV)
+        tm.pset(x, rows - 1, WALL_UV)
+    for y in range(rows):
+        tm.pset(0, y, WALL_UV)
+        tm.pset(cols - 1, y, WALL_UV)
+    for _ in range(24):
+        y = rng.randrange(4, rows - 2)
+        x = rng.randrange(1, cols - 6)
+        for i in range(rng.randint(3, 6)):
+            tm.pset(x + i, y, WALL_UV)
+    return tm
+
+
+# ----- 旧方式（1pxずつ進めて8点判定） -----
+def step_move_y(source, x, y, dy, w, h):
+    hit_top = hit_bottom = False
+    step = 1 if dy > 0 else -1
+    for _ in range(abs(int(dy))):
+        if source.rect_hits_block(x, y + step, w, h):
+            if step > 0:
+                hit_bottom = True
+            else:
+                hit_top = True
+            return y, hit_top, hit_bottom, 0
+        y += step
+    frac = dy - int(dy)
+    if frac != 0:
+        if source.rect_hits_block(x, y + frac, w, h):
+            if frac > 0:
+                hit_bottom = True
+            else:
+                hit_top = True
+            return y, hit_top, hit_bottom, 0
+        y += frac
+    return y, hit_top, hit_bottom, dy
+
+
+def step_move_x(source, x, y, dx, w, h):
+    hit_left = hit_right = False
+    step = 1 if dx > 0 else -1
+    for _ in range(abs(int(dx))):
+        if source.rect_hits_block(x + step, y, w, h):
+            if step > 0:
+                hit_right = True
+            else:
+                hit_left = True
+            return x, hit_left, hit_right, 0
+        x += step
+    frac = dx - int(dx)
+    if frac != 0:
+        if source.rect_hits_block(x + frac, y, w, h):
+            if frac > 0:
+                hit_right = True
+            else:
+                hit_left = True
+            return x, hit_left, hit_right, 0
+        x += frac
+    return x, hit_left, hit_right, dx
+
+
+MOVERS = {
+    "step": (step_move_x, step_move_y),
+    "sweep": (lambda s, *a: s.move_x(*a), lambda s, *a: s.move_y(*a)),
+}
+
+
+def spawn_entities(source, count, speed, rng):
+    """壁に埋まっていない位置に count 体置く。[x, y, vx, vy] のリスト"""
+    entities = []
+    while len(entities) < count:
+        x = rng.uniform(TILE_SIZE, MAP_W - TILE_SIZE - ENTITY_SIZE)
+        y = rng.uniform(TILE_SIZE, MAP_H - TILE_SIZE - ENTITY_SIZE)
+        if source.rect_hits_block(x, y, ENTITY_SIZE, ENTITY_SIZE):
+            continue
+        vx = speed if rng.random() < 0.5 else -speed
+        vy = speed if rng.random() < 0.5 else -speed
+        entities.append([x, y, vx, vy])
+    return entities
+
+
+def percentile(sorted_values, p):
+    if not sorted_values:
+        return 0.0
+    k = max(0, min(len(sorted_values) - 1, round(p / 100 * len(sorted_values)) - 1))
+    return sorted_values[k]
+
+
+def run(source_kind, mover, speed, count, frames, seed):
+    """frames フレーム分の移動を測り、1フレームあたりの時間（秒）のリストを返す"""
+    tm = make_tilemap(seed)
+    source = TILE_SOURCES[source_kind](tm, TILE_TO_TILETYPE, BLOCKING_TYPES,
+                                       MAP_W, MAP_H, TILE_SIZE)
+    move_x, move_y = MOVERS[mover]
+    entities = spawn_entities(source, count, speed, random.Random(seed + 1))
+    w = h = ENTITY_SIZE
+    clock = time.perf_counter
+    times = []
+    for _ in range(frames):
+        start = clock()
+        for e in entities:
+            x, y, vx, vy = e
+            y, hit_top, hit_bottom, _ = move_y(source, x, y, vy, w, h)
+            if hit_top or hit_bottom:
+                vy = -vy
+            x, hit_left, hit_right, _ = move_x(source, x, y, vx, w, h)
+            if hit_left or hit_right:
+                vx = -vx
+            e[0], e[1], e[2], e[3] = x, y, vx, vy
+        times.append(clock() - start)
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description="tile_physics micro benchmark")
+    parser.add_argument("--frames", type=int, default=600)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--speeds", type=float, nargs="+", default=[0.5, 1.2, 5.0, 12.0])
+    parser.add_argument("--entities", type=int, nargs="+", default=[1, 10, 50, 200])
+    parser.add_argument("--sources", nargs="+", choices=list(TILE_SOURCES), default=list(TILE_SOURCES))
+    parser.add_argument("--movers", nargs="+", choices=list(MOVERS), default=list(MOVERS))
+    args = parser.parse_args()
+
+    header = "{:<6}{:<7}{:>7}{:>6}".format("src", "mover", "speed", "n")
+    header += "".join(f"{'p' + str(p):>10}" for p in PERCENTILES) + f"{'max':>10}"
+    print(header + "   (usec / frame)")
+    for speed in args.speeds:
+        for count in args.entities:
+            for kind in args.sources:
+                for mover in args.movers:
+                    values = sorted(run(kind, mover, speed, count, args.frames, args.seed))
+                    cols = [percentile(values, p) for p in PERCENTILES] + [values[-1]]
+                    print("{:<6}{:<7}{:>7.1f}{:>6}".format(kind, mover, speed, count)
+                          + "".join(f"{v * 1e6:>10.1f}" for v in cols))
+
+
+if __name__ == "__main__":
+    main()
@@ -73,6 +73,7 @@ ENEMY_W = 8              # 敵の幅
 ENEMY_H = 8              # 敵の高さ
 ENEMY_HP = 3              # 敵の初期HP
 ENEMY_HURT_FRAMES = 20    # 敵の無敵時間
+ENEMY_GRID_CELL = 32      # 敵の当たり判定用グリッドの1マスの大きさ（px）
 
 # 敵の物理パラメータ（新規追加）
 ENEMY_GRAVITY = 0.35      # 敵の重力（プレイヤーと同じ）
@@ -47,6 +47,10 @@ class Enemy:
         # 衝突関数を保持するための属性（後でセットされる）
         self.collision_functions = None
 
+        # 接地判定のキャッシュ（この位置なら接地しているか）
+        self.ground_cache_pos = None
+        self.ground_cache = False
+
     def detect_player(self, player_x, player_y):
         """プレイヤーを感知する"""
         distance = abs(self.x - player_x)
@@ -80,10 +84,15 @@ class Enemy:
         if self.collision_functions is None:
             return
             
-        move_y_with_pushback, move_x_with_pushback, is_block_at = self.collision_functions
+        move_y_with_pushback, move_x_with_pushback, is_block_at, touching_ground = self.collision_functions
         
-        # 現在地面にいるかチェック
-        _, _, on_ground, _ = move_y_with_pushback(self.x, self.y, 1, self.w, self.h)
+        # 現在地面にいるかチェック（前フレームから動いていなければキャッシュを使う）
+        if self.ground_cache_pos == (self.x, self.y):
+            on_ground = self.ground_cache
+        else:
+            on_ground = touching_ground(self.x, self.y, self.w, self.h)
+            self.ground_cache_pos = (self.x, self.y)
+            self.ground_cache = on_ground
         self.on_ground = on_ground
         
         # 状態更新（地面検出に基づく）
@@ -106,6 +115,10 @@ class Enemy:
         # Y軸移動（落下）
         new_y, hit_top, hit_bottom, remaining_dy = move_y_with_pushback(self.x, self.y, self.vy, self.w, self.h)
         self.y = new_y
+        if hit_bottom:
+            # 下にぶつかって止まった = この位置で接地している
+            self.ground_cache_pos = (self.x, self.y)
+            self.ground_cache = True
         
         # X軸移動（地面にいる場合）
         if self.state == ENEMY_STATE_GROUND:
@@ -1,457 +1,20 @@
 import pyxel
-import math
-import random
 from buttle_constants import (
     SCREEN_W, SCREEN_H, FPS,
-    TILE_SIZE, TILE_TO_TILETYPE, BLOCKING_TYPES, TILE_NONE,
-    PLAYER_RESPAWN_X, PLAYER_RESPAWN_Y, PLAYER_W, PLAYER_H,
-    GRAVITY, MAX_FALL, MOVE_SPEED, JUMP_POWER,
-    KEY_LEFT, KEY_RIGHT, KEY_JUMP, KEY_ATTACK, KEY_RESET, KEY_QUIT, KEY_RETRY,
+    TILE_SIZE, TILE_TO_TILETYPE, BLOCKING_TYPES,
+    KEY_RESET, KEY_QUIT, KEY_RETRY,
     KEY_LABELS, HUD_POS,
-    SWORD_COOLDOWN, SWORD_ACTIVE_FRAMES,
-    # HP関連の定数
-    PLAYER_MAX_HP, INVINCIBLE_FRAMES, KNOCKBACK_POWER, DAMAGE_FLASH_INTERVAL,
     # ゲーム状態関連の定数
     GAME_STATE_PLAYING, GAME_STATE_GAME_OVER,
     GAMEOVER_TILEMAP, GAMEOVER_IMAGE, GAMEOVER_TILE_X, GAMEOVER_TILE_Y,
     GAMEOVER_TILE_W, GAMEOVER_TILE_H,
-    # スコア関連
-    SCORE_ENEMY_DEFEAT,
     # ウェーブ表示関連
     WAVE_NOTIFICATION_COLOR,
-    # 銃関連
-    GUN_COOLDOWN
 )
 
-# 敵とスポーンコントローラをインポート
-from buttle_enemy import Enemy
-from buttle_spawn import SpawnController
-from buttle_gun import Gun
-
-from buttle_constants import (
-    # ... 既存のインポート ...
-    KEY_LEFT, KEY_RIGHT, KEY_JUMP, KEY_ATTACK, KEY_RESET, KEY_QUIT, KEY_RETRY,
-    KEY_GUN,  # 追加: 銃の発射キー
-    # ... 他のインポートは変更なし ...
-)
-
-def get_tile_type(x, y):
-    """ワールド座標(x,y)にあるタイルタイプを返す"""
-    tx = int(x) // TILE_SIZE
-    ty = int(y) // TILE_SIZE
-    u, v = pyxel.tilemaps[0].pget(tx, ty)  # タイルセット内のUV
-    return TILE_TO_TILETYPE.get((u, v), TILE_NONE)
-
-def is_block_at(x, y):
-    """その座標がブロックタイルか？（画面外でもFalse扱いにしておく）"""
-    if x < 0 or y < 0 or x >= pyxel.width or y >= pyxel.height:
-        return False
-    return get_tile_type(x, y) in BLOCKING_TYPES
-
-def rect_hits_block(x, y, w, h):
-    """矩形の四隅と辺の中間点にブロックがあるか（改良版AABB×タイル判定）"""
-    # 四隅に加えて、各辺の中間点もチェック
-    return (
-        is_block_at(x,       y) or       # 左上
-        is_block_at(x + w-1, y) or       # 右上
-        is_block_at(x,       y + h-1) or # 左下
-        is_block_at(x + w-1, y + h-1) or # 右下
-        is_block_at(x + w//2, y) or      # 上辺中央
-        is_block_at(x, y + h//2) or      # 左辺中央
-        is_block_at(x + w-1, y + h//2) or # 右辺中央
-        is_block_at(x + w//2, y + h-1)    # 下辺中央
-    )
-
-
-def move_y_with_pushback(x, y, dy, w, h):
-    """Y軸方向の連続衝突（1pxずつ進め、ぶつかったら直前で止める）"""
-    hit_top = hit_bottom = False
-    step = 1 if dy > 0 else -1
-    for _ in range(abs(int(dy))):
-        if rect_hits_block(x, y + step, w, h):
-            if step > 0:
-                hit_bottom = True
-            else:
-                hit_top = True
-            return y, hit_top, hit_bottom, 0  # 残りdyは0（進めない）
-        y += step
-    # 端数（小数）も処理：タイル衝突は1px粒度なので最後にまとめて足す
-    frac = dy - int(dy)
-    if frac != 0:
-        if rect_hits_block(x, y + frac, w, h):
-            if frac > 0:
-                hit_bottom = True
-            else:
-                hit_top = True
-            return y, hit_top, hit_bottom, 0
-        y += frac
-    return y, hit_top, hit_bottom, dy
-
-def move_x_with_pushback(x, y, dx, w, h):
-    """X軸方向の連続衝突（1pxずつ進め、ぶつかったら直前で止める）"""
-    hit_left = hit_right = False
-    step = 1 if dx > 0 else -1
-    for _ in range(abs(int(dx))):
-        if rect_hits_block(x + step, y, w, h):
-            if step > 0:
-                hit_right = True
-            else:
-                hit_left = True
-            return x, hit_left, hit_right, 0
-        x += step
-    # 端数（小数）
-    frac = dx - int(dx)
-    if frac != 0:
-        if rect_hits_block(x + frac, y, w, h):
-            if frac > 0:
-                hit_right = True
-            else:
-                hit_left = True
-            return x, hit_left, hit_right, 0
-        x += frac
-    return x, hit_left, hit_right, dx
-
-
-
-# ===== 剣クラス =====
-class Sword:
-    def __init__(self):
-        # 剣のスプライト情報
-        self.u = 16  # スプライトのX座標
-        self.v = 24  # スプライトのY座標
-        self.w = 16  # スプライトの幅
-        self.h = 8   # スプライトの高さ
-        
-        # 剣の状態
-        self.active = False
-        self.duration = 0
-        self.max_duration = SWORD_ACTIVE_FRAMES  # 攻撃の時間を設定
-
-        # 剣の位置
-        self.x = 0
-        self.y = 0
-        self.offset_x = 0
-        self.offset_y = 0
-        self.facing_right = True
-
-        # 当たり判定
-        self.hit_enemies = set()
-        self.check_points = []
-
-    def activate(self, player_x, player_y, player_w, player_h, facing_right):
-        """剣を前方に出す"""
-        self.active = True
-        self.duration = self.max_duration
-        self.facing_right = facing_right
-        self.hit_enemies.clear()
-
-        # プレイヤーの向きに応じて剣のオフセットを設定
-        if facing_right:
-            self.offset_x = player_w  # 左側
-        else:
-            self.offset_x = -self.w  # 右側
-
-        # Y方向のオフセットを設定
-        self.offset_y = (player_h - self.h) // 2
-
-        # 初期位置を更新
-        self.x = player_x + self.offset_x
-        self.y = player_y + self.offset_y
-
-        # 当たり判定用のチェックポイントを生成
-        self._generate_check_points()
-
-    def _generate_check_points(self):
-        """攻撃の当たり判定用チェックポイントを生成"""
-        self.check_points = []
-        
-        # 剣のサイズに基づいて複数のチェックポイントを生成
-        num_points = 5  # チェックポイントの数
-        
-        for i in range(num_points):
-            # X方向に均等に配置
-            x_ratio = i / (num_points - 1)
-            point_x = self.x + int(self.w * x_ratio)
-            
-            # Y方向は上下複数点
-            for y_offset in [0, self.h // 2, self.h - 1]:
-                point_y = self.y + y_offset
-                self.check_points.append((point_x, point_y))
-
-    def update(self, player_x, player_y, enemies):
-        """剣の更新"""
-        if not self.active:
-            return
-
-        self.duration -= 1
-        if self.duration <= 0:
-            self.active = False
-            return
-
-        # プレイヤーの位置に追従して剣の位置を更新
-        self.x = player_x + self.offset_x
-        self.y = player_y + self.offset_y
-
-        # チェックポイントも更新
-        self._generate_check_points()
-        
-        # 連続衝突検出方式の当たり判定
-        return self._check_continuous_hits(enemies)
-
-    def _check_continuous_hits(self, enemies):
-        """連続衝突検出方式の当たり判定"""
-        defeated_enemies = []
-        
-        for enemy in enemies:
-            if not enemy.active or enemy in self.hit_enemies:
-                continue
-            
-            # 連続的なチェックポイントで当たり判定
-            for point_x, point_y in self.check_points:
-                if (point_x >= enemy.x and point_x < enemy.x + enemy.w and
-                    point_y >= enemy.y and point_y < enemy.y + enemy.h):
-                    
-                    # 衝突検出
-                    was_defeated = enemy.hit()
-                    self.hit_enemies.add(enemy)
-                    
-                    if was_defeated:
-                        defeated_enemies.append(enemy)
-                    
-                    break  # この敵との判定は終了
-        
-        return defeated_enemies  # 撃破した敵のリストを返す
-
-    def draw(self):
-        if not self.active:
-            return
-        
-        w = self.w if self.facing_right else -self.w
-
-        # 剣の描画
-        pyxel.blt(self.x, self.y, 0, self.u, self.v, w, self.h, 0)
-        
-        # デバッグ: チェックポイントを表示（必要に応じてコメントアウト）
-        # for px, py in self.check_points:
-        #     pyxel.pset(px, py, 8)  # 赤色で表示
-
-# ===== プレイヤー =====
-class Player:
-    def __init__(self, x, y):
-        # 位置とサイズ
-        self.x, self.y = x, y
-        self.w, self.h = PLAYER_W, PLAYER_H
-        
-        # 物理パラメータ
-        self.vx = 0
-        self.vy = 0
-        self.move_speed = MOVE_SPEED
-        self.gravity = GRAVITY
-        self.max_fall = MAX_FALL
-        self.jump_power = JUMP_POWER
-        self.on_ground = False
-        self.facing_right = False
-        
-        # HP関連
-        self.max_hp = PLAYER_MAX_HP
-        self.hp = self.max_hp
-        self.invincible_timer = 0
-        self.knockback_vx = 0  # ノックバック用の速度
-        self.knockback_vy = 0
-        
-        # 攻撃関連
-        self.sword = Sword()
-        self.attack_cooldown = 0
-    
-            # 銃関連（追加）
-        self.gun = Gun()
-        self.gun_cooldown = 0
-
-        #　銃の発射
-        if self.gun_cooldown >0:
-            self.gun_cooldown -= 1
-
-    def take_damage(self, amount, source_x=None, source_y=None):
-        """ダメージを受ける統一インターフェース"""
-        # 無敵時間中はダメージを受けない
-        if self.invincible_timer > 0:
-            return False
-        
-        # HPを減らす
-        self.hp = max(0, self.hp - amount)
-        
-        # 無敵時間を設定
-        self.invincible_timer = INVINCIBLE_FRAMES
-        
-        # ノックバック計算（ダメージ源の座標が指定されている場合）
-        if source_x is not None and source_y is not None:
-            # プレイヤーの中心座標
-            player_center_x = self.x + self.w // 2
-            player_center_y = self.y + self.h // 2
-            
-            # ダメージ源からプレイヤーへの方向を計算
-            dx = player_center_x - source_x
-            dy = player_center_y - source_y
-            
-            # 距離を計算（0除算を防ぐ）
-            distance = max(1, (dx*dx + dy*dy)**0.5)
-            
-            # 正規化してノックバック力を適用
-            self.knockback_vx = (dx / distance) * KNOCKBACK_POWER
-            self.knockback_vy = (dy / distance) * KNOCKBACK_POWER * 0.5  # Y方向は少し弱める
-        
-        return True  # ダメージを受けた
-
-    def is_dead(self):
-        """プレイヤーが死亡しているか？"""
-        return self.hp <= 0
-
-    def update(self, enemies):
-        """プレイヤーの更新（スコアを返す）"""
-        score_gained = 0
-        
-        # 無敵時間の更新
-        if self.invincible_timer > 0:
-            self.invincible_timer -= 1
-        
-        # 入力（無敵時間中でも移動可能）
-        self.vx = 0
-        if pyxel.btn(KEY_LEFT):
-            self.vx -= self.move_speed
-            self.facing_right = False
-        if pyxel.btn(KEY_RIGHT):
-            self.vx += self.move_speed
-            self.facing_right = True
-
-        # ノックバック効果を速度に加算
-        self.vx += self.knockback_vx
-        self.vy += self.knockback_vy
-        
-        # ノックバック減衰
-        self.knockback_vx *= 0.8
-        self.knockback_vy *= 0.8
-
-        # ジャンプ
-        if self.on_ground and pyxel.btnp(KEY_JUMP):
-            self.vy = self.jump_power
-
-        # 攻撃
-        if self.attack_cooldown > 0:
-            self.attack_cooldown -= 1
-        if pyxel.btnp(KEY_ATTACK) and self.attack_cooldown == 0 and not self.sword.active:
-            self.sword.activate(self.x, self.y, self.w, self.h, self.facing_right)
-            self.attack_cooldown = SWORD_COOLDOWN
-
-        #銃の発射
-        if self.gun_cooldown > 0:
-            self.gun_cooldown -= 1
-        if pyxel.btn(KEY_GUN) and self.gun_cooldown == 0:
-            self.gun.activate(self.x, self.y, self.w, self.h, self.facing_right)
-            self.gun_cooldown = GUN_COOLDOWN
-
-        # 重力
-        self.vy = min(self.vy + self.gravity, self.max_fall)
-
-        # --- 連続衝突移動：Y→X の順で処理（段差で滑りやすい）---
-        new_y, hit_top, hit_bottom, _ = move_y_with_pushback(self.x, self.y, self.vy, self.w, self.h)
-        self.y = new_y
-        self.on_ground = hit_bottom
-        if hit_top and self.vy < 0:
-            self.vy = 0
-        if hit_bottom and self.vy > 0:
-            self.vy = 0
-
-        new_x, hit_left, hit_right, _ = move_x_with_pushback(self.x, self.y, self.vx, self.w, self.h)
-        self.x = new_x
-        # 横にぶつかったら横速度を0に
-        if (hit_left and self.vx < 0) or (hit_right and self.vx > 0):
-            self.vx = 0
-
-        # 画面境界チェック（画面外に出ないように）
-        # 左端の制限
-        if self.x < 0:
-            self.x = 0
-        # 右端の制限
-        if self.x > SCREEN_W - self.w:
-            self.x = SCREEN_W - self.w
-        # 上端の制限
-        if self.y < 0:
-            self.y = 0
-            self.vy = 0  # 上に移動する速度をリセット
-        
-        # 下の落下判定は残す（画面外に落ちた場合はダメージを与える方式に変更）
-        if self.y > SCREEN_H:
-            # 落下ダメージを与える（HPを減らす）
-            self.hp -= 5  # 5ダメージ（調整可能）
-            self.respawn()
-            if self.hp <= 0:
-                self.hp = 0  # HPが0未満にならないように
-        
-        # 剣の更新（撃破した敵のリストを取得）
-        defeated_enemies = self.sword.update(self.x, self.y, enemies)
-        if defeated_enemies:
-            score_gained += len(defeated_enemies) * SCORE_ENEMY_DEFEAT
-
-        # 銃の更新（追加）
-        gun_defeated_enemies = self.gun.update(self.x, self.y, enemies)
-        if gun_defeated_enemies:
-            score_gained += len(gun_defeated_enemies) * SCORE_ENEMY_DEFEAT
-
-        # 敵との接触判定（無敵時間でなければダメージ）
-        self.check_enemy_collision(enemies)
-        
-        return score_gained
-
-    def check_enemy_collision(self, enemies):
-        """敵との接触判定"""
-        for enemy in enemies:
-            if not enemy.active:
-                continue
-            
-            # AABB衝突判定
-            if (self.x < enemy.x + enemy.w and
-                self.x + self.w > enemy.x and
-                self.y < enemy.y + enemy.h and
-                self.y + self.h > enemy.y):
-                
-                # 敵の中心座標を計算
-                enemy_center_x, enemy_center_y = enemy.get_center()
-                
-                # ダメージを受ける（敵の中心座標を渡す）
-                self.take_damage(1, enemy_center_x, enemy_center_y)
-
-    def respawn(self):
-        """リスポーン処理"""
-        self.x, self.y = PLAYER_RESPAWN_X, PLAYER_RESPAWN_Y
-        self.vx = self.vy = 0
-        self.knockback_vx = self.knockback_vy = 0
-        self.on_ground = False
-        self.hp = self.max_hp  # HP回復
-        self.invincible_timer = 0
-
-    def draw(self):
-        # 無敵時間中は点滅表示
-        should_draw = True
-        if self.invincible_timer > 0:
-            should_draw = (self.invincible_timer // DAMAGE_FLASH_INTERVAL) % 2 == 0
-        
-        if should_draw:
-            # プレイヤーの描画
-            u, v, w, h = 0, 16, 16, 16
-            if self.facing_right:
-                pyxel.blt(self.x, self.y, 0, u, v, -w, h, 0)
-            else:
-                pyxel.blt(self.x, self.y, 0, u, v, w, h, 0)
-        
-        # 剣の描画
-        self.sword.draw()
-
-        #　銃の描画
-        self.gun.draw()
-        
-        # 攻撃クールダウン表示
-        if self.attack_cooldown > 0:
-            pyxel.text(self.x, self.y - 8, f"CD:{self.attack_cooldown}", 7)
+# ゲームの中身（プレイヤー・敵・スポーン）は World にまとめてある
+from buttle_world import World
+from tile_physics import load_tile_source
 
 # ===== アプリ本体 =====
 class App:
@@ -460,12 +23,12 @@ class App:
         # あなたのリソースファイル名に合わせて変更
         pyxel.load("my_resource.pyxres")
 
+        # 当たり判定はタイルマップから作ったキャッシュで行う
+        load_tile_source(TILE_TO_TILETYPE, BLOCKING_TYPES, TILE_SIZE)
+
         # ゲーム状態管理
         self.game_state = GAME_STATE_PLAYING
         
-        # スコア関連（新規追加）
-        self.score = 0
-        
         # ゲームの初期化
         self.init_game()
 
@@ -473,17 +36,8 @@ class App:
     
     def init_game(self):
         """ゲームの初期化（新規ゲーム・リトライ両方で使用）"""
-        # プレイヤーの初期化
-        self.player = Player(PLAYER_RESPAWN_X, PLAYER_RESPAWN_Y)
-        
-        # 敵リストを空で初期化
-        self.enemies = []
-        
-        # スポーンコントローラの初期化
-        self.spawn_controller = SpawnController()
-        
-        # スコアリセット
-        self.score = 0
+        # プレイヤー・敵・スポーン・スコアをまとめて作り直す
+        self.world = World()
         
         # ゲーム状態をプレイ中に設定
         self.game_state = GAME_STATE_PLAYING
@@ -500,33 +54,10 @@ class App:
 
     def update_playing(self):
         """プレイ中の更新処理"""
-        # スポーンコントローラの更新（新規追加）
-        spawn_enemy, enemy_type, wave_advanced, bonus_score = self.spawn_controller.update()
-        
-        # 敵をスポーンする必要がある場合（新規追加）
-        if spawn_enemy:
-            new_enemy = self.spawn_controller.create_enemy(enemy_type)
-            # 衝突関数を敵に渡す
-            new_enemy.collision_functions = (move_y_with_pushback, move_x_with_pushback, is_block_at)
-            self.enemies.append(new_enemy)
-        
-        # ウェーブクリアボーナスの加算
-        if wave_advanced:
-            self.score += bonus_score
-        
-        # 敵の更新
-        for enemy in self.enemies:
-            enemy.update(self.player.x, self.player.y)
-        
-        # 非アクティブな敵を削除
-        self.enemies = [enemy for enemy in self.enemies if enemy.active]
-        
-        # プレイヤーの更新（得点スコアを取得）
-        score_gained = self.player.update(self.enemies)
-        self.score += score_gained
+        self.world.step()
         
         # プレイヤーが死亡したかチェック
-        if self.player.is_dead():
+        if self.world.game_over:
             self.game_state = GAME_STATE_GAME_OVER
 
         # Rキーでリセット機能
@@ -553,11 +84,11 @@ class App:
         pyxel.bltm(0, 0, 0, 0, 0, 256, 256)
         
         # 敵の描画
-        for enemy in self.enemies:
+        for enemy in self.world.enemies:
             enemy.draw()
             
         # プレイヤーの描画
-        self.player.draw()
+        self.world.player.draw()
         
         # HUD描画
         self.draw_help()
@@ -565,20 +96,20 @@ class App:
         self.draw_score()
         self.draw_wave()
         # ウェーブ通知描画
-        if self.spawn_controller.should_show_notification():
+        if self.world.spawn_controller.should_show_notification():
             self.draw_wave_notification()
 
     def draw_wave(self):
         """ウェーブ表示"""
         x, y = HUD_POS["WAVE"]
-        wave_info = self.spawn_controller.get_wave_info()
+        wave_info = self.world.spawn_controller.get_wave_info()
         
         # ウェーブ番号の表示
         pyxel.text(x, y, f"WAVE: {wave_info['wave']}/{wave_info['max_wave']}", 7)
     
     def draw_wave_notification(self):
         """ウェーブ開始通知"""
-        wave_info = self.spawn_controller.get_wave_info()
+        wave_info = self.world.spawn_controller.get_wave_info()
         
         # 画面中央に大きく表示
         wave_text = f"WAVE {wave_info['wave']}"
@@ -623,7 +154,7 @@ class App:
         
         # テキストを中央揃えで表示
         game_over_text = "GAME OVER"
-        score_text = f"Score: {self.score}"
+        score_text = f"Score: {self.world.score}"
         retry_text = f"Press {KEY_LABELS['RETRY']} to Retry"
         quit_text = f"Press {KEY_LABELS['QUIT']} to Quit"
         
@@ -649,7 +180,7 @@ class App:
         x, y = HUD_POS["HP"]
         
         # HPテキスト
-        pyxel.text(x, y, f"HP: {self.player.hp}/{self.player.max_hp}", 7)
+        pyxel.text(x, y, f"HP: {self.world.player.hp}/{self.world.player.max_hp}", 7)
         
         # HPバー背景（灰色）
         bar_x = x + 40
@@ -658,19 +189,19 @@ class App:
         pyxel.rect(bar_x, y, bar_width, bar_height, 5)  # 灰色
         
         # HPバー（現在HP分だけ緑色）
-        if self.player.hp > 0:
-            current_bar_width = int((self.player.hp / self.player.max_hp) * bar_width)
-            color = 11 if self.player.hp > 2 else 8  # HP少ないと赤色
+        if self.world.player.hp > 0:
+            current_bar_width = int((self.world.player.hp / self.world.player.max_hp) * bar_width)
+            color = 11 if self.world.player.hp > 2 else 8  # HP少ないと赤色
             pyxel.rect(bar_x, y, current_bar_width, bar_height, color)
         
         # 無敵時間表示（デバッグ用）
-        if self.player.invincible_timer > 0:
-            pyxel.text(x + 110, y, f"Inv:{self.player.invincible_timer}", 10)
+        if self.world.player.invincible_timer > 0:
+            pyxel.text(x + 110, y, f"Inv:{self.world.player.invincible_timer}", 10)
 
     def draw_score(self):
         """スコア表示"""
         x, y = HUD_POS["SCORE"]
-        pyxel.text(x, y, f"Score: {self.score}", 7)
+        pyxel.text(x, y, f"Score: {self.world.score}", 7)
 
 if __name__ == "__main__":
     App()
\ No newline at end of file
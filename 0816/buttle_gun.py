@@ -1,6 +1,6 @@
 # buttle_gun.py
 import pyxel
-from buttle_constants import TILE_SIZE
+from buttle_constants import TILE_SIZE, SCREEN_W
 
 class Bullet:
     def __init__(self, x, y, direction):
@@ -28,7 +28,7 @@ class Bullet:
         self.x += self.speed * self.direction
         
         # 画面外に出たら非アクティブに
-        if self.x < -self.w or self.x > pyxel.width:
+        if self.x < -self.w or self.x > SCREEN_W:
             self.active = False
     
     def draw(self):
@@ -106,7 +106,7 @@ class Gun:
         new_bullet = Bullet(bullet_x, self.y, direction)
         self.bullets.append(new_bullet)
     
-    def update(self, player_x, player_y, enemies=None):
+    def update(self, player_x, player_y, enemy_grid=None):
         """銃の更新処理"""
         # クールダウンの更新
         if self.cooldown > 0:
@@ -123,22 +123,22 @@ class Gun:
         # 非アクティブな弾を削除
         self.bullets = [bullet for bullet in self.bullets if bullet.active]
         
-        # 敵との当たり判定（敵リストが渡された場合）
+        # 敵との当たり判定（敵グリッドが渡された場合）
         defeated_enemies = []
-        if enemies:
-            defeated_enemies = self._check_bullet_hits(enemies)
+        if enemy_grid:
+            defeated_enemies = self._check_bullet_hits(enemy_grid)
         
         return defeated_enemies
     
-    def _check_bullet_hits(self, enemies):
-        """弾と敵の当たり判定"""
+    def _check_bullet_hits(self, enemy_grid):
+        """弾と敵の当たり判定（弾の近くのマスにいる敵だけを調べる）"""
         defeated_enemies = []
         
         for bullet in self.bullets:
             if not bullet.active:
                 continue
                 
-            for enemy in enemies:
+            for enemy in enemy_grid.query(bullet.x, bullet.y, bullet.w, bullet.h):
                 if not enemy.active:
                     continue
                 
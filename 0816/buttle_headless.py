@@ -0,0 +1,199 @@
+"""buttle_game をウィンドウ無しで回す負荷試験。
+
+    python buttle_headless.py --build-grid          # 最初に1回（ウィンドウが一瞬開く）
+    python buttle_headless.py --sessions 200 --frames 7200
+    python buttle_headless.py --script gunner --workers 8 --seed 1
+
+--build-grid で my_resource.pyxres のタイルマップ0から固体マップを作り
+GRID_FILE に保存する。以降はそれを読んで World を直接 step() するので
+ウィンドウも pyxel.load もいらない。
+
+各セッションはスクリプトのプレイヤーで最大 --frames フレーム遊び、
+死亡したらそこで終わる。セッションはプロセスプールで並列に回し、
+World.step() 1回の時間のパーセンタイルと生存統計を表示する。
+"""
+import argparse
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from buttle_constants import (
+    FPS, TILE_SIZE, TILE_TO_TILETYPE, BLOCKING_TYPES,
+    KEY_LEFT, KEY_RIGHT, KEY_JUMP, KEY_ATTACK, KEY_GUN,
+)
+from buttle_world import World
+from tile_physics import SolidGrid, set_tile_source
+
+GRID_FILE = "solid_grid.bin"
+
+PERCENTILES = (50, 90, 99)
+
+
+class ScriptedControls:
+    """script(frame, world, rng) が返すキーの集合を押しているものとして扱う（None なら前のフレームのまま）
+
+    btn は押している間ずっと、btnp は押した最初のフレームだけ True（pyxel と同じ）。
+    """
+    def __init__(self, script, rng):
+        self.script = script
+        self.rng = rng
+        self.held = set()
+        self.pressed = set()
+
+    def next_frame(self, frame, world):
+        keys = self.script(frame, world, self.rng)
+        held = self.held if keys is None else set(keys)
+        self.pressed = held - self.held
+        self.held = held
+
+    def btn(self, key):
+        return key in self.held
+
+    def btnp(self, key, hold=None, repeat=None):
+        return key in self.pressed
+
+
+# ----- スクリプトのプレイヤー -----
+def idle_script(frame, world, rng):
+    # 何もしない（敵の強さだけを見る）
+    return ()
+
+
+def sway_script(frame, world, rng):
+    # 左右に往復しながら剣を振り、ときどきジャンプ
+    keys = [KEY_LEFT if (frame // 120) % 2 else KEY_RIGHT]
+    if frame % 8 < 4:
+        keys.append(KEY_ATTACK)
+    if frame % 90 == 0:
+        keys.append(KEY_JUMP)
+    return keys
+
+
+def gunner_script(frame, world, rng):
+    # 一番近い敵の方を向いて撃つ。近すぎたら剣
+    player = world.player
+    nearest = None
+    best = None
+    for enemy in world.enemies:
+        d = abs(enemy.x - player.x) + abs(enemy.y - player.y)
+        if best is None or d < best:
+            nearest, best = enemy, d
+    if nearest is None:
+        return ()
+    keys = [KEY_RIGHT if nearest.x > player.x else KEY_LEFT, KEY_GUN]
+    if best < 24 and frame % 8 < 4:
+        keys.append(KEY_ATTACK)
+    if nearest.y < player.y - 16 and frame % 30 == 0:
+        keys.append(KEY_JUMP)
+    return keys
+
+
+def random_script(frame, world, rng):
+    # 10フレームごとにランダムなキーの組み合わせ（それ以外は None = 押しっぱなし）
+    if frame % 10:
+        return None
+    return [k for k in (KEY_LEFT, KEY_RIGHT, KEY_JUMP, KEY_ATTACK, KEY_GUN)
+            if rng.random() < 0.3]
+
+
+SCRIPTS = {
+    "idle": idle_script,
+    "sway": sway_script,
+    "gunner": gunner_script,
+    "random": random_script,
+}
+
+
+def build_grid(path=GRID_FILE):
+    """pyxel のタイルマップから固体マップを作って保存する（ウィンドウが必要）"""
+    import pyxel
+    from buttle_constants import SCREEN_W, SCREEN_H
+    from tile_physics import load_tile_source
+    pyxel.init(SCREEN_W, SCREEN_H)
+    pyxel.load("my_resource.pyxres")
+    grid = load_tile_source(TILE_TO_TILETYPE, BLOCKING_TYPES, TILE_SIZE)
+    grid.save(path)
+    print(f"saved {path} ({grid.cols}x{grid.rows} tiles)")
+
+
+def _init_worker(grid_path):
+    # ワーカープロセスごとに固体マップを読む
+    set_tile_source(SolidGrid.load(grid_path))
+
+
+def run_session(args):
+    """1セッション回して結果の dict を返す（プロセスプールから呼ばれる）"""
+    script_name, seed, max_frames = args
+    random.seed(seed)  # Enemy は random モジュールを使う
+    controls = ScriptedControls(SCRIPTS[script_name], random.Random(seed))
+    world = World(controls, seed=seed)
+    clock = time.perf_counter
+    times = []
+    while world.frame < max_frames and not world.game_over:
+        controls.next_frame(world.frame, world)
+        start = clock()
+        world.step()
+        times.append(clock() - start)
+    return {
+        "seed": seed,
+        "frames": world.frame,
+        "died": world.game_over,
+        "score": world.score,
+        "wave": world.spawn_controller.wave,
+        "times": times,
+    }
+
+
+def percentile(sorted_values, p):
+    if not sorted_values:
+        return 0.0
+    k = max(0, min(len(sorted_values) - 1, round(p / 100 * len(sorted_values)) - 1))
+    return sorted_values[k]
+
+
+def print_report(script_name, results, max_frames):
+    times = sorted(t for r in results for t in r["times"])
+    deaths = [r for r in results if r["died"]]
+    survived = sorted(r["frames"] for r in results)
+    n = len(results)
+    print(f"[{script_name}] sessions={n} frames<={max_frames} total_steps={len(times)}")
+    cols = [percentile(times, p) for p in PERCENTILES] + [times[-1] if times else 0.0]
+    print("  step usec  " + "  ".join(f"p{p}={v * 1e6:.1f}" for p, v in zip(PERCENTILES, cols))
+          + f"  max={cols[-1] * 1e6:.1f}")
+    budget = 1 / FPS
+    over = sum(1 for t in times if t > budget)
+    print(f"  over {budget * 1e3:.1f}ms budget: {over}")
+    print(f"  deaths={len(deaths)}/{n} ({len(deaths) / n:.0%})  "
+          f"survival sec: median={percentile(survived, 50) / FPS:.1f} "
+          f"p10={percentile(survived, 10) / FPS:.1f}")
+    print(f"  score: mean={sum(r['score'] for r in results) / n:.0f} "
+          f"max={max(r['score'] for r in results)}  "
+          f"wave: mean={sum(r['wave'] for r in results) / n:.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="buttle_game headless load test")
+    parser.add_argument("--build-grid", action="store_true", help="固体マップを作って終わる")
+    parser.add_argument("--grid", default=GRID_FILE)
+    parser.add_argument("--sessions", type=int, default=64)
+    parser.add_argument("--frames", type=int, default=FPS * 120)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--script", choices=list(SCRIPTS), help="省略時は全スクリプト")
+    parser.add_argument("--workers", type=int, default=None, help="省略時は CPU 数")
+    args = parser.parse_args()
+
+    if args.build_grid:
+        build_grid(args.grid)
+        return
+
+    scripts = [args.script] if args.script else list(SCRIPTS)
+    with ProcessPoolExecutor(max_workers=args.workers, initializer=_init_worker,
+                             initargs=(args.grid,)) as pool:
+        for script_name in scripts:
+            jobs = [(script_name, args.seed + i, args.frames) for i in range(args.sessions)]
+            results = list(pool.map(run_session, jobs, chunksize=max(1, args.sessions // 32)))
+            print_report(script_name, results, args.frames)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,362 @@
+# buttle_player.py
+import pyxel
+from buttle_constants import (
+    SCREEN_W, SCREEN_H,
+    PLAYER_RESPAWN_X, PLAYER_RESPAWN_Y, PLAYER_W, PLAYER_H,
+    GRAVITY, MAX_FALL, MOVE_SPEED, JUMP_POWER,
+    KEY_LEFT, KEY_RIGHT, KEY_JUMP, KEY_ATTACK, KEY_GUN,
+    SWORD_COOLDOWN, SWORD_ACTIVE_FRAMES,
+    # HP関連の定数
+    PLAYER_MAX_HP, INVINCIBLE_FRAMES, KNOCKBACK_POWER, DAMAGE_FLASH_INTERVAL,
+    # スコア関連
+    SCORE_ENEMY_DEFEAT,
+    # 銃関連
+    GUN_COOLDOWN,
+)
+from buttle_gun import Gun
+from tile_physics import move_y_with_pushback, move_x_with_pushback
+
+# ===== 剣クラス =====
+class Sword:
+    def __init__(self):
+        # 剣のスプライト情報
+        self.u = 16  # スプライトのX座標
+        self.v = 24  # スプライトのY座標
+        self.w = 16  # スプライトの幅
+        self.h = 8   # スプライトの高さ
+        
+        # 剣の状態
+        self.active = False
+        self.duration = 0
+        self.max_duration = SWORD_ACTIVE_FRAMES  # 攻撃の時間を設定
+
+        # 剣の位置
+        self.x = 0
+        self.y = 0
+        self.offset_x = 0
+        self.offset_y = 0
+        self.facing_right = True
+
+        # 当たり判定
+        self.hit_enemies = set()
+        self.check_points = []
+
+    def activate(self, player_x, player_y, player_w, player_h, facing_right):
+        """剣を前方に出す"""
+        self.active = True
+        self.duration = self.max_duration
+        self.facing_right = facing_right
+        self.hit_enemies.clear()
+
+        # プレイヤーの向きに応じて剣のオフセットを設定
+        if facing_right:
+            self.offset_x = player_w  # 左側
+        else:
+            self.offset_x = -self.w  # 右側
+
+        # Y方向のオフセットを設定
+        self.offset_y = (player_h - self.h) // 2
+
+        # 初期位置を更新
+        self.x = player_x + self.offset_x
+        self.y = player_y + self.offset_y
+
+        # 当たり判定用のチェックポイントを生成
+        self._generate_check_points()
+
+    def _generate_check_points(self):
+        """攻撃の当たり判定用チェックポイントを生成"""
+        self.check_points = []
+        
+        # 剣のサイズに基づいて複数のチェックポイントを生成
+        num_points = 5  # チェックポイントの数
+        
+        for i in range(num_points):
+            # X方向に均等に配置
+            x_ratio = i / (num_points - 1)
+            point_x = self.x + int(self.w * x_ratio)
+            
+            # Y方向は上下複数点
+            for y_offset in [0, self.h // 2, self.h - 1]:
+                point_y = self.y + y_offset
+                self.check_points.append((point_x, point_y))
+
+    def update(self, player_x, player_y, enemy_grid):
+        """剣の更新"""
+        if not self.active:
+            return
+
+        self.duration -= 1
+        if self.duration <= 0:
+            self.active = False
+            return
+
+        # プレイヤーの位置に追従して剣の位置を更新
+        self.x = player_x + self.offset_x
+        self.y = player_y + self.offset_y
+
+        # チェックポイントも更新
+        self._generate_check_points()
+        
+        # 連続衝突検出方式の当たり判定
+        return self._check_continuous_hits(enemy_grid)
+
+    def _check_continuous_hits(self, enemy_grid):
+        """連続衝突検出方式の当たり判定"""
+        defeated_enemies = []
+        
+        # チェックポイント全体を囲む矩形の近くにいる敵だけを調べる
+        for enemy in enemy_grid.query(self.x, self.y, self.w + 1, self.h):
+            if not enemy.active or enemy in self.hit_enemies:
+                continue
+            
+            # 連続的なチェックポイントで当たり判定
+            for point_x, point_y in self.check_points:
+                if (point_x >= enemy.x and point_x < enemy.x + enemy.w and
+                    point_y >= enemy.y and point_y < enemy.y + enemy.h):
+                    
+                    # 衝突検出
+                    was_defeated = enemy.hit()
+                    self.hit_enemies.add(enemy)
+                    
+                    if was_defeated:
+                        defeated_enemies.append(enemy)
+                    
+                    break  # この敵との判定は終了
+        
+        return defeated_enemies  # 撃破した敵のリストを返す
+
+    def draw(self):
+        if not self.active:
+            return
+        
+        w = self.w if self.facing_right else -self.w
+
+        # 剣の描画
+        pyxel.blt(self.x, self.y, 0, self.u, self.v, w, self.h, 0)
+        
+        # デバッグ: チェックポイントを表示（必要に応じてコメントアウト）
+        # for px, py in self.check_points:
+        #     pyxel.pset(px, py, 8)  # 赤色で表示
+
+# ===== プレイヤー =====
+class Player:
+    def __init__(self, x, y, controls=pyxel):
+        # 入力元（btn / btnp を持つもの。既定は pyxel、シミュレーションではスクリプト）
+        self.controls = controls
+
+        # 位置とサイズ
+        self.x, self.y = x, y
+        self.w, self.h = PLAYER_W, PLAYER_H
+        
+        # 物理パラメータ
+        self.vx = 0
+        self.vy = 0
+        self.move_speed = MOVE_SPEED
+        self.gravity = GRAVITY
+        self.max_fall = MAX_FALL
+        self.jump_power = JUMP_POWER
+        self.on_ground = False
+        self.facing_right = False
+        
+        # HP関連
+        self.max_hp = PLAYER_MAX_HP
+        self.hp = self.max_hp
+        self.invincible_timer = 0
+        self.knockback_vx = 0  # ノックバック用の速度
+        self.knockback_vy = 0
+        
+        # 攻撃関連
+        self.sword = Sword()
+        self.attack_cooldown = 0
+    
+            # 銃関連（追加）
+        self.gun = Gun()
+        self.gun_cooldown = 0
+
+        #　銃の発射
+        if self.gun_cooldown >0:
+            self.gun_cooldown -= 1
+
+    def take_damage(self, amount, source_x=None, source_y=None):
+        """ダメージを受ける統一インターフェース"""
+        # 無敵時間中はダメージを受けない
+        if self.invincible_timer > 0:
+            return False
+        
+        # HPを減らす
+        self.hp = max(0, self.hp - amount)
+        
+        # 無敵時間を設定
+        self.invincible_timer = INVINCIBLE_FRAMES
+        
+        # ノックバック計算（ダメージ源の座標が指定されている場合）
+        if source_x is not None and source_y is not None:
+            # プレイヤーの中心座標
+            player_center_x = self.x + self.w // 2
+            player_center_y = self.y + self.h // 2
+            
+            # ダメージ源からプレイヤーへの方向を計算
+            dx = player_center_x - source_x
+            dy = player_center_y - source_y
+            
+            # 距離を計算（0除算を防ぐ）
+            distance = max(1, (dx*dx + dy*dy)**0.5)
+            
+            # 正規化してノックバック力を適用
+            self.knockback_vx = (dx / distance) * KNOCKBACK_POWER
+            self.knockback_vy = (dy / distance) * KNOCKBACK_POWER * 0.5  # Y方向は少し弱める
+        
+        return True  # ダメージを受けた
+
+    def is_dead(self):
+        """プレイヤーが死亡しているか？"""
+        return self.hp <= 0
+
+    def update(self, enemy_grid):
+        """プレイヤーの更新（スコアを返す）"""
+        score_gained = 0
+        
+        # 無敵時間の更新
+        if self.invincible_timer > 0:
+            self.invincible_timer -= 1
+        
+        # 入力（無敵時間中でも移動可能）
+        controls = self.controls
+        self.vx = 0
+        if controls.btn(KEY_LEFT):
+            self.vx -= self.move_speed
+            self.facing_right = False
+        if controls.btn(KEY_RIGHT):
+            self.vx += self.move_speed
+            self.facing_right = True
+
+        # ノックバック効果を速度に加算
+        self.vx += self.knockback_vx
+        self.vy += self.knockback_vy
+        
+        # ノックバック減衰
+        self.knockback_vx *= 0.8
+        self.knockback_vy *= 0.8
+
+        # ジャンプ
+        if self.on_ground and controls.btnp(KEY_JUMP):
+            self.vy = self.jump_power
+
+        # 攻撃
+        if self.attack_cooldown > 0:
+            self.attack_cooldown -= 1
+        if controls.btnp(KEY_ATTACK) and self.attack_cooldown == 0 and not self.sword.active:
+            self.sword.activate(self.x, self.y, self.w, self.h, self.facing_right)
+            self.attack_cooldown = SWORD_COOLDOWN
+
+        #銃の発射
+        if self.gun_cooldown > 0:
+            self.gun_cooldown -= 1
+        if controls.btn(KEY_GUN) and self.gun_cooldown == 0:
+            self.gun.activate(self.x, self.y, self.w, self.h, self.facing_right)
+            self.gun_cooldown = GUN_COOLDOWN
+
+        # 重力
+        self.vy = min(self.vy + self.gravity, self.max_fall)
+
+        # --- 連続衝突移動：Y→X の順で処理（段差で滑りやすい）---
+        new_y, hit_top, hit_bottom, _ = move_y_with_pushback(self.x, self.y, self.vy, self.w, self.h)
+        self.y = new_y
+        self.on_ground = hit_bottom
+        if hit_top and self.vy < 0:
+            self.vy = 0
+        if hit_bottom and self.vy > 0:
+            self.vy = 0
+
+        new_x, hit_left, hit_right, _ = move_x_with_pushback(self.x, self.y, self.vx, self.w, self.h)
+        self.x = new_x
+        # 横にぶつかったら横速度を0に
+        if (hit_left and self.vx < 0) or (hit_right and self.vx > 0):
+            self.vx = 0
+
+        # 画面境界チェック（画面外に出ないように）
+        # 左端の制限
+        if self.x < 0:
+            self.x = 0
+        # 右端の制限
+        if self.x > SCREEN_W - self.w:
+            self.x = SCREEN_W - self.w
+        # 上端の制限
+        if self.y < 0:
+            self.y = 0
+            self.vy = 0  # 上に移動する速度をリセット
+        
+        # 下の落下判定は残す（画面外に落ちた場合はダメージを与える方式に変更）
+        if self.y > SCREEN_H:
+            # 落下ダメージを与える（HPを減らす）
+            self.hp -= 5  # 5ダメージ（調整可能）
+            self.respawn()
+            if self.hp <= 0:
+                self.hp = 0  # HPが0未満にならないように
+        
+        # 剣の更新（撃破した敵のリストを取得）
+        defeated_enemies = self.sword.update(self.x, self.y, enemy_grid)
+        if defeated_enemies:
+            score_gained += len(defeated_enemies) * SCORE_ENEMY_DEFEAT
+
+        # 銃の更新（追加）
+        gun_defeated_enemies = self.gun.update(self.x, self.y, enemy_grid)
+        if gun_defeated_enemies:
+            score_gained += len(gun_defeated_enemies) * SCORE_ENEMY_DEFEAT
+
+        # 敵との接触判定（無敵時間でなければダメージ）
+        self.check_enemy_collision(enemy_grid)
+        
+        return score_gained
+
+    def check_enemy_collision(self, enemy_grid):
+        """敵との接触判定"""
+        for enemy in enemy_grid.query(self.x, self.y, self.w, self.h):
+            if not enemy.active:
+                continue
+            
+            # AABB衝突判定
+            if (self.x < enemy.x + enemy.w and
+                self.x + self.w > enemy.x and
+                self.y < enemy.y + enemy.h and
+                self.y + self.h > enemy.y):
+                
+                # 敵の中心座標を計算
+                enemy_center_x, enemy_center_y = enemy.get_center()
+                
+                # ダメージを受ける（敵の中心座標を渡す）
+                self.take_damage(1, enemy_center_x, enemy_center_y)
+
+    def respawn(self):
+        """リスポーン処理"""
+        self.x, self.y = PLAYER_RESPAWN_X, PLAYER_RESPAWN_Y
+        self.vx = self.vy = 0
+        self.knockback_vx = self.knockback_vy = 0
+        self.on_ground = False
+        self.hp = self.max_hp  # HP回復
+        self.invincible_timer = 0
+
+    def draw(self):
+        # 無敵時間中は点滅表示
+        should_draw = True
+        if self.invincible_timer > 0:
+            should_draw = (self.invincible_timer // DAMAGE_FLASH_INTERVAL) % 2 == 0
+        
+        if should_draw:
+            # プレイヤーの描画
+            u, v, w, h = 0, 16, 16, 16
+            if self.facing_right:
+                pyxel.blt(self.x, self.y, 0, u, v, -w, h, 0)
+            else:
+                pyxel.blt(self.x, self.y, 0, u, v, w, h, 0)
+        
+        # 剣の描画
+        self.sword.draw()
+
+        #　銃の描画
+        self.gun.draw()
+        
+        # 攻撃クールダウン表示
+        if self.attack_cooldown > 0:
+            pyxel.text(self.x, self.y - 8, f"CD:{self.attack_cooldown}", 7)
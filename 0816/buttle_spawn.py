@@ -18,9 +18,88 @@ from buttle_constants import (
 )
 
 
+class AliasTable:
+    """重み付き抽選を O(1) で行うエイリアステーブル（Vose の方法）"""
+    def __init__(self, weights):
+        # weights: {値: 重み}。重みの合計は正であること
+        self.values = list(weights.keys())
+        n = len(self.values)
+        total = sum(weights.values())
+        scaled = [w * n / total for w in weights.values()]
+        self.prob = [0.0] * n
+        self.alias = list(range(n))
+
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            s = small.pop()
+            l = large.pop()
+            self.prob[s] = scaled[s]
+            self.alias[s] = l
+            scaled[l] -= 1.0 - scaled[s]
+            if scaled[l] < 1.0:
+                small.append(l)
+            else:
+                large.append(l)
+        # 残りは誤差を除いて確率1
+        for i in small + large:
+            self.prob[i] = 1.0
+
+    def sample(self, rng=random):
+        i = rng.randrange(len(self.values))
+        if rng.random() < self.prob[i]:
+            return self.values[i]
+        return self.values[self.alias[i]]
+
+
+def get_spawn_chances(wave):
+    """そのウェーブでのスポーン確率を取得（そのウェーブの指定がなければ直前のウェーブの値）"""
+    chances = {}
+    for enemy_type, wave_chances in ENEMY_SPAWN_CHANCES.items():
+        chance = 0
+        for w in sorted(wave_chances):
+            if w > wave:
+                break
+            chance = wave_chances[w]
+        chances[enemy_type] = chance
+    return chances
+
+
+def build_spawn_tables(max_wave=WAVE_MAX):
+    """ウェーブ1..max_wave のスポーン確率を先に計算してエイリアステーブルにする
+
+    戻り値はウェーブ番号で引くリスト（0番は未使用）。要素は (確率の辞書, AliasTable or None)。
+    確率が同じウェーブは同じテーブルを共有する。
+    """
+    tables = [None]
+    prev_chances = None
+    for wave in range(1, max_wave + 1):
+        chances = get_spawn_chances(wave)
+        if chances != prev_chances:
+            weights = {t: c for t, c in chances.items() if c > 0}
+            table = AliasTable(weights) if weights else None
+            prev_chances = chances
+        tables.append((chances, table))
+    return tables
+
+
+# 起動時に1回だけ作る
+SPAWN_TABLES = build_spawn_tables()
+
+
 class SpawnController:
-    """敵のスポーンと進行を管理するクラス"""
-    def __init__(self):
+    """敵のスポーンと進行を管理するクラス
+
+    seed を渡すと専用の乱数（random.Random）を使うので、同じ seed なら同じ出現順になる。
+    max_wave / tables はシミュレーション（spawn_sim.py）でウェーブ数を増やすとき用。
+    """
+    def __init__(self, seed=None, max_wave=WAVE_MAX, tables=None):
+        # 乱数
+        self.rng = random.Random(seed) if seed is not None else random
+        self.max_wave = max_wave
+        self.tables = tables if tables is not None else (
+            SPAWN_TABLES if max_wave <= WAVE_MAX else build_spawn_tables(max_wave))
+
         # スポーン関連
         self.spawn_timer = SPAWN_INITIAL_DELAY  # 初期待機時間を設定
         self.current_spawn_interval = SPAWN_BASE_INTERVAL
@@ -34,8 +113,8 @@ class SpawnController:
         self.enemy_speed_multiplier = 1.0
         self.enemy_hp_multiplier = 1
         
-        # スポーン確率テーブル（現在のウェーブに合わせて更新）
-        self.spawn_chances = self._get_spawn_chances(self.wave)
+        # スポーン確率テーブル（現在のウェーブに合わせて差し替え）
+        self.spawn_chances, self.spawn_table = self.tables[self.wave]
     
     def update(self):
         """スポーンコントローラーの更新"""
@@ -71,7 +150,7 @@ class SpawnController:
     
     def _advance_wave(self):
         """次のウェーブに進む"""
-        if self.wave < WAVE_MAX:
+        if self.wave < self.max_wave:
             self.wave += 1
             self.wave_timer = WAVE_DURATION
             self.wave_notification_timer = WAVE_NOTIFICATION_DURATION
@@ -88,52 +167,22 @@ class SpawnController:
             # 敵のHPを増加（3ウェーブごと）
             self.enemy_hp_multiplier = 1 + ((self.wave - 1) // 3) * ENEMY_HP_INCREASE
             
-            # スポーン確率テーブルを更新
-            self.spawn_chances = self._get_spawn_chances(self.wave)
+            # スポーン確率テーブルを差し替え
+            self.spawn_chances, self.spawn_table = self.tables[self.wave]
             
             return True, WAVE_CLEAR_BONUS  # ウェーブ更新とボーナススコアを返す
         
         return False, 0  # 最大ウェーブに達している場合
     
-    def _get_spawn_chances(self, wave):
-        """現在のウェーブに基づいたスポーン確率を取得"""
-        chances = {}
-        
-        # 各敵タイプについて、現在のウェーブでの出現確率を計算
-        for enemy_type, wave_chances in ENEMY_SPAWN_CHANCES.items():
-            # 該当するウェーブの確率を探す（そのウェーブがなければ次に低いウェーブの確率を使用）
-            applicable_waves = [w for w in wave_chances.keys() if w <= wave]
-            if applicable_waves:
-                max_applicable_wave = max(applicable_waves)
-                chances[enemy_type] = wave_chances[max_applicable_wave]
-            else:
-                chances[enemy_type] = 0
-        
-        return chances
-    
     def _get_random_enemy_type(self):
-        """確率に基づいて敵のタイプをランダムに選択"""
-        # 確率の合計を計算
-        total_chance = sum(self.spawn_chances.values())
-        
-        if total_chance <= 0:
+        """確率に基づいて敵のタイプをランダムに選択（エイリアステーブルで O(1)）"""
+        if self.spawn_table is None:
             return "normal"  # デフォルトタイプ
-        
-        # ランダム値を生成
-        r = random.randint(1, total_chance)
-        
-        # 累積確率で敵タイプを選択
-        cumulative = 0
-        for enemy_type, chance in self.spawn_chances.items():
-            cumulative += chance
-            if r <= cumulative:
-                return enemy_type
-        
-        return "normal"  # デフォルトに戻る
+        return self.spawn_table.sample(self.rng)
     
     def get_spawn_position(self):
         """スポーン位置をランダムに選択"""
-        return random.choice(SPAWN_POSITIONS)
+        return self.rng.choice(SPAWN_POSITIONS)
     
     def create_enemy(self, enemy_type="normal"):
         """敵を生成（タイプに応じた敵クラスのインスタンスを返す）"""
@@ -160,7 +209,7 @@ class SpawnController:
         """現在のウェーブ情報を取得"""
         return {
             "wave": self.wave,
-            "max_wave": WAVE_MAX,
+            "max_wave": self.max_wave,
             "enemies_stronger": self.enemy_speed_multiplier > 1.0 or self.enemy_hp_multiplier > 1,
             "spawn_interval": self.current_spawn_interval,
         }
\ No newline at end of file
@@ -0,0 +1,62 @@
+# buttle_world.py
+import pyxel
+from buttle_constants import PLAYER_RESPAWN_X, PLAYER_RESPAWN_Y
+from buttle_player import Player
+from buttle_spawn import SpawnController
+from enemy_grid import EnemyGrid
+from tile_physics import (
+    is_block_at, move_y_with_pushback, move_x_with_pushback, touching_ground,
+)
+
+
+class World:
+    """1ゲーム分のシミュレーション（描画・ウィンドウに依存しない部分）
+
+    プレイヤー・敵・スポーン・スコアを持ち、step() で1フレーム進める。
+    App はこれを描画するだけ。buttle_headless.py はウィンドウ無しで回す。
+    タイルの当たり判定は tile_physics のタイルソースを使うので、
+    先に load_tile_source() か set_tile_source() しておくこと。
+    """
+    def __init__(self, controls=pyxel, seed=None):
+        self.player = Player(PLAYER_RESPAWN_X, PLAYER_RESPAWN_Y, controls)
+        self.enemies = []
+        self.enemy_grid = EnemyGrid()
+        self.spawn_controller = SpawnController(seed=seed)
+        self.score = 0
+        self.frame = 0
+        self.game_over = False
+
+    def step(self):
+        """1フレーム進める"""
+        self.frame += 1
+
+        # スポーンコントローラの更新
+        spawn_enemy, enemy_type, wave_advanced, bonus_score = self.spawn_controller.update()
+
+        # 敵をスポーンする必要がある場合
+        if spawn_enemy:
+            new_enemy = self.spawn_controller.create_enemy(enemy_type)
+            # 衝突関数を敵に渡す
+            new_enemy.collision_functions = (move_y_with_pushback, move_x_with_pushback, is_block_at, touching_ground)
+            self.enemies.append(new_enemy)
+
+        # ウェーブクリアボーナスの加算
+        if wave_advanced:
+            self.score += bonus_score
+
+        # 敵の更新
+        for enemy in self.enemies:
+            enemy.update(self.player.x, self.player.y)
+
+        # 非アクティブな敵を削除
+        self.enemies = [enemy for enemy in self.enemies if enemy.active]
+
+        # 動き終わった敵でグリッドを作り、剣・銃・接触判定で共有する
+        self.enemy_grid.build(self.enemies)
+
+        # プレイヤーの更新（得点スコアを取得）
+        self.score += self.player.update(self.enemy_grid)
+
+        # プレイヤーが死亡したかチェック
+        if self.player.is_dead():
+            self.game_over = True
@@ -1,5 +1,5 @@
 import pyxel
-import math
+from tile_physics import load_tile_source, move_y_with_pushback, move_x_with_pushback
 
 # ===== タイル定義と当たり判定の変換辞書 =====
 TILE_NONE = 0
@@ -19,82 +19,6 @@ TILE_TO_TILETYPE = {
     (3, 2): TILE_STONE,   # 追加のタイル定義
 }
 
-def get_tile_type(x, y):
-    """ワールド座標(x,y)にあるタイルタイプを返す"""
-    tx = int(x) // TILE_SIZE
-    ty = int(y) // TILE_SIZE
-    u, v = pyxel.tilemaps[0].pget(tx, ty)  # タイルセット内のUV
-    return TILE_TO_TILETYPE.get((u, v), TILE_NONE)
-
-def is_block_at(x, y):
-    """その座標がブロックタイルか？（画面外でもFalse扱いにしておく）"""
-    if x < 0 or y < 0 or x >= pyxel.width or y >= pyxel.height:
-        return False
-    return get_tile_type(x, y) in BLOCKING_TYPES
-
-def rect_hits_block(x, y, w, h):
-    """矩形の四隅と辺の中間点にブロックがあるか（改良版AABB×タイル判定）"""
-    # 四隅に加えて、各辺の中間点もチェック
-    return (
-        is_block_at(x,       y) or       # 左上
-        is_block_at(x + w-1, y) or       # 右上
-        is_block_at(x,       y + h-1) or # 左下
-        is_block_at(x + w-1, y + h-1) or # 右下
-        is_block_at(x + w//2, y) or      # 上辺中央
-        is_block_at(x, y + h//2) or      # 左辺中央
-        is_block_at(x + w-1, y + h//2) or # 右辺中央
-        is_block_at(x + w//2, y + h-1)    # 下辺中央
-    )
-
-
-def move_y_with_pushback(x, y, dy, w, h):
-    """Y軸方向の連続衝突（1pxずつ進め、ぶつかったら直前で止める）"""
-    hit_top = hit_bottom = False
-    step = 1 if dy > 0 else -1
-    for _ in range(abs(int(dy))):
-        if rect_hits_block(x, y + step, w, h):
-            if step > 0:
-                hit_bottom = True
-            else:
-                hit_top = True
-            return y, hit_top, hit_bottom, 0  # 残りdyは0（進めない）
-        y += step
-    # 端数（小数）も処理：タイル衝突は1px粒度なので最後にまとめて足す
-    frac = dy - int(dy)
-    if frac != 0:
-        if rect_hits_block(x, y + frac, w, h):
-            if frac > 0:
-                hit_bottom = True
-            else:
-                hit_top = True
-            return y, hit_top, hit_bottom, 0
-        y += frac
-    return y, hit_top, hit_bottom, dy
-
-def move_x_with_pushback(x, y, dx, w, h):
-    """X軸方向の連続衝突（1pxずつ進め、ぶつかったら直前で止める）"""
-    hit_left = hit_right = False
-    step = 1 if dx > 0 else -1
-    for _ in range(abs(int(dx))):
-        if rect_hits_block(x + step, y, w, h):
-            if step > 0:
-                hit_right = True
-            else:
-                hit_left = True
-            return x, hit_left, hit_right, 0
-        x += step
-    # 端数（小数）
-    frac = dx - int(dx)
-    if frac != 0:
-        if rect_hits_block(x + frac, y, w, h):
-            if frac > 0:
-                hit_right = True
-            else:
-                hit_left = True
-            return x, hit_left, hit_right, 0
-        x += frac
-    return x, hit_left, hit_right, dx
-
 # ===== 敵クラス（デモ用） =====
 class Enemy:
     def __init__(self, x, y):
@@ -345,6 +269,9 @@ class App:
         # あなたのリソースファイル名に合わせて変更
         pyxel.load("my_resource.pyxres")
 
+        # 当たり判定はタイルマップから作ったキャッシュで行う
+        load_tile_source(TILE_TO_TILETYPE, BLOCKING_TYPES, TILE_SIZE)
+
         self.player = Player(PLAYER_RESPAWN_X, PLAYER_RESPAWN_Y)
         
         # 敵の初期配置を保存
@@ -0,0 +1,65 @@
+# enemy_grid.py
+import math
+
+from buttle_constants import SCREEN_W, SCREEN_H, ENEMY_GRID_CELL
+
+# ===== 敵の当たり判定用の一様グリッド（ブロードフェーズ） =====
+# 敵が動き終わった後に1フレームに1回 build() し、
+# 剣・銃・プレイヤーの接触判定は query() で近くの敵だけを調べる。
+# 画面外の敵は端のマスに入れる（問い合わせ側も同じように丸めるので漏れない）。
+
+
+class EnemyGrid:
+    def __init__(self, width=SCREEN_W, height=SCREEN_H, cell_size=ENEMY_GRID_CELL):
+        self.cell_size = cell_size
+        self.cols = -(-width // cell_size)
+        self.rows = -(-height // cell_size)
+        self.cells = [[] for _ in range(self.cols * self.rows)]
+        self.enemies = []
+
+    def __len__(self):
+        return len(self.enemies)
+
+    def _cell_range(self, x, y, w, h):
+        cs = self.cell_size
+        c0 = min(max(int(x) // cs, 0), self.cols - 1)
+        c1 = min(max((math.ceil(x + w) - 1) // cs, 0), self.cols - 1)
+        r0 = min(max(int(y) // cs, 0), self.rows - 1)
+        r1 = min(max((math.ceil(y + h) - 1) // cs, 0), self.rows - 1)
+        return c0, c1, r0, r1
+
+    def build(self, enemies):
+        """アクティブな敵をグリッドに登録し直す"""
+        for cell in self.cells:
+            cell.clear()
+        self.enemies = enemies
+        cells = self.cells
+        cols = self.cols
+        for i, enemy in enumerate(enemies):
+            if not enemy.active:
+                continue
+            c0, c1, r0, r1 = self._cell_range(enemy.x, enemy.y, enemy.w, enemy.h)
+            for r in range(r0, r1 + 1):
+                row = r * cols
+                for c in range(c0, c1 + 1):
+                    cells[row + c].append(i)
+
+    def query(self, x, y, w, h):
+        """矩形 (x, y, w, h) と同じマスにいる敵を、enemies の並び順で返す
+
+        候補を返すだけなので、実際の重なりは呼び出し側で判定する。
+        """
+        c0, c1, r0, r1 = self._cell_range(x, y, w, h)
+        cells = self.cells
+        cols = self.cols
+        if c0 == c1 and r0 == r1:
+            found = cells[r0 * cols + c0]
+        else:
+            found = set()
+            for r in range(r0, r1 + 1):
+                row = r * cols
+                for c in range(c0, c1 + 1):
+                    found.update(cells[row + c])
+            found = sorted(found)
+        enemies = self.enemies
+        return [enemies[i] for i in found]
@@ -0,0 +1,74 @@
+"""SpawnController をウィンドウ無しで回して、ウェーブごとの難易度を集計する。
+
+    python spawn_sim.py
+    python spawn_sim.py --runs 1000 --waves 12 --seed 1
+
+SpawnController.update() だけを WAVE_DURATION フレームずつ回し、
+ウェーブごとに スポーン数・敵タイプの割合・敵の合計HP・速度倍率 を
+全ランの平均で表示する。最大ウェーブ（WAVE_MAX）を超えて
+調べたいときは --waves で増やす（スポーン確率は ENEMY_SPAWN_CHANCES から作る）。
+"""
+import argparse
+
+from buttle_constants import FPS, WAVE_DURATION, WAVE_MAX, ENEMY_HP
+from buttle_spawn import SpawnController, build_spawn_tables
+
+
+def simulate(waves, seed, tables):
+    """1ラン分を回し、ウェーブごとの集計 dict のリストを返す"""
+    controller = SpawnController(seed=seed, max_wave=waves, tables=tables)
+    stats = []
+    for _ in range(waves):
+        wave = controller.wave
+        speed = controller.enemy_speed_multiplier
+        interval = controller.current_spawn_interval
+        spawns = {}
+        hp_total = 0
+        for _ in range(WAVE_DURATION):
+            spawn_enemy, enemy_type, _, _ = controller.update()
+            if spawn_enemy:
+                spawns[enemy_type] = spawns.get(enemy_type, 0) + 1
+                # create_enemy と同じHP計算（敵は作らない）
+                hp_total += max(1, int(ENEMY_HP * controller.enemy_hp_multiplier))
+        stats.append({
+            "wave": wave,
+            "spawns": spawns,
+            "hp_total": hp_total,
+            "speed": speed,
+            "interval": interval,
+        })
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SpawnController difficulty simulator")
+    parser.add_argument("--runs", type=int, default=200)
+    parser.add_argument("--waves", type=int, default=WAVE_MAX)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    # 確率テーブルは全ランで共有する
+    tables = build_spawn_tables(args.waves)
+    totals = [{"spawns": {}, "hp_total": 0, "speed": 0.0, "interval": 0} for _ in range(args.waves)]
+    for run in range(args.runs):
+        for total, wave_stats in zip(totals, simulate(args.waves, args.seed + run, tables)):
+            for enemy_type, n in wave_stats["spawns"].items():
+                total["spawns"][enemy_type] = total["spawns"].get(enemy_type, 0) + n
+            total["hp_total"] += wave_stats["hp_total"]
+            total["speed"] = wave_stats["speed"]
+            total["interval"] = wave_stats["interval"]
+
+    seconds = WAVE_DURATION / FPS
+    print(f"runs={args.runs} waves={args.waves} seed={args.seed} ({seconds:.0f}s / wave)")
+    print(f"{'wave':>4}{'spawns':>9}{'hp':>9}{'hp/s':>8}{'speed':>7}{'interval':>9}  types")
+    for wave, total in enumerate(totals, start=1):
+        count = sum(total["spawns"].values())
+        spawns = count / args.runs
+        hp = total["hp_total"] / args.runs
+        types = " ".join(f"{t}={n / count:.0%}" for t, n in sorted(total["spawns"].items())) if count else "-"
+        print(f"{wave:>4}{spawns:>9.2f}{hp:>9.1f}{hp / seconds:>8.2f}"
+              f"{total['speed']:>7.2f}{total['interval']:>9}  {types}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,324 @@
+# tile_physics.py
+import math
+import struct
+
+import pyxel
+
+# ===== タイル当たり判定・移動の共通モジュール =====
+# buttle_game.py / dot_buttle.py / dot_runner.py で共通に使う。
+#
+#   load_tile_source(TILE_TO_TILETYPE, BLOCKING_TYPES, TILE_SIZE)  # pyxel.load の後に1回
+#   is_block_at(x, y) / rect_hits_block(x, y, w, h)
+#   move_x_with_pushback(x, y, dx, w, h) -> (x, hit_left, hit_right, 残りdx)
+#   move_y_with_pushback(x, y, dy, w, h) -> (y, hit_top, hit_bottom, 残りdy)
+#   touching_ground(x, y, w, h)
+#
+# タイルの読み方は差し替えられる（タイルソース）:
+#   LiveTilemap : 毎回 tilemap.pget して TILE_TO_TILETYPE を引く（キャッシュなし）
+#   SolidGrid   : 起動時に「壁かどうか」を1タイル1バイトの bytearray にしておく
+# 既定は SolidGrid。タイルを書き換えるときは set_tile() を使えばキャッシュも更新される。
+# 速度の比較は bench_physics.py で行う。
+
+
+class TileSource:
+    """タイルソースの基底。is_solid_tile(tx, ty) を実装すれば判定・移動がそのまま使える"""
+
+    def __init__(self, tilemap, tile_to_type, blocking_types,
+                 width, height, tile_size=8):
+        self.tilemap = tilemap
+        self.tile_to_type = tile_to_type
+        self.blocking_types = blocking_types
+        self.tile_size = tile_size
+        self.width = width      # ピクセル単位の範囲（この外は壁なし扱い）
+        self.height = height
+        self.cols = -(-width // tile_size)
+        self.rows = -(-height // tile_size)
+
+    def get_tile_type(self, x, y, default=0):
+        """ワールド座標(x,y)にあるタイルタイプを返す（常にタイルマップを読む）"""
+        tx = int(x) // self.tile_size
+        ty = int(y) // self.tile_size
+        uv = tuple(self.tilemap.pget(tx, ty))  # タイルセット内のUV
+        return self.tile_to_type.get(uv, default)
+
+    def _tile_is_solid(self, tx, ty):
+        uv = tuple(self.tilemap.pget(tx, ty))
+        return self.tile_to_type.get(uv) in self.blocking_types
+
+    def is_solid_tile(self, tx, ty):
+        raise NotImplementedError
+
+    def set_tile(self, tx, ty, uv):
+        """タイルを書き換える"""
+        self.tilemap.pset(tx, ty, uv)
+
+    def is_block_at(self, x, y):
+        """その座標がブロックタイルか？（範囲外は False）"""
+        if x < 0 or y < 0 or x >= self.width or y >= self.height:
+            return False
+        ts = self.tile_size
+        return self.is_solid_tile(int(x) // ts, int(y) // ts)
+
+    def rect_hits_block(self, x, y, w, h):
+        """矩形の四隅と辺の中間点（8点）にブロックがあるか"""
+        is_block_at = self.is_block_at
+        return (
+            is_block_at(x,       y) or
+            is_block_at(x + w-1, y) or
+            is_block_at(x,       y + h-1) or
+            is_block_at(x + w-1, y + h-1) or
+            is_block_at(x + w//2, y) or
+            is_block_at(x, y + h//2) or
+            is_block_at(x + w-1, y + h//2) or
+            is_block_at(x + w//2, y + h-1)
+        )
+
+    # ----- スイープ移動（1pxずつ進めずに、最初にぶつかるタイル列/行を直接求める） -----
+    def _row_blocked(self, r, c0, c1):
+        if r < 0 or r >= self.rows:
+            return False
+        is_solid_tile = self.is_solid_tile
+        for c in range(max(c0, 0), min(c1, self.cols - 1) + 1):
+            if is_solid_tile(c, r):
+                return True
+        return False
+
+    def _col_blocked(self, c, r0, r1):
+        if c < 0 or c >= self.cols:
+            return False
+        is_solid_tile = self.is_solid_tile
+        for r in range(max(r0, 0), min(r1, self.rows - 1) + 1):
+            if is_solid_tile(c, r):
+                return True
+        return False
+
+    def _sweep(self, p, d, size, blocked, lo, hi):
+        """軸方向に p から d だけ動かす。
+
+        lo..hi は交差軸のタイル範囲、blocked(i, lo, hi) は i 列（行）が塞がっているか。
+        旧実装（1pxずつ進めて8点判定）と同じ位置で止まるように、
+        整数ステップ＋端数ステップのどこで最初にぶつかるかを計算する。
+        戻り値: (新しい位置, ぶつかったか)
+        """
+        ts = self.tile_size
+        n = int(abs(d))
+        frac = abs(d) - n
+        first = 1 if n >= 1 else frac   # 最初に調べるずらし量
+        if d > 0:
+            end = math.floor(p + d + size - 1) // ts
+            # 進行方向の先頭（下端/右端）側へ、最初に塞がっている列（行）を探す
+            for i in range(math.floor(p + first) // ts, end + 1):
+                if blocked(i, lo, hi):
+                    need = i * ts - p - size + 1   # この量ずらすと先頭が i に入る
+                    k = max(1, math.ceil(need))
+                    if k <= n:
+                        return p + (k - 1), True
+                    return p + n, True             # 端数ステップでぶつかる
+            return p + d, False
+        else:
+            end = math.floor(p + d) // ts
+            for i in range(math.floor(p - first + size - 1) // ts, end - 1, -1):
+                if blocked(i, lo, hi):
+                    need = p - (i + 1) * ts
+                    k = max(1, math.floor(need) + 1)
+                    if k <= n:
+                        return p - (k - 1), True
+                    return p - n, True
+            return p + d, False
+
+    def move_x(self, x, y, dx, w, h):
+        """X軸のスイープ移動。戻り値は (x, hit_left, hit_right, 残りdx)"""
+        if dx == 0:
+            return x, False, False, dx
+        ts = self.tile_size
+        r0 = math.floor(y) // ts
+        r1 = math.floor(y + h - 1) // ts
+        new_x, hit = self._sweep(x, dx, w, self._col_blocked, r0, r1)
+        if hit:
+            return new_x, dx < 0, dx > 0, 0
+        return new_x, False, False, dx
+
+    def move_y(self, x, y, dy, w, h):
+        """Y軸のスイープ移動。戻り値は (y, hit_top, hit_bottom, 残りdy)"""
+        if dy == 0:
+            return y, False, False, dy
+        ts = self.tile_size
+        c0 = math.floor(x) // ts
+        c1 = math.floor(x + w - 1) // ts
+        new_y, hit = self._sweep(y, dy, h, self._row_blocked, c0, c1)
+        if hit:
+            return new_y, dy < 0, dy > 0, 0
+        return new_y, False, False, dy
+
+    def touching_ground(self, x, y, w, h):
+        """1px 下にずらした矩形がブロックに重なるか（move_y(x, y, 1, ...) の接地判定と同じ）"""
+        ts = self.tile_size
+        c0 = math.floor(x) // ts
+        c1 = math.floor(x + w - 1) // ts
+        for r in range(math.floor(y + 1) // ts, math.floor(y + h) // ts + 1):
+            if self._row_blocked(r, c0, c1):
+                return True
+        return False
+
+
+class LiveTilemap(TileSource):
+    """毎回タイルマップを読むタイルソース（タイルを頻繁に書き換えるとき用）"""
+
+    def is_solid_tile(self, tx, ty):
+        if tx < 0 or ty < 0 or tx >= self.cols or ty >= self.rows:
+            return False
+        return self._tile_is_solid(tx, ty)
+
+
+GRID_MAGIC = b"SGRD"
+
+
+class SolidGrid(TileSource):
+    """壁かどうかを bytearray にキャッシュしたタイルソース"""
+
+    def __init__(self, tilemap, tile_to_type, blocking_types,
+                 width, height, tile_size=8):
+        super().__init__(tilemap, tile_to_type, blocking_types, width, height, tile_size)
+        self.cells = bytearray(self.cols * self.rows)
+        self.invalidate()
+
+    def invalidate(self, tx=None, ty=None):
+        """タイルマップから読み直す（座標を渡すとその1タイルだけ）"""
+        if self.tilemap is None:
+            return
+        if tx is not None and ty is not None:
+            if 0 <= tx < self.cols and 0 <= ty < self.rows:
+                self.cells[ty * self.cols + tx] = self._tile_is_solid(tx, ty)
+            return
+        cols = self.cols
+        for y in range(self.rows):
+            row = y * cols
+            for x in range(cols):
+                self.cells[row + x] = self._tile_is_solid(x, y)
+
+    def set_tile(self, tx, ty, uv):
+        """タイルを書き換えて、キャッシュも更新する"""
+        if self.tilemap is not None:
+            self.tilemap.pset(tx, ty, uv)
+        self.invalidate(tx, ty)
+
+    # ----- ファイルへの保存（ウィンドウ無しのシミュレーション用） -----
+    # 形式: magic "SGRD", width, height, tile_size (u16 x3), 以降 cols*rows バイト
+    def to_bytes(self):
+        return GRID_MAGIC + struct.pack("<HHH", self.width, self.height, self.tile_size) + bytes(self.cells)
+
+    @classmethod
+    def from_bytes(cls, buf):
+        """保存した固体マップを読む（元のタイルマップは持たない）"""
+        if buf[:4] != GRID_MAGIC:
+            raise ValueError("not a solid grid file")
+        width, height, tile_size = struct.unpack_from("<HHH", buf, 4)
+        grid = cls(None, {}, set(), width, height, tile_size)
+        cells = buf[10:]
+        if len(cells) != len(grid.cells):
+            raise ValueError("solid grid file is truncated")
+        grid.cells[:] = cells
+        return grid
+
+    def save(self, path):
+        with open(path, "wb") as f:
+            f.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            return cls.from_bytes(f.read())
+
+    def is_solid_tile(self, tx, ty):
+        if tx < 0 or ty < 0 or tx >= self.cols or ty >= self.rows:
+            return False
+        return self.cells[ty * self.cols + tx] != 0
+
+    # 以下はよく呼ばれるので cells を直接読む版で上書きする
+    def is_block_at(self, x, y):
+        if x < 0 or y < 0 or x >= self.width or y >= self.height:
+            return False
+        ts = self.tile_size
+        return self.cells[(int(y) // ts) * self.cols + int(x) // ts] != 0
+
+    def _row_blocked(self, r, c0, c1):
+        if r < 0 or r >= self.rows:
+            return False
+        cells = self.cells
+        base = r * self.cols
+        for c in range(max(c0, 0), min(c1, self.cols - 1) + 1):
+            if cells[base + c]:
+                return True
+        return False
+
+    def _col_blocked(self, c, r0, r1):
+        if c < 0 or c >= self.cols:
+            return False
+        cells = self.cells
+        cols = self.cols
+        for r in range(max(r0, 0), min(r1, self.rows - 1) + 1):
+            if cells[r * cols + c]:
+                return True
+        return False
+
+
+TILE_SOURCES = {
+    "live": LiveTilemap,
+    "grid": SolidGrid,
+}
+
+
+# ===== モジュール関数（各ゲームからはこちらを使う） =====
+_source = None
+
+
+def set_tile_source(source):
+    """当たり判定に使うタイルソースを差し替える"""
+    global _source
+    _source = source
+    return source
+
+
+def get_tile_source():
+    return _source
+
+
+def load_tile_source(tile_to_type, blocking_types, tile_size=8,
+                     kind="grid", tilemap_index=0):
+    """pyxel のタイルマップ（画面サイズ分）をタイルソースにする。
+
+    pyxel.load の後・タイルを一括で変えた後に呼ぶ。kind は TILE_SOURCES のキー。
+    """
+    cls = TILE_SOURCES[kind]
+    return set_tile_source(cls(pyxel.tilemaps[tilemap_index], tile_to_type, blocking_types,
+                               pyxel.width, pyxel.height, tile_size))
+
+
+def get_tile_type(x, y, default=0):
+    """ワールド座標(x,y)にあるタイルタイプを返す"""
+    return _source.get_tile_type(x, y, default)
+
+
+def is_block_at(x, y):
+    """その座標がブロックタイルか？（画面外でもFalse扱いにしておく）"""
+    return _source.is_block_at(x, y)
+
+
+def rect_hits_block(x, y, w, h):
+    """矩形の四隅と辺の中間点にブロックがあるか（改良版AABB×タイル判定）"""
+    return _source.rect_hits_block(x, y, w, h)
+
+
+def move_y_with_pushback(x, y, dy, w, h):
+    """Y軸方向の連続衝突（最初にぶつかるタイル行を直接求め、直前で止める）"""
+    return _source.move_y(x, y, dy, w, h)
+
+
+def move_x_with_pushback(x, y, dx, w, h):
+    """X軸方向の連続衝突（最初にぶつかるタイル列を直接求め、直前で止める）"""
+    return _source.move_x(x, y, dx, w, h)
+
+
+def touching_ground(x, y, w, h):
+    """1px下にブロックがあるか（接地判定）"""
+    return _source.touching_ground(x, y, w, h)
@@ -1,5 +1,6 @@
 import pyxel
 from RPG_constants import *
+from rpg_world import RESOURCE_FILE, ChunkWorld, read_source, source_digest, write_world_from_tilemap
 from Pyxel_RPG_title import TitleScene
 
 TILE_SIZE = 8  # 1タイルのサイズ（px）
@@ -21,9 +22,15 @@ PW = 16
 PH = 16
 SPEED = 10
 
-# マップ設定
+# マップ設定（ワールドファイルを読み込むと、その大きさに変わる）
 MAP_W, MAP_H = 512, 512
-TM = 0  # タイルマップ番号
+TM = 0  # タイルマップ番号（ワールドファイルが無いときに、ここから作る）
+WORLD_FILE = "rpg_world.bin"  # チャンク分割したワールドファイル
+VIEW_TM = 2  # 表示用のタイルマップ番号（見えている範囲のタイルだけを書き込む）
+VIEW_TW = W // TILE_SIZE + 1  # 表示用タイルマップの幅（タイル数）
+VIEW_TH = H // TILE_SIZE + 1  # 表示用タイルマップの高さ（タイル数）
+
+world = None  # 現在のワールド（ChunkWorld）
 
 def clamp(v, lo, hi):
     return max(lo, min(v, hi))
@@ -37,18 +44,32 @@ BG_BANK = 0
 SCROLL_BORDER_X = 64
 SCROLL_BORDER_Y = 64
 
+def load_world():
+    """ワールドファイルを開く（無いか、リソースファイルが変わっていればタイルマップ0から作り直す）"""
+    global world, MAP_W, MAP_H
+    source = source_digest(RESOURCE_FILE)
+    if read_source(WORLD_FILE) != source:
+        write_world_from_tilemap(
+            WORLD_FILE, pyxel.tilemaps[TM], MAP_W // TILE_SIZE, MAP_H // TILE_SIZE,
+            source=source,
+        )
+    world = ChunkWorld(WORLD_FILE)
+    MAP_W = world.width * TILE_SIZE
+    MAP_H = world.height * TILE_SIZE
+    return world
+
 def get_tile_type(x, y):
     """ワールド座標(x,y)にあるタイルタイプを返す"""
-    tx = x // TILE_SIZE
-    ty = y // TILE_SIZE
-    tile = pyxel.tilemaps[0].pget(tx, ty)  # (u, v) タプル
+    tx = int(x // TILE_SIZE)
+    ty = int(y // TILE_SIZE)
+    tile = world.get_tile(tx, ty)  # (u, v) タプル
     return TILE_TO_TILETYPE.get(tile, TILE_NONE)
 
 def set_tile_empty(x, y):
-    """指定座標のタイルを空に設定"""
-    tx = x // TILE_SIZE
-    ty = y // TILE_SIZE
-    pyxel.tilemaps[0].pset(tx, ty, (0, 0))  # 空のタイルに設定
+    """指定座標のタイルを空に設定（ワールドのオーバーレイに記録される）"""
+    tx = int(x // TILE_SIZE)
+    ty = int(y // TILE_SIZE)
+    world.set_tile(tx, ty, (0, 0))  # 空のタイルに設定
 
 def is_block_at(x, y):
     """その座標にブロックタイルがあるか"""
@@ -124,6 +145,82 @@ def _move_axis_pushback(x, y, w, h, delta, axis):
 
 
 
+# 表示用タイルマップ
+# ワールドの見えている範囲のタイルを、VIEW_TW x VIEW_TH のタイルマップに書き込んで bltm で描く
+# タイル(tx, ty)は(tx % VIEW_TW, ty % VIEW_TH)に置く（リングバッファ）ので、
+# スクロールしたときは新しく見えた行と列だけを書き込めばよい
+class WorldView:
+    def __init__(self, world):
+        self.world = world
+        self.tilemap = pyxel.tilemaps[VIEW_TM]
+        self.tilemap.imgsrc = pyxel.tilemaps[TM].imgsrc
+        self.tx0 = None  # 書き込み済みの範囲の左上（タイル座標）
+        self.ty0 = None
+
+    def _put(self, tx, ty):
+        self.tilemap.pset(tx % VIEW_TW, ty % VIEW_TH, self.world.get_tile(tx, ty))
+
+    def _fill_columns(self, tx1, tx2, ty0):
+        for tx in range(tx1, tx2):
+            for ty in range(ty0, ty0 + VIEW_TH):
+                self._put(tx, ty)
+
+    def _fill_rows(self, ty1, ty2, tx0):
+        for ty in range(ty1, ty2):
+            for tx in range(tx0, tx0 + VIEW_TW):
+                self._put(tx, ty)
+
+    def update(self, cam_x, cam_y):
+        """カメラの位置に合わせて表示用タイルマップを書き換える"""
+        tx0 = int(cam_x // TILE_SIZE)
+        ty0 = int(cam_y // TILE_SIZE)
+        self.world.prefetch(tx0, ty0, VIEW_TW, VIEW_TH)
+
+        if (
+            self.tx0 is None
+            or abs(tx0 - self.tx0) >= VIEW_TW
+            or abs(ty0 - self.ty0) >= VIEW_TH
+        ):
+            # 全部書き直す
+            self._fill_rows(ty0, ty0 + VIEW_TH, tx0)
+            self.world.pop_changes()
+        else:
+            # 新しく見えた列を書き込む（行は前の範囲のまま）
+            if tx0 > self.tx0:
+                self._fill_columns(self.tx0 + VIEW_TW, tx0 + VIEW_TW, self.ty0)
+            elif tx0 < self.tx0:
+                self._fill_columns(tx0, self.tx0, self.ty0)
+            # 新しく見えた行を書き込む
+            if ty0 > self.ty0:
+                self._fill_rows(self.ty0 + VIEW_TH, ty0 + VIEW_TH, tx0)
+            elif ty0 < self.ty0:
+                self._fill_rows(ty0, self.ty0, tx0)
+
+            # 書き換わったタイルのうち、見えている範囲のものを書き込む
+            for tx, ty in self.world.pop_changes():
+                if tx0 <= tx < tx0 + VIEW_TW and ty0 <= ty < ty0 + VIEW_TH:
+                    self._put(tx, ty)
+
+        self.tx0 = tx0
+        self.ty0 = ty0
+
+    def draw(self):
+        """表示用タイルマップを描く（リングバッファの継ぎ目で最大4回に分ける）"""
+        sx = self.tx0 % VIEW_TW
+        sy = self.ty0 % VIEW_TH
+        for tx, u, w in ((self.tx0, sx, VIEW_TW - sx), (self.tx0 + VIEW_TW - sx, 0, sx)):
+            if w == 0:
+                continue
+            for ty, v, h in ((self.ty0, sy, VIEW_TH - sy), (self.ty0 + VIEW_TH - sy, 0, sy)):
+                if h == 0:
+                    continue
+                pyxel.bltm(
+                    tx * TILE_SIZE, ty * TILE_SIZE, VIEW_TM,
+                    u * TILE_SIZE, v * TILE_SIZE, w * TILE_SIZE, h * TILE_SIZE,
+                    colkey=0,
+                )
+
+
 # 汎用オブジェクト
 class GameObject:
     def __init__(self, x, y, img, u, v, w, h, colkey=0):
@@ -191,7 +288,8 @@ class App:
     def __init__(self):
         pyxel.init(W, H, title="RPG Camera", fps=60)
         pyxel.mouse(True)  # マウスカーソルを表示
-        pyxel.load("my_resource.pyxres")
+        pyxel.load(RESOURCE_FILE)
+        self.view = WorldView(load_world())
         
         self.cam_x = 0
         self.cam_y = 0
@@ -270,8 +368,9 @@ class App:
             pyxel.cls(3)
             pyxel.camera(self.cam_x, self.cam_y)
             
-            # タイルマップを描画（透明色を指定）
-            pyxel.bltm(0, 0, 0, 0, 0, 256, 256, colkey=0)
+            # 見えている範囲のタイルを描画（透明色を指定）
+            self.view.update(self.cam_x, self.cam_y)
+            self.view.draw()
             self.player.draw_player()
             
             # デバッグ情報表示（デバッグモード時）
@@ -344,8 +443,8 @@ class App:
         self.cam_x = 0
         self.cam_y = 0
         
-        # タイルマップをリロード（宝石などを元に戻す）
-        pyxel.load("my_resource.pyxres")
+        # 書き換えたタイルを元に戻す（宝石などを元に戻す）
+        world.clear_overlay()
 
 
 App()
\ No newline at end of file
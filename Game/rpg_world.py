@@ -0,0 +1,228 @@
+"""チャンク分割ワールドモジュール
+
+マップを CHUNK_TILES x CHUNK_TILES タイルのチャンクに分けて、1つのバイナリファイルに入れる。
+ゲーム中はカメラの近くのチャンクだけを読み込み、遠いチャンクは古いものから捨てる（LRU）。
+宝石の収集などで変わったタイルはチャンクには書き戻さず、差分（オーバーレイ）として持つ。
+pyxel のタイルマップの大きさの上限を超えるマップでも、メモリの使用量は一定になる。
+
+ファイルの形式（リトルエンディアン）:
+    ヘッダ      magic "RPGW", version(u8), チャンクの辺のタイル数(u8), 幅(u32), 高さ(u32)（タイル数）,
+                作った元のリソースファイルの SHA-256(32バイト。無ければ 0)
+    索引        チャンクごとに (オフセット u32, 長さ u32)。チャンクは行優先で並ぶ
+    チャンク    タイルごとの (u, v) を1バイトずつ並べて zlib で圧縮したもの
+                全部空のチャンクは書かない（長さ 0）
+
+    python rpg_world.py                    # my_resource.pyxres のタイルマップ0から作る
+    python rpg_world.py --repeat 8         # 同じマップを 8x8 回並べた大きなワールドを作る
+
+ゲームは元のリソースファイルのハッシュがヘッダと違えば作り直すので、マップを編集しても反映される。
+"""
+import argparse
+import hashlib
+import struct
+import zlib
+from collections import OrderedDict
+
+WORLD_MAGIC = b"RPGW"
+WORLD_VERSION = 2
+CHUNK_TILES = 16  # チャンクの1辺のタイル数
+MAX_CHUNKS = 36  # メモリに置いておくチャンクの数（画面 + 周囲1チャンクが入る数）
+EMPTY_TILE = (0, 0)
+RESOURCE_FILE = "my_resource.pyxres"  # ワールドの元になるリソースファイル
+
+NO_SOURCE = bytes(32)
+
+HEADER = struct.Struct("<4sBBII32s")
+INDEX_ENTRY = struct.Struct("<II")
+
+
+def source_digest(path):
+    """リソースファイルの SHA-256（ヘッダに入れて、作り直しが要るかを判定する）"""
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).digest()
+
+
+def read_source(path):
+    """ワールドファイルのヘッダにある元のリソースの SHA-256（読めない・古い形式なら None）"""
+    try:
+        with open(path, "rb") as f:
+            head = f.read(HEADER.size)
+    except OSError:
+        return None
+    if len(head) < HEADER.size:
+        return None
+    magic, version, _, _, _, source = HEADER.unpack(head)
+    if magic != WORLD_MAGIC or version != WORLD_VERSION:
+        return None
+    return source
+
+
+def write_world(path, width, height, get_tile, chunk_tiles=CHUNK_TILES, source=NO_SOURCE):
+    """get_tile(tx, ty) -> (u, v) でタイルを読んでワールドファイルを書く"""
+    chunks_x = (width + chunk_tiles - 1) // chunk_tiles
+    chunks_y = (height + chunk_tiles - 1) // chunk_tiles
+    empty = bytes(2 * chunk_tiles * chunk_tiles)
+
+    payloads = []
+    for cy in range(chunks_y):
+        for cx in range(chunks_x):
+            data = bytearray(2 * chunk_tiles * chunk_tiles)
+            for j in range(chunk_tiles):
+                ty = cy * chunk_tiles + j
+                if ty >= height:
+                    break
+                for i in range(chunk_tiles):
+                    tx = cx * chunk_tiles + i
+                    if tx >= width:
+                        break
+                    u, v = get_tile(tx, ty)
+                    k = 2 * (j * chunk_tiles + i)
+                    data[k] = u
+                    data[k + 1] = v
+            payloads.append(b"" if data == empty else zlib.compress(bytes(data), 9))
+
+    offset = HEADER.size + INDEX_ENTRY.size * len(payloads)
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(WORLD_MAGIC, WORLD_VERSION, chunk_tiles, width, height, source))
+        for payload in payloads:
+            f.write(INDEX_ENTRY.pack(offset if payload else 0, len(payload)))
+            offset += len(payload)
+        for payload in payloads:
+            f.write(payload)
+
+
+def write_world_from_tilemap(path, tilemap, width, height, repeat=1, chunk_tiles=CHUNK_TILES,
+                             source=NO_SOURCE):
+    """タイルマップの左上 width x height タイルからワールドファイルを書く
+
+    repeat を指定すると同じマップを repeat x repeat 回並べる（大きなマップの試験用）
+    source には元のリソースファイルの source_digest を渡す
+    """
+    tiles = [[tuple(tilemap.pget(tx, ty)) for tx in range(width)] for ty in range(height)]
+    write_world(
+        path,
+        width * repeat,
+        height * repeat,
+        lambda tx, ty: tiles[ty % height][tx % width],
+        chunk_tiles,
+        source,
+    )
+
+
+class ChunkWorld:
+    """ワールドファイルからチャンクを必要なときだけ読むタイルマップ"""
+
+    def __init__(self, path, max_chunks=MAX_CHUNKS):
+        self.file = open(path, "rb")
+        magic, version, chunk_tiles, width, height, self.source = HEADER.unpack(
+            self.file.read(HEADER.size)
+        )
+        if magic != WORLD_MAGIC or version != WORLD_VERSION:
+            raise ValueError(f"{path} はワールドファイルではありません")
+        self.chunk_tiles = chunk_tiles
+        self.width = width  # 幅（タイル数）
+        self.height = height  # 高さ（タイル数）
+        self.chunks_x = (width + chunk_tiles - 1) // chunk_tiles
+        self.chunks_y = (height + chunk_tiles - 1) // chunk_tiles
+        count = self.chunks_x * self.chunks_y
+        self.index = list(INDEX_ENTRY.iter_unpack(self.file.read(INDEX_ENTRY.size * count)))
+
+        self.max_chunks = max_chunks
+        self.chunks = OrderedDict()  # (cx, cy) -> タイルのバイト列（None は空のチャンク）
+        self.overlay = {}  # (tx, ty) -> (u, v) 書き換えたタイル
+        self.changes = []  # 前回 pop_changes してから書き換わったタイル座標
+        self.loads = 0  # ファイルから読んだ回数
+        self.evictions = 0  # 捨てた回数
+
+    def close(self):
+        self.file.close()
+
+    def _load_chunk(self, cx, cy):
+        offset, length = self.index[cy * self.chunks_x + cx]
+        self.loads += 1
+        if length == 0:
+            return None
+        self.file.seek(offset)
+        return zlib.decompress(self.file.read(length))
+
+    def chunk(self, cx, cy):
+        """チャンクのタイルのバイト列を返す（読み込み済みでなければ読む）"""
+        key = (cx, cy)
+        chunks = self.chunks
+        if key in chunks:
+            chunks.move_to_end(key)
+            return chunks[key]
+        data = self._load_chunk(cx, cy)
+        chunks[key] = data
+        if len(chunks) > self.max_chunks:
+            chunks.popitem(last=False)
+            self.evictions += 1
+        return data
+
+    def get_tile(self, tx, ty):
+        """タイル座標の (u, v) を返す（マップの外は空）"""
+        if not (0 <= tx < self.width and 0 <= ty < self.height):
+            return EMPTY_TILE
+        tile = self.overlay.get((tx, ty))
+        if tile is not None:
+            return tile
+        cs = self.chunk_tiles
+        data = self.chunk(tx // cs, ty // cs)
+        if data is None:
+            return EMPTY_TILE
+        k = 2 * ((ty % cs) * cs + tx % cs)
+        return data[k], data[k + 1]
+
+    def set_tile(self, tx, ty, tile):
+        """タイルを書き換える（チャンクはそのままで、オーバーレイに持つ）"""
+        if 0 <= tx < self.width and 0 <= ty < self.height:
+            self.overlay[(tx, ty)] = tile
+            self.changes.append((tx, ty))
+
+    def clear_overlay(self):
+        """書き換えたタイルを全部元に戻す"""
+        self.changes.extend(self.overlay)
+        self.overlay.clear()
+
+    def pop_changes(self):
+        """書き換わったタイル座標を返して、記録を空にする"""
+        changes = self.changes
+        self.changes = []
+        return changes
+
+    def prefetch(self, tx, ty, w, h, margin=1):
+        """タイル座標の矩形と、その周囲 margin チャンクを読み込んでおく"""
+        cs = self.chunk_tiles
+        cx1 = max(tx // cs - margin, 0)
+        cy1 = max(ty // cs - margin, 0)
+        cx2 = min((tx + w - 1) // cs + margin, self.chunks_x - 1)
+        cy2 = min((ty + h - 1) // cs + margin, self.chunks_y - 1)
+        for cy in range(cy1, cy2 + 1):
+            for cx in range(cx1, cx2 + 1):
+                self.chunk(cx, cy)
+
+
+def main():
+    import pyxel
+
+    parser = argparse.ArgumentParser(description="Pyxel_RPG のワールドファイルを作る")
+    parser.add_argument("--out", default="rpg_world.bin")
+    parser.add_argument("--width", type=int, default=64, help="タイルマップ0から使う幅（タイル数）")
+    parser.add_argument("--height", type=int, default=64, help="タイルマップ0から使う高さ（タイル数）")
+    parser.add_argument("--repeat", type=int, default=1, help="マップを縦横に並べる回数")
+    args = parser.parse_args()
+
+    pyxel.init(256, 256)
+    pyxel.load(RESOURCE_FILE)
+    write_world_from_tilemap(
+        args.out, pyxel.tilemaps[0], args.width, args.height, args.repeat,
+        source=source_digest(RESOURCE_FILE),
+    )
+    world = ChunkWorld(args.out)
+    print(f"saved {args.out} ({world.width}x{world.height} tiles, "
+          f"{world.chunks_x}x{world.chunks_y} chunks)")
+    world.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,15 @@
+import argparse
 import math
 import pyxel
 from constants import *
+from input_replay import InputRecorder, InputReplayer
 
 def rects_intersect(ax, ay, aw, ah, bx, by, bw, bh):
     return (ax < bx + bw and bx < ax + aw and
             ay < by + bh and by < ay + ah)
 
 class App:
-    def __init__(self):
+    def __init__(self, args=None):
         pyxel.init(SCREEN_WIDTH, SCREEN_HEIGHT, title="bullet hell", fps=60)
         pyxel.mouse(True)
         pyxel.load("my_resource.pyxres")  # ← これを追加（spriteを使うなら必須）        
@@ -17,22 +19,53 @@ class App:
         self.game = None  # ← 最初はNoneにする
         self.menu_idx = 0
 
+        # 入力の記録／再生（--record / --replay）
+        self.record_path = args.record if args else None
+        self.replay = InputReplayer.load(args.replay) if args and args.replay else None
+        self.replay_speed = max(args.speed, 1) if args else 1
+        self.recorder = None
+        self.controls = None
+
+        if self.replay:
+            self.start_game(self.replay.level, self.replay)
+
         pyxel.run(self.update, self.draw)
 
 
     def update(self):
         if pyxel.btnp(pyxel.KEY_ESCAPE):
+            self.save_recording()
             pyxel.quit()
 
         if pyxel.btnp(pyxel.KEY_R):
             if self.scene == PLAY_SCENE:
+                self.save_recording()
                 self.scene = START_SCENE
                 pyxel.play(0, 0)
 
         if self.scene == START_SCENE:
             self.update_start_scene()
         elif self.scene == PLAY_SCENE and self.game:      # ← 追加
-            self.game.update()                            # ← 追加
+            # 再生時は1フレームに replay_speed 回進める（プロファイル用の早送り）
+            steps = self.replay_speed if self.controls is self.replay else 1
+            for _ in range(steps):
+                if self.controls:
+                    self.controls.next_frame()
+                self.game.update()                        # ← 追加
+                if self.replay and self.controls is self.replay and self.replay.finished:
+                    self.finish_replay()
+                    break
+
+    def save_recording(self):
+        if self.recorder and self.record_path:
+            self.recorder.save(self.record_path)
+            print(f"recorded {self.recorder.frames} frames to {self.record_path}")
+        self.recorder = None
+
+    def finish_replay(self):
+        print(f"replay finished: {self.replay.frame} frames, score {self.game.score}")
+        self.controls = None
+        self.scene = START_SCENE
 
 
     def draw(self):
@@ -72,9 +105,20 @@ class App:
                 self.start_game("HARD")
 
 
-    def start_game(self, level_name):
+    def start_game(self, level_name, replay=None):
+        self.save_recording()
+        if replay:
+            # 記録時と同じシード・入力で始める
+            replay.start()
+            self.controls = replay
+        elif self.record_path:
+            self.recorder = InputRecorder(level_name)
+            self.controls = self.recorder
+        else:
+            self.controls = None
+
         self.selected_level = LEVELS[level_name]
-        self.game = Game(self.selected_level)
+        self.game = Game(self.selected_level, self.controls)
         self.scene = PLAY_SCENE
 
 
@@ -98,9 +142,9 @@ class App:
         pyxel.text(100, 100, "END", 7)
 
 class Game:
-    def __init__(self, level_config):
+    def __init__(self, level_config, controls=None):
         self.level = level_config
-        self.player = Player()
+        self.player = Player(controls)
         self.enemies = []
         self.score = 0
         
@@ -321,7 +365,9 @@ class SpawnController:
 
 
 class Player:
-    def __init__(self):
+    def __init__(self, controls=None):
+        # btn(key) を持つ入力元。通常は pyxel、記録・再生時は input_replay のクラス
+        self.controls = controls or pyxel
         self.x = SCREEN_WIDTH / 2
         self.y = SCREEN_HEIGHT - 16
         self.speed = 1  # 少し上げてもOK
@@ -346,8 +392,9 @@ class Player:
         self.invincible_timer = 0  # いったん0秒（0fps）
 
     def update(self):
-        dx = (1 if pyxel.btn(pyxel.KEY_RIGHT) else 0) - (1 if pyxel.btn(pyxel.KEY_LEFT) else 0)
-        dy = (1 if pyxel.btn(pyxel.KEY_DOWN)  else 0) - (1 if pyxel.btn(pyxel.KEY_UP)   else 0)
+        btn = self.controls.btn
+        dx = (1 if btn(pyxel.KEY_RIGHT) else 0) - (1 if btn(pyxel.KEY_LEFT) else 0)
+        dy = (1 if btn(pyxel.KEY_DOWN)  else 0) - (1 if btn(pyxel.KEY_UP)   else 0)
 
         # 正規化（斜めでも等速）
         if dx or dy:
@@ -362,7 +409,7 @@ class Player:
         if self.cooldown > 0:
             self.cooldown -= 1
 
-        if pyxel.btn(pyxel.KEY_SPACE) and self.cooldown == 0:
+        if btn(pyxel.KEY_SPACE) and self.cooldown == 0:
             self.bullets.append(Player_Bullet(self.x, self.y))
             self.cooldown = COOL_DOWN
 
@@ -583,5 +630,12 @@ class CircularBurstPattern(BulletPattern):
         return bullets
 
 
-App()
+def parse_args():
+    parser = argparse.ArgumentParser(description="bullet hell")
+    parser.add_argument("--record", metavar="FILE", help="プレイ中の入力と乱数シードを記録する")
+    parser.add_argument("--replay", metavar="FILE", help="記録した入力を再生する")
+    parser.add_argument("--speed", type=int, default=1, help="再生時に1フレームで進めるupdate回数")
+    return parser.parse_args()
+
 
+App(parse_args())
@@ -0,0 +1,124 @@
+import pyxel
+from constants import *
+
+# 半径1の弾スプライトを置くイメージバンク（my_resource.pyxres では未使用）
+SPRITE_BANK = 2
+SPRITE_SIZE = 3  # 半径1の円 = 3x3
+
+
+CELL_SIZE = 16  # 隠れ判定の空間ハッシュのマスの大きさ(px)
+
+
+def _covers(x2, y2, r2, x1, y1, r1):
+    """(x2, y2, r2) の円が (x1, y1, r1) の円のピクセルをすべて覆うか
+
+    中心が同じなら半径が同じか大きければ覆う。中心が違う時は、円の塗りつぶしの
+    丸めで1ピクセルはみ出しても覆えるように、1ピクセルの余裕を見る。
+    """
+    if x1 == x2 and y1 == y2:
+        return r2 >= r1
+    dx = x1 - x2
+    dy = y1 - y2
+    room = r2 - r1 - 1
+    return room > 0 and dx * dx + dy * dy <= room * room
+
+
+class BulletRenderer:
+    """弾をまとめて描くレンダラ。
+
+    毎フレーム add() で弾を集め、draw() で集めた順(元の描画順)に描く。
+      - 画面外の弾は描かない
+      - 後から描く弾に完全に覆われる弾は描かない
+      - 半径1の弾は事前に描いておいたスプライトを pyxel.blt で貼る
+    draw_calls / skipped はデバッグ表示用。
+    """
+
+    def __init__(self):
+        self.bullets = []  # (x, y, 半径, 色) 画面内の弾を描く順に
+        self.bullet_count = 0
+        self.draw_calls = 0
+        self.skipped = 0
+        self._sprites_ready = False
+
+    def _prepare_sprites(self):
+        # 色ごとに半径1の円を (色 * 3, 0) に描いておく。背景は0（透明色）
+        img = pyxel.images[SPRITE_BANK]
+        img.rect(0, 0, SPRITE_SIZE * 16, SPRITE_SIZE, 0)
+        for col in range(1, 16):
+            img.circ(col * SPRITE_SIZE + 1, 1, 1, col)
+        self._sprites_ready = True
+
+    def begin(self):
+        self.bullets.clear()
+        self.bullet_count = 0
+
+    def add(self, bullets):
+        visible = self.bullets
+        count = 0
+        for bullet in bullets:
+            if not bullet.alive:
+                continue
+            count += 1
+            r = bullet.radius
+            x = int(bullet.x)
+            y = int(bullet.y)
+            if x + r < 0 or y + r < 0 or x - r >= SCREEN_WIDTH or y - r >= SCREEN_HEIGHT:
+                continue
+            visible.append((x, y, r, bullet.color))
+        self.bullet_count += count
+
+    def _hidden(self):
+        """後から描く弾に覆われる弾の番号の集合"""
+        bullets = self.bullets
+        hidden = set()
+        cells = {}  # (cx, cy) -> その中に中心がある、後から描く弾
+        max_r = 0
+        # 後ろから見ていき、それまでに見た(=後から描く)弾で覆われるかを調べる
+        for i in range(len(bullets) - 1, -1, -1):
+            x, y, r, col = bullets[i]
+            # 覆う弾の中心は (x, y) から max_r - r 以内にある
+            reach = max_r - r
+            found = False
+            if reach >= 0:
+                for cx in range((x - reach) // CELL_SIZE, (x + reach) // CELL_SIZE + 1):
+                    for cy in range((y - reach) // CELL_SIZE, (y + reach) // CELL_SIZE + 1):
+                        for x2, y2, r2 in cells.get((cx, cy), ()):
+                            if _covers(x2, y2, r2, x, y, r):
+                                found = True
+                                break
+                        if found:
+                            break
+                    if found:
+                        break
+            if found:
+                hidden.add(i)
+                continue
+            key = (x // CELL_SIZE, y // CELL_SIZE)
+            cell = cells.get(key)
+            if cell is None:
+                cell = cells[key] = []
+            cell.append((x, y, r))
+            if r > max_r:
+                max_r = r
+        return hidden
+
+    def draw(self):
+        if not self._sprites_ready:
+            self._prepare_sprites()
+
+        hidden = self._hidden()
+        calls = 0
+        blt = pyxel.blt
+        circ = pyxel.circ
+        for i, (x, y, r, col) in enumerate(self.bullets):
+            if i in hidden:
+                continue
+            if r == 1 and col != 0:
+                blt(x - 1, y - 1, SPRITE_BANK, col * SPRITE_SIZE, 0, SPRITE_SIZE, SPRITE_SIZE, 0)
+            else:
+                circ(x, y, r, col)
+            calls += 1
+
+        # 画面外に加えて、覆われて描かなかった弾も skipped に数える
+        self.skipped = self.bullet_count - calls
+        self.draw_calls = calls
@@ -0,0 +1,398 @@
+import json
+import math
+import os
+from constants import *
+from bullet_pattern import BulletBase
+from object_pool import ObjectPool
+
+# ---------------------------------------------------------------
+# BulletML風のデータ駆動弾幕エンジン
+#
+#  patterns.json に書いたパターンを起動時に一度だけ「バイトコード」
+#  （数値だけのフラットなタプル）へコンパイルし、
+#  BulletScriptEngine.update() の1本のループで全エミッタを実行する。
+#
+#  使えるアクション:
+#    {"fire": {"direction": {...}, "speed": {...}, "bullet": "名前"}}
+#    {"wait": フレーム数}
+#    {"repeat": {"times": 回数, "actions": [...]}}
+#    {"changeDirection": {"direction": {...}, "term": フレーム数}}
+#    {"changeSpeed": {"speed": {...}, "term": フレーム数}}
+#    {"vanish": true}
+#
+#  direction の type : absolute / aim / relative / sequence
+#  speed の type     : absolute / relative / sequence
+#  speed の値はエミッタの speed_scale（難易度ごとの弾速）に掛けて使う。
+# ---------------------------------------------------------------
+
+PATTERN_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "patterns.json")
+
+# オペコード
+OP_END = 0
+OP_LOOP = 1
+OP_WAIT = 2
+OP_FIRE = 3
+OP_REPEAT = 4
+OP_NEXT = 5
+OP_CHDIR = 6
+OP_CHSPD = 7
+OP_VANISH = 8
+
+# direction / speed の種類
+DIR_TYPES = {"absolute": 0, "aim": 1, "relative": 2, "sequence": 3}
+SPEED_TYPES = {"absolute": 0, "relative": 2, "sequence": 3}
+T_ABSOLUTE = 0
+T_AIM = 1
+T_RELATIVE = 2
+T_SEQUENCE = 3
+
+NO_BULLET = -1
+
+
+class PatternError(ValueError):
+    pass
+
+
+class PatternLibrary:
+    """コンパイル済みのプログラム一覧。
+
+    programs[i] が i 番目のバイトコード（タプル）。
+    patterns はメニューに出す敵用パターン名 → プログラム番号。
+    bullets は弾定義名 → プログラム番号（弾自身が動くプログラム）。
+    """
+
+    def __init__(self):
+        self.programs = []
+        self.patterns = {}
+        self.bullets = {}
+        self.labels = {}
+        self.colors = {}
+
+    @property
+    def names(self):
+        return list(self.patterns)
+
+    def program(self, name):
+        if name not in self.patterns:
+            raise PatternError(f"unknown pattern: {name}")
+        return self.programs[self.patterns[name]]
+
+
+def _parse_value(spec, types, default_type, where):
+    # 数値だけなら default_type 扱い
+    if spec is None:
+        return types[default_type], 0.0
+    if isinstance(spec, (int, float)):
+        return types[default_type], float(spec)
+    kind = spec.get("type", default_type)
+    if kind not in types:
+        raise PatternError(f"{where}: unknown type '{kind}'")
+    return types[kind], float(spec.get("value", 0))
+
+
+class _Compiler:
+    def __init__(self, data):
+        self.data = data
+        self.lib = PatternLibrary()
+        self.bullet_defs = data.get("bullets", {})
+
+    def compile(self):
+        # 弾定義の番号を先に確保しておく（相互参照・再帰参照のため）
+        for name in self.bullet_defs:
+            self.lib.bullets[name] = len(self.lib.programs)
+            self.lib.programs.append(None)
+        for name, body in self.bullet_defs.items():
+            code = []
+            self._actions(body.get("actions", []), code, f"bullets.{name}")
+            code.append(OP_END)
+            self.lib.programs[self.lib.bullets[name]] = tuple(code)
+
+        for name, body in self.data.get("patterns", {}).items():
+            code = []
+            self._actions(body.get("actions", []), code, f"patterns.{name}")
+            code.append(OP_LOOP if body.get("loop", True) else OP_END)
+            self.lib.patterns[name] = len(self.lib.programs)
+            self.lib.programs.append(tuple(code))
+            self.lib.labels[name] = body.get("label", name.upper())
+            self.lib.colors[name] = body.get("color", 7)
+        return self.lib
+
+    def _actions(self, actions, code, where):
+        for i, action in enumerate(actions):
+            self._action(action, code, f"{where}[{i}]")
+
+    def _action(self, action, code, where):
+        if len(action) != 1:
+            raise PatternError(f"{where}: one action per entry")
+        (op, arg), = action.items()
+
+        if op == "wait":
+            code += (OP_WAIT, max(int(arg), 1))
+        elif op == "fire":
+            # direction を省略したら自機狙い
+            d_type, d_value = _parse_value(arg.get("direction"), DIR_TYPES, "aim", where)
+            s_type, s_value = _parse_value(arg.get("speed", 1.0), SPEED_TYPES, "absolute", where)
+            bullet = arg.get("bullet")
+            radius, color, prog = 1, 10, NO_BULLET
+            if isinstance(bullet, str):
+                if bullet not in self.bullet_defs:
+                    raise PatternError(f"{where}: unknown bullet '{bullet}'")
+                body = self.bullet_defs[bullet]
+                radius = body.get("radius", radius)
+                color = body.get("color", color)
+                if body.get("actions"):
+                    prog = self.lib.bullets[bullet]
+            elif isinstance(bullet, dict):
+                radius = bullet.get("radius", radius)
+                color = bullet.get("color", color)
+            code += (OP_FIRE, d_type, d_value, s_type, s_value, prog, color, radius)
+        elif op == "repeat":
+            times = int(arg.get("times", 1))
+            if times <= 0:
+                raise PatternError(f"{where}: repeat times must be positive")
+            code += (OP_REPEAT, times)
+            start = len(code)
+            self._actions(arg.get("actions", []), code, f"{where}.repeat")
+            code += (OP_NEXT, start)
+        elif op == "changeDirection":
+            d_type, d_value = _parse_value(arg.get("direction"), DIR_TYPES, "absolute", where)
+            code += (OP_CHDIR, d_type, d_value, max(int(arg.get("term", 1)), 1))
+        elif op == "changeSpeed":
+            s_type, s_value = _parse_value(arg.get("speed"), SPEED_TYPES, "absolute", where)
+            code += (OP_CHSPD, s_type, s_value, max(int(arg.get("term", 1)), 1))
+        elif op == "vanish":
+            code.append(OP_VANISH)
+        else:
+            raise PatternError(f"{where}: unknown action '{op}'")
+
+
+def compile_patterns(data):
+    """JSON（dict）をバイトコードにコンパイルして PatternLibrary を返す。"""
+    return _Compiler(data).compile()
+
+
+def load_patterns(path=PATTERN_FILE):
+    with open(path, encoding="utf-8") as f:
+        return compile_patterns(json.load(f))
+
+
+class ScriptBullet(BulletBase):
+    """スクリプトから撃たれる弾。向きと速さはエミッタが書き換える。
+
+    bullet_pool で使い回すので、初期化は reset() にまとめてある。
+    """
+
+    def __init__(self, x, y, direction, speed, radius=1, color=10):
+        self.reset(x, y, direction, speed, radius, color)
+
+    def reset(self, x, y, direction, speed, radius=1, color=10):
+        ang = math.radians(direction)
+        BulletBase.__init__(self, x, y, math.cos(ang), math.sin(ang), speed=speed,
+                            radius=radius, color=color)
+        self.emitter = None  # プログラムを持つ弾なら自分のエミッタ
+
+
+bullet_pool = ObjectPool(ScriptBullet, "bullets")
+
+
+def release_bullet(bullet):
+    """弾をプールに返す。弾のプログラムも止める。"""
+    bullet.alive = False
+    if bullet.emitter is not None:
+        bullet.emitter.owner = None
+        bullet.emitter = None
+    bullet_pool.release(bullet)
+
+
+class Emitter:
+    __slots__ = ("owner", "ox", "oy", "sink", "code", "pc", "wait", "stack",
+                 "direction", "speed", "last_dir", "last_speed", "speed_scale",
+                 "dir_delta", "dir_frames", "speed_delta", "speed_frames",
+                 "moves")
+
+    def __init__(self, code, owner, sink, speed_scale, ox=0, oy=0,
+                 direction=90.0, speed=1.0, moves=False):
+        self.owner = owner      # x, y, alive を持つもの（Enemy か ScriptBullet）。None なら停止
+        self.ox = ox            # 発射位置のオフセット
+        self.oy = oy
+        self.sink = sink        # 生成した弾を追加するリスト
+        self.code = code
+        self.pc = 0
+        self.wait = 0
+        self.stack = []         # repeat の残り回数
+        self.direction = direction
+        self.speed = speed
+        self.last_dir = direction
+        self.last_speed = speed
+        self.speed_scale = speed_scale
+        self.dir_delta = 0.0
+        self.dir_frames = 0
+        self.speed_delta = 0.0
+        self.speed_frames = 0
+        self.moves = moves      # True なら direction/speed を owner の速度に反映
+
+
+class BulletScriptEngine:
+    """全エミッタを1本のループで実行するインタプリタ。"""
+
+    def __init__(self, library):
+        self.library = library
+        self.emitters = []
+
+    def spawn(self, name, owner, sink, speed_scale, ox=0, oy=0):
+        emitter = Emitter(self.library.program(name), owner, sink, speed_scale, ox, oy)
+        self.emitters.append(emitter)
+        return emitter
+
+    def stop(self, emitter):
+        # owner がプールに戻るときに呼ぶ。次の update で外れる
+        if emitter is not None:
+            emitter.owner = None
+
+    def clear(self):
+        self.emitters.clear()
+
+    def update(self, target_x, target_y):
+        programs = self.library.programs
+        radians = math.radians
+        degrees = math.degrees
+        cos = math.cos
+        sin = math.sin
+        atan2 = math.atan2
+        acquire = bullet_pool.acquire
+        spawned = []
+        live = []
+
+        # 止まったエミッタを先に外しておく。ループ中にプールから再利用された弾を
+        # 古いエミッタが動かしてしまわないようにするため
+        emitters = [em for em in self.emitters if em.owner is not None and em.owner.alive]
+
+        for em in emitters:
+            owner = em.owner
+
+            # changeDirection / changeSpeed は待ち時間中も並行して進む
+            changed = False
+            if em.dir_frames > 0:
+                em.direction += em.dir_delta
+                em.dir_frames -= 1
+                changed = True
+            if em.speed_frames > 0:
+                em.speed += em.speed_delta
+                em.speed_frames -= 1
+                changed = True
+            if changed and em.moves:
+                ang = radians(em.direction)
+                owner.vx = cos(ang) * em.speed * em.speed_scale
+                owner.vy = sin(ang) * em.speed * em.speed_scale
+
+            if em.wait > 0:
+                em.wait -= 1
+                live.append(em)
+                continue
+
+            code = em.code
+            pc = em.pc
+            while True:
+                op = code[pc]
+                if op == OP_WAIT:
+                    em.wait = code[pc + 1] - 1
+                    pc += 2
+                    break
+                elif op == OP_FIRE:
+                    x = owner.x + em.ox
+                    y = owner.y + em.oy
+                    d_type = code[pc + 1]
+                    d_value = code[pc + 2]
+                    if d_type == T_AIM:
+                        d = degrees(atan2(target_y - y, target_x - x)) + d_value
+                    elif d_type == T_RELATIVE:
+                        d = em.direction + d_value
+                    elif d_type == T_SEQUENCE:
+                        d = em.last_dir + d_value
+                    else:
+                        d = d_value
+                    s_type = code[pc + 3]
+                    s_value = code[pc + 4]
+                    if s_type == T_RELATIVE:
+                        s = em.speed + s_value
+                    elif s_type == T_SEQUENCE:
+                        s = em.last_speed + s_value
+                    else:
+                        s = s_value
+                    em.last_dir = d % 360
+                    em.last_speed = s
+                    prog = code[pc + 5]
+                    bullet = acquire(x, y, d, s * em.speed_scale, code[pc + 7], code[pc + 6])
+                    em.sink.append(bullet)
+                    if prog != NO_BULLET:
+                        bullet.emitter = Emitter(programs[prog], bullet, em.sink,
+                                                 em.speed_scale, direction=d,
+                                                 speed=s, moves=True)
+                        spawned.append(bullet.emitter)
+                    pc += 8
+                elif op == OP_REPEAT:
+                    em.stack.append(code[pc + 1])
+                    pc += 2
+                elif op == OP_NEXT:
+                    em.stack[-1] -= 1
+                    if em.stack[-1] > 0:
+                        pc = code[pc + 1]
+                    else:
+                        em.stack.pop()
+                        pc += 2
+                elif op == OP_CHDIR:
+                    d_type = code[pc + 1]
+                    d_value = code[pc + 2]
+                    term = code[pc + 3]
+                    if d_type == T_SEQUENCE:
+                        em.dir_delta = d_value
+                    else:
+                        if d_type == T_AIM:
+                            x = owner.x + em.ox
+                            y = owner.y + em.oy
+                            goal = degrees(atan2(target_y - y, target_x - x)) + d_value
+                        elif d_type == T_RELATIVE:
+                            goal = em.direction + d_value
+                        else:
+                            goal = d_value
+                        # 近い方向に回る
+                        diff = (goal - em.direction + 180) % 360 - 180
+                        em.dir_delta = diff / term
+                    em.dir_frames = term
+                    pc += 4
+                elif op == OP_CHSPD:
+                    s_type = code[pc + 1]
+                    s_value = code[pc + 2]
+                    term = code[pc + 3]
+                    if s_type == T_SEQUENCE:
+                        em.speed_delta = s_value
+                    elif s_type == T_RELATIVE:
+                        em.speed_delta = s_value / term
+                    else:
+                        em.speed_delta = (s_value - em.speed) / term
+                    em.speed_frames = term
+                    pc += 4
+                elif op == OP_VANISH:
+                    owner.alive = False
+                    pc = -1
+                    break
+                elif op == OP_LOOP:
+                    pc = 0
+                    # wait の無いループで固まらないよう1フレームに1周まで
+                    break
+                else:  # OP_END
+                    pc = -1
+                    break
+
+            if pc < 0:
+                # プログラム終了。動きの変化だけ残っていれば継続
+                if owner.alive and (em.dir_frames > 0 or em.speed_frames > 0):
+                    em.code = (OP_END,)
+                    em.pc = 0
+                    live.append(em)
+                continue
+            em.pc = pc
+            live.append(em)
+
+        live.extend(spawned)
+        self.emitters = live
@@ -0,0 +1,169 @@
+"""bullet_hell_v2 をウィンドウ無しで最高速で回すベンチマーク。
+
+    python headless.py --frames 3600 --seed 1
+    python headless.py --level HARD --pattern splitting --input keys.json
+    python headless.py --replay worst_case.bhr
+
+--replay には main_1.py --record で記録したファイルを渡す。
+記録時の難易度・パターン・乱数シードで最高速で再生する。
+
+描画は一切呼ばず、Game.UPDATE_STEPS の単位（player / enemies /
+bullets / collisions）ごとに update 時間のパーセンタイルと、
+LEVELS の各難易度での最大同時弾数を表示する。
+"""
+import argparse
+import json
+import random
+import time
+
+import pyxel
+
+import main_1
+from bullet_script import load_patterns
+from constants import LEVELS
+from input_replay import InputReplayer
+from object_pool import GCMonitor
+
+KEYS = {
+    "LEFT": pyxel.KEY_LEFT,
+    "RIGHT": pyxel.KEY_RIGHT,
+    "UP": pyxel.KEY_UP,
+    "DOWN": pyxel.KEY_DOWN,
+    "SPACE": pyxel.KEY_SPACE,
+}
+
+PERCENTILES = (50, 90, 99)
+
+
+class ScriptedInput:
+    """frame -> 押しているキー の関数で入力を作る。"""
+
+    def __init__(self, script):
+        self.script = script
+        self.frame = 0
+        self.pressed = set()
+
+    def next_frame(self):
+        self.pressed = set(self.script(self.frame))
+        self.frame += 1
+
+    def btn(self, key):
+        return key in self.pressed
+
+
+class SequenceInput(ScriptedInput):
+    """記録済みのキー列（1フレーム1要素）を再生する。尽きたら何も押さない。"""
+
+    def __init__(self, frames):
+        super().__init__(lambda f: frames[f] if f < len(frames) else ())
+
+
+def sway_script(frame):
+    # 撃ちっぱなしで左右にゆっくり往復する
+    keys = [pyxel.KEY_SPACE]
+    keys.append(pyxel.KEY_LEFT if (frame // 90) % 2 else pyxel.KEY_RIGHT)
+    return keys
+
+
+def load_key_file(path):
+    # [["LEFT", "SPACE"], [], ["RIGHT"], ...] 形式の JSON
+    with open(path, encoding="utf-8") as f:
+        return [[KEYS[name] for name in keys] for keys in json.load(f)]
+
+
+def percentile(sorted_values, p):
+    if not sorted_values:
+        return 0.0
+    k = max(0, min(len(sorted_values) - 1, round(p / 100 * len(sorted_values)) - 1))
+    return sorted_values[k]
+
+
+def run(level_name, pattern, frames, seed, controls, patterns=None):
+    """Game を frames フレーム回し、計測結果を dict で返す。"""
+    random.seed(seed)
+    main_1.SOUND_ENABLED = False
+    for pool in main_1.POOLS:
+        pool.reset_stats()
+    gc_monitor = GCMonitor()
+    gc_monitor.start()
+
+    game = main_1.Game(LEVELS[level_name], pattern, patterns, controls=controls)
+    steps = [(name, getattr(game, method)) for name, method in game.UPDATE_STEPS]
+    times = {name: [] for name, _ in steps}
+    totals = []
+    peak_bullets = 0
+    clock = time.perf_counter
+
+    for _ in range(frames):
+        controls.next_frame()
+        frame_start = clock()
+        t = frame_start
+        for name, step in steps:
+            step()
+            now = clock()
+            times[name].append(now - t)
+            t = now
+        totals.append(t - frame_start)
+        peak_bullets = max(peak_bullets, game.live_bullet_count())
+
+    gc_monitor.stop()
+    pools = [pool.summary() for pool in main_1.POOLS]
+    game.close()
+
+    return {
+        "level": level_name,
+        "pattern": pattern,
+        "frames": frames,
+        "times": times,
+        "total": totals,
+        "peak_bullets": peak_bullets,
+        "score": game.score,
+        "hp": game.player.hp,
+        "pools": pools,
+        "gc": gc_monitor.summary(),
+    }
+
+
+def print_report(result):
+    print(f"[{result['level']} / {result['pattern']}] frames={result['frames']} "
+          f"peak_bullets={result['peak_bullets']} score={result['score']} hp={result['hp']}")
+    header = "  {:<11}".format("step") + "".join(f"{'p' + str(p):>10}" for p in PERCENTILES) + f"{'max':>10}"
+    print(header + "   (usec)")
+    rows = list(result["times"].items()) + [("total", result["total"])]
+    for name, values in rows:
+        values = sorted(values)
+        cols = [percentile(values, p) for p in PERCENTILES] + [values[-1] if values else 0.0]
+        print("  {:<11}".format(name) + "".join(f"{v * 1e6:>10.1f}" for v in cols))
+    for line in result["pools"] + [result["gc"]]:
+        print("  " + line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="bullet_hell_v2 headless benchmark")
+    parser.add_argument("--frames", type=int, default=3600, help="--replay 時は 0 で全フレーム")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--level", choices=list(LEVELS), help="省略時は全難易度")
+    parser.add_argument("--pattern", help="省略時は patterns.json の全パターン")
+    parser.add_argument("--input", help="キー入力列の JSON（省略時は左右往復スクリプト）")
+    parser.add_argument("--replay", help="main_1.py --record で記録したファイル")
+    args = parser.parse_args()
+
+    patterns = load_patterns()
+    if args.replay:
+        replay = InputReplayer.load(args.replay)
+        frames = min(args.frames, len(replay.masks)) if args.frames else len(replay.masks)
+        print_report(run(replay.level, replay.pattern, frames, replay.seed, replay, patterns))
+        return
+
+    levels = [args.level] if args.level else list(LEVELS)
+    pattern_names = [args.pattern] if args.pattern else patterns.names
+    recorded = load_key_file(args.input) if args.input else None
+
+    for level_name in levels:
+        for pattern in pattern_names:
+            controls = SequenceInput(recorded) if recorded else ScriptedInput(sway_script)
+            print_report(run(level_name, pattern, args.frames, args.seed, controls, patterns))
+
+
+if __name__ == "__main__":
+    main()
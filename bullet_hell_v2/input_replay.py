@@ -0,0 +1,153 @@
+import random
+import struct
+
+import pyxel
+
+# ---------------------------------------------------------------
+# 入力の記録と再生
+#
+#  InputRecorder はフレームごとの pyxel.btn の状態を記録し、
+#  InputReplayer はそれをそのまま返す。どちらも btn(key) と
+#  next_frame() を持つので Player の入力元（controls）として差し替えられる。
+#
+#  ファイル形式（リトルエンディアン）:
+#    magic "BHRP", version(u8), seed(u64), frames(u32),
+#    level(u16長さ+utf-8), pattern(u16長さ+utf-8),
+#    以降は (キーのビットマスク u8, 連続フレーム数 u16) の繰り返し
+# ---------------------------------------------------------------
+
+MAGIC = b"BHRP"
+VERSION = 1
+
+# 記録するキー（ビット番号順）
+KEYS = (
+    pyxel.KEY_LEFT,
+    pyxel.KEY_RIGHT,
+    pyxel.KEY_UP,
+    pyxel.KEY_DOWN,
+    pyxel.KEY_SPACE,
+)
+KEY_BITS = {key: 1 << i for i, key in enumerate(KEYS)}
+
+MAX_RUN = 0xFFFF
+
+
+def new_seed():
+    return random.SystemRandom().randrange(1 << 63)
+
+
+def _pack_str(text):
+    data = text.encode("utf-8")
+    return struct.pack("<H", len(data)) + data
+
+
+def _unpack_str(buf, pos):
+    (n,) = struct.unpack_from("<H", buf, pos)
+    pos += 2
+    return buf[pos:pos + n].decode("utf-8"), pos + n
+
+
+class InputRecorder:
+    """実際の pyxel.btn を読みつつ、その結果を記録する。"""
+
+    def __init__(self, level="", pattern="", seed=None, source=pyxel):
+        self.seed = new_seed() if seed is None else seed
+        self.level = level
+        self.pattern = pattern
+        self.source = source
+        self.mask = 0
+        self.masks = bytearray()
+        random.seed(self.seed)
+
+    def next_frame(self):
+        btn = self.source.btn
+        mask = 0
+        for key, bit in KEY_BITS.items():
+            if btn(key):
+                mask |= bit
+        self.mask = mask
+        self.masks.append(mask)
+
+    def btn(self, key):
+        return bool(self.mask & KEY_BITS.get(key, 0))
+
+    @property
+    def frames(self):
+        return len(self.masks)
+
+    def to_bytes(self):
+        out = bytearray(MAGIC)
+        out += struct.pack("<BQI", VERSION, self.seed, len(self.masks))
+        out += _pack_str(self.level)
+        out += _pack_str(self.pattern)
+        # 同じ入力が続くことが多いのでランレングスで詰める
+        i = 0
+        masks = self.masks
+        while i < len(masks):
+            mask = masks[i]
+            run = 1
+            while i + run < len(masks) and masks[i + run] == mask and run < MAX_RUN:
+                run += 1
+            out += struct.pack("<BH", mask, run)
+            i += run
+        return bytes(out)
+
+    def save(self, path):
+        with open(path, "wb") as f:
+            f.write(self.to_bytes())
+
+
+class InputReplayer:
+    """記録したファイルの入力をフレームごとに返す。"""
+
+    def __init__(self, masks, seed, level="", pattern=""):
+        self.masks = masks
+        self.seed = seed
+        self.level = level
+        self.pattern = pattern
+        self.frame = 0
+        self.mask = 0
+
+    @classmethod
+    def from_bytes(cls, buf):
+        if buf[:4] != MAGIC:
+            raise ValueError("not a replay file")
+        version, seed, frames = struct.unpack_from("<BQI", buf, 4)
+        if version != VERSION:
+            raise ValueError(f"unsupported replay version: {version}")
+        pos = 4 + struct.calcsize("<BQI")
+        level, pos = _unpack_str(buf, pos)
+        pattern, pos = _unpack_str(buf, pos)
+        masks = bytearray()
+        while pos < len(buf):
+            mask, run = struct.unpack_from("<BH", buf, pos)
+            masks += bytes((mask,)) * run
+            pos += 3
+        if len(masks) != frames:
+            raise ValueError("replay file is truncated")
+        return cls(masks, seed, level, pattern)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            return cls.from_bytes(f.read())
+
+    def start(self):
+        # 記録時と同じ乱数列で始める
+        self.frame = 0
+        self.mask = 0
+        random.seed(self.seed)
+
+    @property
+    def finished(self):
+        return self.frame >= len(self.masks)
+
+    def next_frame(self):
+        if self.frame < len(self.masks):
+            self.mask = self.masks[self.frame]
+        else:
+            self.mask = 0
+        self.frame += 1
+
+    def btn(self, key):
+        return bool(self.mask & KEY_BITS.get(key, 0))
@@ -1,7 +1,21 @@
+import argparse
 import math
 import pyxel
 from constants import *
 from bullet_pattern import *
+from bullet_script import BulletScriptEngine, bullet_pool, load_patterns, release_bullet
+from object_pool import GCMonitor, ObjectPool
+from bullet_renderer import BulletRenderer
+from input_replay import InputRecorder, InputReplayer
+
+
+# ヘッドレス実行（headless.py）では False にして効果音を鳴らさない
+SOUND_ENABLED = True
+
+
+def play_sound(ch, snd):
+    if SOUND_ENABLED:
+        pyxel.play(ch, snd)
 
 
 def rects_intersect(ax, ay, aw, ah, bx, by, bw, bh):
@@ -9,7 +23,7 @@ def rects_intersect(ax, ay, aw, ah, bx, by, bw, bh):
             ay < by + bh and by < ay + ah)
 
 class App:
-    def __init__(self):
+    def __init__(self, args=None):
         pyxel.init(SCREEN_WIDTH, SCREEN_HEIGHT, title="bullet hell", fps=60)
         pyxel.mouse(True)
         pyxel.load("my_resource.pyxres")
@@ -20,21 +34,65 @@ class App:
         self.game = None
         self.menu_idx = 0
 
+        # 弾パターンは patterns.json から起動時に一度だけコンパイル
+        self.patterns = load_patterns()
+        self.pattern_names = self.patterns.names
+
+        # 入力の記録／再生（--record / --replay）
+        self.record_path = args.record if args else None
+        self.replay = InputReplayer.load(args.replay) if args and args.replay else None
+        self.replay_speed = max(args.speed, 1) if args else 1
+        self.recorder = None
+        self.controls = None
+
+        # GC の回数・停止時間を数える（F1 のデバッグ表示に出す）
+        gc_monitor.start()
+
+        if self.replay:
+            self.start_game(LEVELS[self.replay.level], self.replay.pattern, self.replay)
+
         pyxel.run(self.update, self.draw)
 
     def update(self):
         if pyxel.btnp(pyxel.KEY_ESCAPE):
+            self.save_recording()
             pyxel.quit()
 
         if pyxel.btnp(pyxel.KEY_R):
             if self.scene == PLAY_SCENE:
+                self.save_recording()
+                self.game.close()
                 self.scene = START_SCENE
                 pyxel.play(0, 0)
 
+        # F1 でデバッグ表示（描画コール数など）を切り替え
+        if pyxel.btnp(pyxel.KEY_F1) and self.game:
+            self.game.debug = not self.game.debug
+
         if self.scene == START_SCENE:
             self.update_start_scene()
         elif self.scene == PLAY_SCENE and self.game:
-            self.game.update()
+            # 再生時は1フレームに replay_speed 回進める（プロファイル用の早送り）
+            steps = self.replay_speed if self.controls is self.replay else 1
+            for _ in range(steps):
+                if self.controls:
+                    self.controls.next_frame()
+                self.game.update()
+                if self.replay and self.controls is self.replay and self.replay.finished:
+                    self.finish_replay()
+                    break
+
+    def save_recording(self):
+        if self.recorder and self.record_path:
+            self.recorder.save(self.record_path)
+            print(f"recorded {self.recorder.frames} frames to {self.record_path}")
+        self.recorder = None
+
+    def finish_replay(self):
+        print(f"replay finished: {self.replay.frame} frames, score {self.game.score}")
+        self.game.close()
+        self.controls = None
+        self.scene = START_SCENE
 
     def draw(self):
         if self.scene == START_SCENE:
@@ -45,19 +103,21 @@ class App:
             self.draw_end_scene()
             
     def update_start_scene(self):
+        menu_count = 3 + len(self.pattern_names)
+
         # キーボード操作（上下＋決定）
         if pyxel.btnp(pyxel.KEY_UP):
-            self.menu_idx = (self.menu_idx - 1) % 6
+            self.menu_idx = (self.menu_idx - 1) % menu_count
             pyxel.play(0, 0)
         if pyxel.btnp(pyxel.KEY_DOWN):
-            self.menu_idx = (self.menu_idx + 1) % 6
+            self.menu_idx = (self.menu_idx + 1) % menu_count
             pyxel.play(0, 0)
         if pyxel.btnp(pyxel.KEY_SPACE) or pyxel.btnp(pyxel.KEY_RETURN):
             if self.menu_idx < 3:  # 難易度選択
                 level_name = ("EASY", "NORMAL", "HARD")[self.menu_idx]
                 self.selected_level = LEVELS[level_name]
             else:  # 弾パターン選択
-                self.selected_bullet_pattern = ("circular", "aimed", "splitting")[self.menu_idx - 3]
+                self.selected_bullet_pattern = self.pattern_names[self.menu_idx - 3]
             
             # 両方選択されたらゲーム開始
             if self.selected_level is not None and self.selected_bullet_pattern is not None:
@@ -74,19 +134,29 @@ class App:
                     self.selected_level = LEVELS["NORMAL"]
                 elif 90 <= my <= 100:
                     self.selected_level = LEVELS["HARD"]
-                elif 140 <= my <= 150:
-                    self.selected_bullet_pattern = "circular"
-                elif 160 <= my <= 170:
-                    self.selected_bullet_pattern = "aimed"
-                elif 180 <= my <= 190:
-                    self.selected_bullet_pattern = "splitting"
+                elif my >= 140 and (my - 140) % 20 <= 10:
+                    i = (my - 140) // 20
+                    if i < len(self.pattern_names):
+                        self.selected_bullet_pattern = self.pattern_names[i]
                 
                 # 両方選択されたらゲーム開始
                 if self.selected_level is not None and self.selected_bullet_pattern is not None:
                     self.start_game(self.selected_level, self.selected_bullet_pattern)
 
-    def start_game(self, level_config, bullet_pattern):
-        self.game = Game(level_config, bullet_pattern)
+    def start_game(self, level_config, bullet_pattern, replay=None):
+        self.save_recording()
+        if replay:
+            # 記録時と同じシード・入力で始める
+            replay.start()
+            self.controls = replay
+        elif self.record_path:
+            level_name = next(name for name, cfg in LEVELS.items() if cfg is level_config)
+            self.recorder = InputRecorder(level_name, bullet_pattern)
+            self.controls = self.recorder
+        else:
+            self.controls = None
+
+        self.game = Game(level_config, bullet_pattern, self.patterns, self.controls)
         self.scene = PLAY_SCENE
 
     def draw_start_scene(self):
@@ -110,15 +180,14 @@ class App:
         # 弾パターン選択
         pyxel.text(96, 120, "SELECT BULLET", 7)
         
-        bullet_items = [("CIRCULAR", 11), ("AIMED", 10), ("SPLITTING", 14)]
-        bullet_ys = [140, 160, 180]
-        
-        for i, ((label, col), y) in enumerate(zip(bullet_items, bullet_ys)):
+        for i, pattern_name in enumerate(self.pattern_names):
+            y = 140 + i * 20
+            label = self.patterns.labels[pattern_name]
+            col = self.patterns.colors[pattern_name]
             if i + 3 == self.menu_idx:
                 pyxel.rect(92, y - 2, 80, 12, 1)
                 pyxel.text(92, y, ">", 7)
             # 選択済みの場合は色を変更
-            pattern_name = ("circular", "aimed", "splitting")[i]
             if self.selected_bullet_pattern == pattern_name:
                 pyxel.text(100, y, label, 14)  # 選択済みは別の色
             else:
@@ -129,12 +198,19 @@ class App:
         pyxel.text(100, 100, "END", 7)
 
 class Game:
-    def __init__(self, level_config, bullet_pattern="circular"):
+    def __init__(self, level_config, bullet_pattern="circular", patterns=None, controls=None):
         self.level = level_config
-        self.player = Player()
+        self.player = Player(controls)
         self.enemies = []
         self.score = 0
         self.bullet_pattern_type = bullet_pattern
+
+        # 全敵の弾幕を1本のループで動かすインタプリタ
+        self.bullet_script = BulletScriptEngine(patterns or load_patterns())
+
+        # 弾は半径・色ごとにまとめて描く
+        self.bullet_renderer = BulletRenderer()
+        self.debug = False
         
         # 初期敵を生成
         self.spawn_initial_enemies()
@@ -148,31 +224,79 @@ class Game:
         
         for i in range(enemy_count):
             x = spacing * (i + 1) + enemy_width * i
-            enemy = Enemy(bullet_speed=self.level.get("ENEMY_BULLET_SPEED", 0.2))
+            enemy = enemy_pool.acquire(bullet_speed=self.level.get("ENEMY_BULLET_SPEED", 0.2))
             enemy.set_target(x, TARGET_Y)
             enemy.pattern_type = self.bullet_pattern_type
             enemy.player = self.player  # プレイヤー参照を設定
+            enemy.emitter = self.bullet_script.spawn(self.bullet_pattern_type, enemy, enemy.bullets,
+                                                     enemy.bullet_speed, ox=4, oy=8)
             self.enemies.append(enemy)
     
+    # update の処理順（ヘッドレス計測ではこの単位で時間を測る）
+    UPDATE_STEPS = (
+        ("player", "update_player"),
+        ("enemies", "update_enemies"),
+        ("bullets", "update_bullets"),
+        ("collisions", "update_collisions"),
+    )
+
     def update(self):
+        self.update_player()
+        self.update_enemies()
+        self.update_bullets()
+        self.update_collisions()
+
+    def update_player(self):
         self.player.update()
 
+    def update_enemies(self):
         for enemy in self.enemies[:]:
             if enemy.alive:
                 enemy.update()
             else:
                 self.enemies.remove(enemy)
+                self.release_enemy(enemy)
                 self.score += 100
 
         if len(self.enemies) == 0:
             self.spawn_initial_enemies()
 
+    def release_enemy(self, enemy):
+        # 敵と、その敵が撃った弾をまとめてプールに返す
+        for bullet in enemy.bullets:
+            release_bullet(bullet)
+        enemy.bullets.clear()
+        self.bullet_script.stop(enemy.emitter)
+        enemy.emitter = None
+        enemy_pool.release(enemy)
+
+    def close(self):
+        """ゲーム終了時に使っていたオブジェクトをすべてプールに返す。"""
+        for enemy in self.enemies:
+            self.release_enemy(enemy)
+        self.enemies.clear()
+        for bullet in self.player.bullets:
+            player_bullet_pool.release(bullet)
+        self.player.bullets.clear()
+        self.bullet_script.clear()
+
+    def update_bullets(self):
+        for enemy in self.enemies:
+            enemy.update_bullets()
+
+        # 弾幕スクリプトの実行（倒された敵のエミッタはここで外れる）
+        self.bullet_script.update(self.player.x + 4, self.player.y + 4)
+
+    def update_collisions(self):
         # プレイヤーの弾と敵の当たり判定
         self.check_bullet_enemy_collisions()
         
         # 敵の弾とプレイヤーの当たり判定
         self.check_enemy_bullet_player_collisions()
 
+    def live_bullet_count(self):
+        return sum(len(enemy.bullets) for enemy in self.enemies)
+
     def check_enemy_bullet_player_collisions(self):
         # プレイヤーの当たり判定サイズ
         player_size = 7
@@ -186,6 +310,7 @@ class Game:
                 if self.check_bullet_player_collision(bullet, player_size):
                     self.player.take_damage(1)
                     enemy.bullets.remove(bullet)
+                    release_bullet(bullet)  # 分裂前の弾のエミッタも止まる
             
             # 分裂弾の子弾もチェック
             for bullet in enemy.bullets[:]:
@@ -231,6 +356,7 @@ class Game:
         for bullet in self.player.bullets[:]:
             if not bullet.alive:
                 self.player.bullets.remove(bullet)
+                player_bullet_pool.release(bullet)
                 continue
                 
             # 弾の現在位置を保存
@@ -280,8 +406,9 @@ class Game:
             # 衝突処理
             if collision and hit_enemy:
                 hit_enemy.take_damage(1)
-                pyxel.play(1, 2)
+                play_sound(1, 2)
                 self.player.bullets.remove(bullet)
+                player_bullet_pool.release(bullet)
             else:
                 bullet.x = target_x
                 bullet.y = target_y
@@ -311,8 +438,35 @@ class Game:
         for enemy in self.enemies:
             enemy.draw()
 
+        # 自機弾・敵弾をまとめて描画
+        renderer = self.bullet_renderer
+        renderer.begin()
+        renderer.add(self.player.bullets)
+        for enemy in self.enemies:
+            if enemy.alive:
+                renderer.add(enemy.bullets)
+        renderer.draw()
+
+        if self.debug:
+            self.draw_debug()
+
+    def draw_debug(self):
+        renderer = self.bullet_renderer
+        pyxel.text(10, 40, f"BULLETS: {renderer.bullet_count}", 7)
+        pyxel.text(10, 48, f"DRAW CALLS: {renderer.draw_calls}", 7)
+        pyxel.text(10, 56, f"SKIPPED: {renderer.skipped}", 7)
+        for i, pool in enumerate(POOLS):
+            pyxel.text(10, 68 + i * 8,
+                       f"{pool.name.upper()}: {pool.in_use}/{pool.in_use + len(pool.free)}"
+                       f" REUSE {pool.reuse_rate:.0%}", 7)
+        y = 68 + len(POOLS) * 8
+        pyxel.text(10, y, f"GC: {sum(gc_monitor.collections)} "
+                          f"MAX {gc_monitor.max_pause * 1000:.2f}MS", 7)
+
 class Player:
-    def __init__(self):
+    def __init__(self, controls=None):
+        # btn(key) を持つ入力元。通常は pyxel そのもの、ヘッドレス時はスクリプト入力
+        self.controls = controls or pyxel
         self.x = SCREEN_WIDTH / 2
         self.y = SCREEN_HEIGHT - 16
         self.speed = 1
@@ -331,7 +485,7 @@ class Player:
             self.hp = 0
 
         # ヒット時の効果音
-        pyxel.play(1, 1)
+        play_sound(1, 1)
         
         # ヒットエフェクト用
         self.hit_effect = 20
@@ -340,8 +494,9 @@ class Player:
         self.invincible_timer = 0  # 60フレーム = 1秒
 
     def update(self):
-        dx = (1 if pyxel.btn(pyxel.KEY_RIGHT) else 0) - (1 if pyxel.btn(pyxel.KEY_LEFT) else 0)
-        dy = (1 if pyxel.btn(pyxel.KEY_DOWN)  else 0) - (1 if pyxel.btn(pyxel.KEY_UP)   else 0)
+        btn = self.controls.btn
+        dx = (1 if btn(pyxel.KEY_RIGHT) else 0) - (1 if btn(pyxel.KEY_LEFT) else 0)
+        dy = (1 if btn(pyxel.KEY_DOWN)  else 0) - (1 if btn(pyxel.KEY_UP)   else 0)
 
         # 正規化（斜めでも等速）
         if dx or dy:
@@ -356,8 +511,8 @@ class Player:
         if self.cooldown > 0:
             self.cooldown -= 1
 
-        if pyxel.btn(pyxel.KEY_SPACE) and self.cooldown == 0:
-            self.bullets.append(Player_Bullet(self.x, self.y))
+        if btn(pyxel.KEY_SPACE) and self.cooldown == 0:
+            self.bullets.append(player_bullet_pool.acquire(self.x, self.y))
             self.cooldown = COOL_DOWN
 
         # 弾の更新
@@ -365,6 +520,7 @@ class Player:
             bullet.update()
             if not bullet.alive:
                 self.bullets.remove(bullet)
+                player_bullet_pool.release(bullet)
 
         # 無敵時間の更新
         if self.invincible_timer > 0:
@@ -386,13 +542,16 @@ class Player:
         # ヒットエフェクト
         if self.hit_effect > 0:
             pyxel.circb(int(self.x) + 4, int(self.y) + 4, self.hit_effect // 2, 8)
-        
-        # 弾を描画
-        for bullet in self.bullets:
-            bullet.draw()
+        # 弾は Game.draw で BulletRenderer がまとめて描く
 
 class Enemy:
     def __init__(self, bullet_speed=0.2):
+        self.bullets = []
+        self.emitter = None  # BulletScriptEngine のエミッタ
+        self.reset(bullet_speed)
+
+    def reset(self, bullet_speed=0.2):
+        # enemy_pool で使い回すときもここで初期化する
         self.x = SCREEN_WIDTH // 2
         self.y = SCREEN_HEIGHT + 10
         self.target_x = SCREEN_WIDTH // 2
@@ -401,38 +560,11 @@ class Enemy:
         self.is_moving = True
         self.hp = ENEMY_HP
         self.alive = True
-        self.bullets = []
-        self.shoot_timer = 0
+        self.bullets.clear()
         self.bullet_speed = bullet_speed
         self.pattern_type = "circular"  # デフォルト値を設定
         self.player = None  # プレイヤー参照（後で設定される）
-
-        # 各種弾パターンを初期化
-        self.circular_pattern = CircularBurstPattern(
-            count=12,
-            speed=bullet_speed,
-            start_deg=90,
-            spread_deg=360,
-            spin_deg=6,
-            radius=1,
-            color=10
-        )
-
-        self.aimed_pattern = AimedShot(
-            speed=bullet_speed * 1.5,
-            radius=1,
-            color=8
-        )
-
-        self.splitting_pattern = SplittingBulletPattern(
-            speed=bullet_speed * 1.2,
-            split_count=3,
-            split_time=30,
-            max_splits=2,
-            spread_deg=60,
-            radius=1,
-            color=14
-        )
+        # 発射タイミングと弾の生成は patterns.json のスクリプト（BulletScriptEngine）が担当
 
     def set_target(self, x, y):
         self.target_x = x
@@ -459,38 +591,15 @@ class Enemy:
                 distance = (dx**2 + dy**2)**0.5
                 self.x += (dx / distance) * self.move_speed
                 self.y += (dy / distance) * self.move_speed
-        
-        self.shoot_timer += 1
-
-        if self.shoot_timer >= SHOOT_INTERVAL:
-            self.shoot()
-            self.shoot_timer = 0
 
+    def update_bullets(self):
         # 弾の更新
         for bullet in self.bullets[:]:
             bullet.update()
             if not bullet.alive:
                 self.bullets.remove(bullet)
+                release_bullet(bullet)
     
-    def shoot(self):
-        # 弾パターンの選択
-        if self.pattern_type == "circular":
-            new_bullets = self.circular_pattern.fire(self.x + 4, self.y + 8)
-            self.bullets.extend(new_bullets)
-        elif self.pattern_type == "aimed" and self.player:
-            new_bullets = self.aimed_pattern.fire(
-                self.x + 4, self.y + 8, 
-                self.player.x + 4, self.player.y + 4
-            )
-            self.bullets.extend(new_bullets)
-        elif self.pattern_type == "splitting":
-            new_bullets = self.splitting_pattern.fire(
-                self.x + 4, self.y + 8,
-                self.player.x + 4 if self.player else None,
-                self.player.y + 4 if self.player else None
-            )
-            self.bullets.extend(new_bullets)
-
     def draw(self):
         if self.alive:
             pyxel.blt(int(self.x), int(self.y), 0, 0, 8, 8, 8, 0)
@@ -498,16 +607,18 @@ class Enemy:
             # HPバーの表示
             bar_width = (self.hp / ENEMY_HP) * 8
             pyxel.rect(int(self.x), int(self.y) - 2, int(bar_width), 1, 8)
-
-            # 弾を描画
-            for bullet in self.bullets:
-                bullet.draw()
+            # 弾は Game.draw で BulletRenderer がまとめて描く
 
 class Player_Bullet:
     def __init__(self, x, y):
+        self.reset(x, y)
+
+    def reset(self, x, y):
         self.x = x + 4
         self.y = y
         self.speed = PLAYER_BULLET_SPEED
+        self.radius = 1
+        self.color = 8
         self.alive = True
 
     def update(self):
@@ -516,8 +627,24 @@ class Player_Bullet:
             self.alive = False
 
     def draw(self):
-        pyxel.circ(int(self.x), int(self.y), 1, 8)
+        pyxel.circ(int(self.x), int(self.y), self.radius, self.color)
+
+# 使い回すオブジェクトのプール
+enemy_pool = ObjectPool(Enemy, "enemies")
+player_bullet_pool = ObjectPool(Player_Bullet, "player_bullets")
+POOLS = (enemy_pool, player_bullet_pool, bullet_pool)
+
+gc_monitor = GCMonitor()
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="bullet hell")
+    parser.add_argument("--record", metavar="FILE", help="プレイ中の入力と乱数シードを記録する")
+    parser.add_argument("--replay", metavar="FILE", help="記録した入力を再生する")
+    parser.add_argument("--speed", type=int, default=1, help="再生時に1フレームで進めるupdate回数")
+    return parser.parse_args()
+
 
 # アプリケーション開始
 if __name__ == "__main__":
-    App()
\ No newline at end of file
+    App(parse_args())
\ No newline at end of file
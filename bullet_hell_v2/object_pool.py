@@ -0,0 +1,87 @@
+import gc
+import time
+
+# ---------------------------------------------------------------
+# フリーリスト式のオブジェクトプール
+#
+#  acquire(*args) は空きがあれば obj.reset(*args) で再利用し、
+#  無ければ cls(*args) で新しく作る。使い終わったら release(obj)。
+#  プールに入れるクラスは __init__ と同じ引数の reset() を持つこと。
+# ---------------------------------------------------------------
+
+
+class ObjectPool:
+    def __init__(self, cls, name=None):
+        self.cls = cls
+        self.name = name or cls.__name__
+        self.free = []
+        self.in_use = 0
+        self.created = 0
+        self.reused = 0
+        self.released = 0
+
+    def acquire(self, *args, **kwargs):
+        if self.free:
+            obj = self.free.pop()
+            obj.reset(*args, **kwargs)
+            self.reused += 1
+        else:
+            obj = self.cls(*args, **kwargs)
+            self.created += 1
+        self.in_use += 1
+        return obj
+
+    def release(self, obj):
+        self.free.append(obj)
+        self.in_use -= 1
+        self.released += 1
+
+    @property
+    def reuse_rate(self):
+        total = self.created + self.reused
+        return self.reused / total if total else 0.0
+
+    def reset_stats(self):
+        self.created = 0
+        self.reused = 0
+        self.released = 0
+
+    def summary(self):
+        return (f"{self.name}: in_use={self.in_use} free={len(self.free)} "
+                f"created={self.created} reuse={self.reuse_rate:.0%}")
+
+
+class GCMonitor:
+    """gc.callbacks で GC の回数と停止時間を数える。"""
+
+    def __init__(self):
+        self.collections = [0, 0, 0]
+        self.total_pause = 0.0
+        self.max_pause = 0.0
+        self._start = 0.0
+        self.running = False
+
+    def _callback(self, phase, info):
+        if phase == "start":
+            self._start = time.perf_counter()
+        else:
+            pause = time.perf_counter() - self._start
+            self.collections[info["generation"]] += 1
+            self.total_pause += pause
+            if pause > self.max_pause:
+                self.max_pause = pause
+
+    def start(self):
+        if not self.running:
+            gc.callbacks.append(self._callback)
+            self.running = True
+
+    def stop(self):
+        if self.running:
+            gc.callbacks.remove(self._callback)
+            self.running = False
+
+    def summary(self):
+        return (f"gc: gen0={self.collections[0]} gen1={self.collections[1]} "
+                f"gen2={self.collections[2]} pause_total={self.total_pause * 1e3:.2f}ms "
+                f"max={self.max_pause * 1e3:.2f}ms")
@@ -0,0 +1,136 @@
+# 衝突処理のベンチマーク
+# 以前のpush_back(1ずつ動かしてpgetで判定)と、壁マップを使う今のpush_backを比べる
+# ウィンドウは開かず、メモリ上のタイルマップで計測する
+#
+#   python bench_collision.py
+#   python bench_collision.py --moves 20000 --check
+
+import argparse
+import math
+import random
+import time
+
+import collision
+from collision import WallMap, push_back
+from constants import TILE_NONE, TILE_TO_TILETYPE, TILE_WALL
+
+WALL_TILE = (1, 2)  # 壁として使うタイル
+MAP_W = 256  # マップの幅(タイル数)
+MAP_H = 16  # マップの高さ(タイル数)
+
+
+# メモリ上のタイルマップクラス(pgetだけを持つ)
+class MemoryTilemap:
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.tiles = {}
+
+    def pget(self, x, y):
+        return self.tiles.get((int(x), int(y)), (0, 0))
+
+
+# 洞窟っぽいマップを作る(床・天井と、ランダムな足場と柱)
+def make_tilemap(seed):
+    rng = random.Random(seed)
+    tilemap = MemoryTilemap(MAP_W, MAP_H)
+    for tx in range(MAP_W):
+        tilemap.tiles[(tx, 0)] = WALL_TILE
+        if rng.random() < 0.9:
+            tilemap.tiles[(tx, MAP_H - 1)] = WALL_TILE
+    for _ in range(120):
+        tx = rng.randrange(MAP_W)
+        ty = rng.randrange(2, MAP_H - 2)
+        for i in range(rng.randint(1, 5)):
+            tilemap.tiles[(tx + i, ty)] = WALL_TILE
+    return tilemap
+
+
+# 以前のpush_back(比較用にそのまま残しておく)
+def legacy_push_back(tilemap, x, y, dx, dy):
+    def in_collision(x, y):
+        tile = tilemap.pget(x // 8, y // 8)
+        return TILE_TO_TILETYPE.get(tile, TILE_NONE) == TILE_WALL
+
+    def is_character_colliding(x, y):
+        x1 = math.floor(x) // 8
+        y1 = math.floor(y) // 8
+        x2 = (math.ceil(x) + 7) // 8
+        y2 = (math.ceil(y) + 7) // 8
+        for yi in range(y1, y2 + 1):
+            for xi in range(x1, x2 + 1):
+                if in_collision(xi * 8, yi * 8):
+                    return True
+        return False
+
+    for _ in range(math.ceil(abs(dy))):
+        step = max(-1, min(1, dy))
+        if is_character_colliding(x, y + step):
+            break
+        y += step
+        dy -= step
+
+    for _ in range(math.ceil(abs(dx))):
+        step = max(-1, min(1, dx))
+        if is_character_colliding(x + step, y):
+            break
+        x += step
+        dx -= step
+
+    return x, y
+
+
+# ランダムな移動(プレイヤー・敵の速度の範囲)を作る
+def make_moves(count, seed):
+    rng = random.Random(seed)
+    moves = []
+    for _ in range(count):
+        x = rng.uniform(0, MAP_W * 8 - 8)
+        y = rng.uniform(0, MAP_H * 8 - 8)
+        if rng.random() < 0.5:  # 整数座標(プレイヤー・マミー・スライム)
+            x, y = int(x), int(y)
+        dx = rng.choice([-2, -1, 0, 1, 2, rng.uniform(-2, 2)])
+        dy = rng.choice([-6, -3, 1, 3, 4, rng.uniform(-6, 4)])
+        moves.append((x, y, dx, dy))
+    return moves
+
+
+def main():
+    parser = argparse.ArgumentParser(description="chapter7 push_back benchmark")
+    parser.add_argument("--moves", type=int, default=10000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--check", action="store_true", help="以前の結果と一致するか調べる")
+    args = parser.parse_args()
+
+    tilemap = make_tilemap(args.seed)
+    start = time.perf_counter()
+    collision.set_wall_map(WallMap(tilemap, MAP_W, MAP_H))
+    build_time = time.perf_counter() - start
+    moves = make_moves(args.moves, args.seed + 1)
+
+    start = time.perf_counter()
+    legacy = [legacy_push_back(tilemap, *move) for move in moves]
+    legacy_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    current = [push_back(*move) for move in moves]
+    current_time = time.perf_counter() - start
+
+    print(f"moves={len(moves)} wall map build={build_time * 1e3:.2f}ms")
+    print(f"  legacy push_back : {legacy_time / len(moves) * 1e6:8.2f} usec/move")
+    print(f"  wall map resolver: {current_time / len(moves) * 1e6:8.2f} usec/move")
+    print(f"  speedup x{legacy_time / current_time:.1f}")
+
+    if args.check:
+        mismatches = [
+            (move, a, b)
+            for move, a, b in zip(moves, legacy, current)
+            if abs(a[0] - b[0]) > 1e-9 or abs(a[1] - b[1]) > 1e-9
+        ]
+        print(f"  mismatches={len(mismatches)}")
+        for move, a, b in mismatches[:5]:
+            print(f"    {move} legacy={a} now={b}")
+
+
+if __name__ == "__main__":
+    main()
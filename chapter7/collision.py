@@ -1,5 +1,7 @@
 # 衝突処理モジュール
 
+import math
+
 import pyxel
 from constants import TILE_NONE, TILE_TO_TILETYPE, TILE_WALL
 
@@ -10,44 +12,150 @@ def get_tile_type(x, y):
     return TILE_TO_TILETYPE.get(tile, TILE_NONE)
 
 
+# 壁マップクラス
+# タイルマップの各タイルが壁かどうかを1タイル1バイトで持っておく
+# (壁のタイルはゲーム中に変わらないので、プレイ開始時に1回作ればよい)
+class WallMap:
+    # タイルマップから壁マップを作る
+    def __init__(self, tilemap, width, height):
+        self.width = width  # 幅(タイル数)
+        self.height = height  # 高さ(タイル数)
+        self.walls = bytearray(width * height)
+
+        for ty in range(height):
+            for tx in range(width):
+                tile_type = TILE_TO_TILETYPE.get(tilemap.pget(tx, ty), TILE_NONE)
+                self.walls[ty * width + tx] = tile_type == TILE_WALL
+
+    # タイル座標が壁か判定する(マップの外は壁なし)
+    def is_wall(self, tx, ty):
+        if 0 <= tx < self.width and 0 <= ty < self.height:
+            return self.walls[ty * self.width + tx] != 0
+        return False
+
+    # タイル座標のtx1～tx2列、ty行に壁があるか判定する
+    def row_has_wall(self, ty, tx1, tx2):
+        if ty < 0 or ty >= self.height:
+            return False
+        if tx2 < 0 or tx1 >= self.width:
+            return False
+        row = self.walls[ty * self.width + max(tx1, 0) : ty * self.width + min(tx2, self.width - 1) + 1]
+        return any(row)
+
+    # タイル座標のty1～ty2行、tx列に壁があるか判定する
+    def column_has_wall(self, tx, ty1, ty2):
+        if tx < 0 or tx >= self.width:
+            return False
+        walls = self.walls
+        width = self.width
+        for ty in range(max(ty1, 0), min(ty2, self.height - 1) + 1):
+            if walls[ty * width + tx]:
+                return True
+        return False
+
+
+wall_map = None  # 現在の壁マップ
+
+
+# タイルマップ0から壁マップを作り直す(タイルマップを読み込み直した時に呼ぶ)
+def build_wall_map():
+    global wall_map
+    tilemap = pyxel.tilemaps[0]
+    wall_map = WallMap(tilemap, tilemap.width, tilemap.height)
+    return wall_map
+
+
+# 壁マップを差し替える(ベンチマーク用)
+def set_wall_map(new_wall_map):
+    global wall_map
+    wall_map = new_wall_map
+
+
 # 指定した座標が壁と重なっているか判定する
 def in_collision(x, y):
-    return get_tile_type(x, y) == TILE_WALL
+    if wall_map is None:
+        build_wall_map()
+    return wall_map.is_wall(int(x // 8), int(y // 8))
 
 
 # キャラクターが壁と重なっているか判定する
 def is_character_colliding(x, y):
+    if wall_map is None:
+        build_wall_map()
+
     # キャラクターと重なっているタイル座標の領域を計算する
-    x1 = pyxel.floor(x) // 8
-    y1 = pyxel.floor(y) // 8
-    x2 = (pyxel.ceil(x) + 7) // 8
-    y2 = (pyxel.ceil(y) + 7) // 8
+    x1 = math.floor(x) // 8
+    y1 = math.floor(y) // 8
+    x2 = (math.ceil(x) + 7) // 8
+    y2 = (math.ceil(y) + 7) // 8
 
     # タイル座標の領域が壁と重なっているかどうかを判定する
     for yi in range(y1, y2 + 1):
-        for xi in range(x1, x2 + 1):
-            if in_collision(xi * 8, yi * 8):
-                return True  # 壁と衝突している
+        if wall_map.row_has_wall(yi, x1, x2):
+            return True  # 壁と衝突している
 
     return False  # 壁と衝突していない
 
 
+# 1軸分の移動先を求める
+# 1ずつ(最後は端数)動かして壁と衝突する直前で止めるのと同じ結果を、
+# 通過するタイル行(列)だけを調べて直接求める
+#   pos: 移動する軸の座標, d: 移動距離
+#   colliding(p): 座標pの時にキャラクターが壁と重なるか
+#   blocked(i): タイル行(列)iのキャラクターと重なる範囲に壁があるか
+def _resolve_axis(pos, d, colliding, blocked):
+    n = math.ceil(abs(d))  # 移動の回数
+    if n == 0:
+        return pos
+
+    # 1回目の移動で衝突する時は動かない
+    first = pos + max(-1, min(1, d))
+    if colliding(first):
+        return pos
+
+    last = pos + d  # 最後まで動けた時の座標
+    if d > 0:
+        # 1回目の移動後の下端(右端)より先にある、最初の壁の行(列)を探す
+        for i in range((math.ceil(first) + 7) // 8 + 1, (math.ceil(last) + 7) // 8 + 1):
+            if blocked(i):
+                limit = 8 * i - 8  # この座標を超えると壁に重なる
+                k = math.floor(limit - pos) + 1  # 最初に衝突する移動の回数
+                return pos + min(k, n) - 1
+        return last
+    else:
+        # 1回目の移動後の上端(左端)より先にある、最初の壁の行(列)を探す
+        for i in range(math.floor(first) // 8 - 1, math.floor(last) // 8 - 1, -1):
+            if blocked(i):
+                limit = 8 * i + 8  # この座標を下回ると壁に重なる
+                k = math.floor(pos - limit) + 1
+                return pos - (min(k, n) - 1)
+        return last
+
+
 # 押し戻した座標を返す
 def push_back(x, y, dx, dy):
+    if wall_map is None:
+        build_wall_map()
+    walls = wall_map
+
     # 壁と衝突するまで垂直方向に移動する
-    for _ in range(pyxel.ceil(abs(dy))):
-        step = max(-1, min(1, dy))
-        if is_character_colliding(x, y + step):
-            break
-        y += step
-        dy -= step
+    x1 = math.floor(x) // 8
+    x2 = (math.ceil(x) + 7) // 8
+    y = _resolve_axis(
+        y,
+        dy,
+        lambda p: is_character_colliding(x, p),
+        lambda ty: walls.row_has_wall(ty, x1, x2),
+    )
 
     # 壁と衝突するまで水平方向に移動する
-    for _ in range(pyxel.ceil(abs(dx))):
-        step = max(-1, min(1, dx))
-        if is_character_colliding(x + step, y):
-            break
-        x += step
-        dx -= step
+    y1 = math.floor(y) // 8
+    y2 = (math.ceil(y) + 7) // 8
+    x = _resolve_axis(
+        x,
+        dx,
+        lambda p: is_character_colliding(p, y),
+        lambda tx: walls.column_has_wall(tx, y1, y2),
+    )
 
     return x, y
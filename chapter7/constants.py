@@ -3,6 +3,9 @@
 SCROLL_BORDER_X = 80  # スクロール境界X座標
 # プレイヤーがこの座標を超えたらスクロールさせる
 
+FIELD_CACHE_IMAGE = 2  # フィールド描画のキャッシュに使うイメージバンク
+# cursed_caverns.pyxresではイメージバンク2は使っていない
+
 # タイル種別
 TILE_NONE = 0  # 何もない
 TILE_GEM = 1  # 宝石
@@ -0,0 +1,64 @@
+# 敵の空間インデックスモジュール
+
+ENEMY_BUCKET_W = 32  # 1つの列(バケット)の幅(ピクセル)
+
+
+# 敵の空間インデックスクラス
+# 敵をX座標ごとの列(バケット)に分けて持つ
+# 列は挿入順を保つ辞書なので、追加・削除・列の移動はO(1)でできる
+# 表示範囲の列だけを調べれば、その範囲の敵を取り出せる
+class EnemyIndex:
+    # 空のインデックスを作る
+    def __init__(self):
+        self.buckets = {}  # 列番号 -> {敵: None}
+        self.bucket_of = {}  # 敵 -> 列番号
+
+    # 敵の数を返す
+    def __len__(self):
+        return len(self.bucket_of)
+
+    # 敵がインデックスに登録されているか判定する
+    def __contains__(self, enemy):
+        return enemy in self.bucket_of
+
+    # 登録されている全ての敵を返す
+    def __iter__(self):
+        return iter(list(self.bucket_of))
+
+    # X座標から列番号を計算する
+    def _key(self, x):
+        return int(x // ENEMY_BUCKET_W)
+
+    # 敵を追加する(敵リストと同じくappendで追加できる)
+    def append(self, enemy):
+        key = self._key(enemy.x)
+        self.buckets.setdefault(key, {})[enemy] = None
+        self.bucket_of[enemy] = key
+
+    # 敵を削除する
+    def remove(self, enemy):
+        key = self.bucket_of.pop(enemy)
+        bucket = self.buckets[key]
+        del bucket[enemy]
+        if not bucket:
+            del self.buckets[key]
+
+    # 敵が移動した後に呼んで、所属する列を更新する
+    def move(self, enemy):
+        key = self._key(enemy.x)
+        old_key = self.bucket_of[enemy]
+        if key != old_key:
+            self.remove(enemy)
+            self.buckets.setdefault(key, {})[enemy] = None
+            self.bucket_of[enemy] = key
+
+    # X座標がleft_x～right_xの列にいる敵を左の列から順に返す
+    # (列単位で取り出すので、範囲の少し外の敵も含まれる)
+    def in_range(self, left_x, right_x):
+        enemies = []
+        buckets = self.buckets
+        for key in range(self._key(left_x), self._key(right_x) + 1):
+            bucket = buckets.get(key)
+            if bucket:
+                enemies.extend(bucket)
+        return enemies
@@ -49,6 +49,7 @@ class Player:
 
                     # 宝石タイルを消す
                     pyxel.tilemaps[0].pset(x // 8, y // 8, (0, 0))
+                    self.game.invalidate_field()
 
                     # 効果音を再生する
                     pyxel.play(3, 1)
@@ -1,4 +1,6 @@
 import pyxel
+from constants import FIELD_CACHE_IMAGE
+from enemy_index import EnemyIndex
 from scenes import ClearScene, GameOverScene, PlayScene, TitleScene
 
 
@@ -15,7 +17,7 @@ class Game:
 
         # ゲームの状態を初期化する
         self.player = None  # プレイヤー
-        self.enemies = []  # 敵のリスト
+        self.enemies = EnemyIndex()  # 敵(X座標で列に分けて持つ)
         self.scenes = {
             "title": TitleScene(self),
             "play": PlayScene(self),
@@ -24,6 +26,7 @@ class Game:
         }  # シーンの辞書
         self.scene_name = None  # 現在のシーン名
         self.screen_x = 0  # フィールド表示範囲の左端のX座標
+        self.field_cache_x = None  # キャッシュに描いてあるフィールドの左端のX座標
         self.score = 0  # 得点
 
         # シーンをタイトル画面に変更する
@@ -39,7 +42,17 @@ class Game:
 
     # フィールドを描画する
     def draw_field(self):
-        pyxel.bltm(0, 0, 0, self.screen_x, 0, 128, 128)
+        # 表示範囲が変わった時だけキャッシュ用のイメージにタイルマップを描き直す
+        if self.field_cache_x != self.screen_x:
+            pyxel.images[FIELD_CACHE_IMAGE].bltm(0, 0, 0, self.screen_x, 0, 128, 128)
+            self.field_cache_x = self.screen_x
+
+        # キャッシュしたフィールドを画面に転送する
+        pyxel.blt(0, 0, FIELD_CACHE_IMAGE, 0, 0, 128, 128)
+
+    # フィールドのキャッシュを無効にする(タイルマップを書き換えた時に呼ぶ)
+    def invalidate_field(self):
+        self.field_cache_x = None
 
     # プレイヤーを描画する
     def draw_player(self):
@@ -58,8 +71,8 @@ class Game:
         # カメラ位置(描画の原点)を変更する
         pyxel.camera(self.screen_x, 0)
 
-        # 敵を描画する
-        for enemy in self.enemies:
+        # 画面内の列にいる敵だけを描画する
+        for enemy in self.enemies.in_range(self.screen_x - 8, self.screen_x + 128):
             enemy.draw()
 
         # カメラ位置を戻す
@@ -1,5 +1,5 @@
 import pyxel
-from collision import get_tile_type
+from collision import build_wall_map
 from constants import (
     SCROLL_BORDER_X,
     TILE_FLOWER_POINT,
@@ -7,7 +7,9 @@ from constants import (
     TILE_SLIME1_POINT,
     TILE_SLIME2_POINT,
 )
+from enemy_index import ENEMY_BUCKET_W
 from entities import Flower, Mummy, Player, Slime
+from spawn_points import SpawnPointTable
 
 
 # プレイ画面クラス
@@ -15,11 +17,19 @@ class PlayScene:
     # プレイ画面を初期化する
     def __init__(self, game):
         self.game = game
+        self.spawn_points = None  # 敵出現位置テーブル
 
     # プレイ画面を開始する
     def start(self):
         # 変更前のマップに戻す
         pyxel.tilemaps[0].blt(0, 0, 2, 0, 0, 256, 16)
+        self.game.invalidate_field()
+
+        # 壁マップを作る
+        build_wall_map()
+
+        # 敵出現位置テーブルを作る
+        self.spawn_points = SpawnPointTable(pyxel.tilemaps[0], 256, 16)
 
         # プレイ画面の状態を初期化する
         game = self.game  # ゲームクラス
@@ -43,26 +53,23 @@ class PlayScene:
         left_x = pyxel.ceil(left_x / 8)
         right_x = pyxel.floor(right_x / 8)
 
-        # 判定範囲のタイルに応じて敵を出現させる
-        for tx in range(left_x, right_x + 1):
-            for ty in range(16):
-                x = tx * 8
-                y = ty * 8
-                tile_type = get_tile_type(x, y)
-
-                if tile_type == TILE_SLIME1_POINT:  # グリーンスライムの出現位置の時
-                    enemies.append(Slime(game, x, y, False))
-                elif tile_type == TILE_SLIME2_POINT:  # レッドスライムの出現位置の時
-                    enemies.append(Slime(game, x, y, True))
-                elif tile_type == TILE_MUMMY_POINT:  # マミーの出現位置の時
-                    enemies.append(Mummy(game, x, y))
-                elif tile_type == TILE_FLOWER_POINT:  # フラワーの出現位置の時
-                    enemies.append(Flower(game, x, y))
-                else:
-                    continue
-
-                # 出現位置タイルを消す
-                pyxel.tilemaps[0].pset(tx, ty, (0, 0))
+        # 判定範囲にある出現位置に敵を出現させる
+        for tx, ty, tile_type in self.spawn_points.take(left_x, right_x):
+            x = tx * 8
+            y = ty * 8
+
+            if tile_type == TILE_SLIME1_POINT:  # グリーンスライムの出現位置の時
+                enemies.append(Slime(game, x, y, False))
+            elif tile_type == TILE_SLIME2_POINT:  # レッドスライムの出現位置の時
+                enemies.append(Slime(game, x, y, True))
+            elif tile_type == TILE_MUMMY_POINT:  # マミーの出現位置の時
+                enemies.append(Mummy(game, x, y))
+            elif tile_type == TILE_FLOWER_POINT:  # フラワーの出現位置の時
+                enemies.append(Flower(game, x, y))
+
+            # 出現位置タイルを消す
+            pyxel.tilemaps[0].pset(tx, ty, (0, 0))
+            game.invalidate_field()
 
     # プレイ画面を更新する
     def update(self):
@@ -92,8 +99,15 @@ class PlayScene:
             pyxel.play(3, 4)
             game.change_scene("gameover")
 
-        # 敵を更新する
-        for enemy in enemies.copy():
+        # 表示範囲付近の敵だけを更新する(範囲より右の敵は休眠させておく)
+        # 左端が列の境目を越えた時に1つ左の列に残った敵も削除できるように、
+        # 1列左から調べる
+        left_x = game.screen_x - 8
+        right_x = game.screen_x + 160
+        for enemy in enemies.in_range(left_x - ENEMY_BUCKET_W, right_x):
+            if enemy.x > right_x:
+                continue  # 休眠中の敵
+
             enemy.update()
 
             # プレイヤーと敵が接触したらゲームオーバーにする
@@ -102,13 +116,11 @@ class PlayScene:
                 return
 
             # 敵が画面の左端または下端から外に出たら削除する
-            if (
-                enemy.x < game.screen_x - 8
-                or enemy.x > game.screen_x + 160
-                or enemy.y > 160
-            ):
-                if enemy in enemies:  # 敵リストに登録されている時
-                    enemies.remove(enemy)
+            # (右端から出た敵は削除せず、表示範囲に戻るまで休眠させる)
+            if enemy.x < left_x or enemy.y > 160:
+                enemies.remove(enemy)
+            else:
+                enemies.move(enemy)  # 移動先の列に入れ直す
 
     # プレイ画面を描画する
     def draw(self):
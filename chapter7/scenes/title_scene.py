@@ -1,4 +1,5 @@
 import pyxel
+from enemy_index import EnemyIndex
 
 
 # タイトル画面クラス
@@ -17,7 +18,7 @@ class TitleScene:
         self.game.player = None
 
         # 全ての敵を削除する
-        self.game.enemies = []
+        self.game.enemies = EnemyIndex()
 
         # BGMを再生する
         pyxel.playm(0, loop=True)
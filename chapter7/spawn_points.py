@@ -0,0 +1,46 @@
+# 敵出現位置モジュール
+
+from bisect import bisect_left, bisect_right
+
+from constants import (
+    TILE_FLOWER_POINT,
+    TILE_MUMMY_POINT,
+    TILE_SLIME1_POINT,
+    TILE_SLIME2_POINT,
+    TILE_TO_TILETYPE,
+)
+
+# 敵出現位置のタイル種別
+SPAWN_POINT_TYPES = (
+    TILE_SLIME1_POINT,
+    TILE_SLIME2_POINT,
+    TILE_MUMMY_POINT,
+    TILE_FLOWER_POINT,
+)
+
+
+# 敵出現位置テーブルクラス
+# プレイ開始時にタイルマップを1回だけ調べて、出現位置をタイルX座標順に並べておく
+# スクロールで見えた範囲の出現位置は二分探索で取り出せる
+class SpawnPointTable:
+    # タイルマップから出現位置テーブルを作る
+    def __init__(self, tilemap, width, height):
+        self.tile_xs = []  # 出現位置のタイルX座標(昇順)
+        self.points = []  # (タイルX座標, タイルY座標, タイル種別)
+
+        for tx in range(width):
+            for ty in range(height):
+                tile_type = TILE_TO_TILETYPE.get(tilemap.pget(tx, ty))
+                if tile_type in SPAWN_POINT_TYPES:
+                    self.tile_xs.append(tx)
+                    self.points.append((tx, ty, tile_type))
+
+    # タイルX座標がleft_tx～right_txの出現位置を取り出す
+    # 取り出した出現位置はテーブルから消える(同じ敵を2回出現させない)
+    def take(self, left_tx, right_tx):
+        start = bisect_left(self.tile_xs, left_tx)
+        end = bisect_right(self.tile_xs, right_tx)
+        points = self.points[start:end]
+        del self.tile_xs[start:end]
+        del self.points[start:end]
+        return points
@@ -0,0 +1,53 @@
+"""
+取引日で系列を位置合わせする（as-of 結合）。
+
+指数の重ね描きは、以前はゲーム側で期間の暦日の比率から指数の区間を推定し、
+線形補間で点数をそろえていた（休日の数が違うとずれる）。ここでは
+パックを作る時に、問題の各点の取引日について「その日以前で最後の指数の値」を
+np.searchsorted で引き当てる。日付は問題の系列と完全に一致する。
+指数が始まる前の点には値を作らず、先頭から何点が欠けているか（offset）を返す。
+"""
+from typing import List, Sequence, Tuple
+
+import numpy as np
+
+
+def to_days(dates: Sequence[str]) -> np.ndarray:
+    """YYYY-MM-DD（時刻付きでも可）の列 -> datetime64[D] の配列"""
+    return np.array([d[:10] for d in dates], dtype="datetime64[D]")
+
+
+def align_asof(src_days: np.ndarray, src_values: Sequence[int],
+               dst_days: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    dst_days の各日について、その日以前で最後の src の値を返す。
+    src_days は昇順であること。src の最初の日より前は値が無いので、
+    (値, 値があるか) を返す（値が無い所の値は意味を持たない）。
+    """
+    values = np.asarray(src_values)
+    if values.size == 0:
+        raise ValueError("empty source series")
+    pos = np.searchsorted(src_days, dst_days, side="right") - 1
+    valid = pos >= 0
+    return values[np.maximum(pos, 0)], valid
+
+
+def align_many(src_dates: Sequence[str], src_values: Sequence[int],
+               targets: Sequence[Sequence[str]]) -> List[Tuple[int, List[int]]]:
+    """
+    複数の系列の日付（targets、それぞれ昇順）それぞれに src を位置合わせし、
+    系列ごとに (指数が始まる前の点の数, それ以降の点の値) を返す。
+    全系列の日付をつなげて searchsorted を1回だけ呼び、系列ごとに切り分ける。
+    """
+    if not targets:
+        return []
+    src_days = to_days(src_dates)
+    dst_days = to_days([d for dates in targets for d in dates])
+    aligned, valid = align_asof(src_days, src_values, dst_days)
+    splits = np.cumsum([len(dates) for dates in targets])[:-1]
+    out = []
+    for part, ok in zip(np.split(aligned, splits), np.split(valid, splits)):
+        # 日付が昇順なので、値が無いのは先頭の連続した点だけ
+        offset = int(np.count_nonzero(~ok))
+        out.append((offset, part[offset:].tolist()))
+    return out
@@ -0,0 +1,183 @@
+"""
+チャートの画面座標を問題ごとに前計算しておくモジュール（pyxel を使わない）。
+
+draw_chart は毎フレーム、表示している範囲の min/max を取り直して全点を map_y し、
+1点ごとに pyxel.line を呼んでいた。ここでは
+  - 各点の X 座標と、先頭からの min/max（累積）は問題を選んだ時に1回だけ計算する
+  - 折れ線は画面の X 列ごとに (最初の値, 最小値, 最大値, 最後の値) にまとめて持つ
+    （同じ列の中の線分は縦線1本と同じ画素になるので、描く線は列数の2倍以下になる）
+  - t が進んだら増えた点だけを足す。列は価格のまま持ち、y へは増えた列だけを変換する
+    （縦軸のスケールが変わった時も、全点ではなく列を1回なめて変換し直すだけで済む）
+  - 軸の目盛りと日付ラベルもスケール・問題が変わった時だけ作り直す
+ので、点がいくら多くても1フレームの描画は画面の幅に比例する時間で済む。
+"""
+from datetime import datetime, timedelta
+from itertools import accumulate
+from typing import List, Optional, Sequence, Tuple
+
+Y_STEPS = 4  # 縦軸の目盛りの数
+X_STEPS = 5  # 横軸の目盛りの数
+
+
+def interp_date_label(span: Tuple[str, str], frac: float, monthly: bool = True) -> str:
+    # fracは0.0=開始、1.0=終了
+    s = datetime.fromisoformat(span[0]).date()
+    e = datetime.fromisoformat(span[1]).date()
+    total = (e - s).days
+    d = s + timedelta(days=int(total * frac))
+    return d.strftime("%Y-%m") if monthly else d.strftime("%Y-%m-%d")
+
+
+class _Path:
+    """
+    1本の折れ線。X 列ごとに [x, 最初の値, 最小値, 最大値, 最後の値] を価格のまま持つ。
+    offset は values[0] が横軸の何点目か、total は横軸の点の数（指数の線は銘柄より遅く始まることがある）
+    """
+
+    def __init__(self, values: Sequence[int], x0: int, x1: int, offset: int = 0, total: Optional[int] = None):
+        self.values = values
+        self.offset = offset
+        n = len(values) + offset if total is None else total
+        self.xs = [x0 + int((i + offset) * (x1 - x0) / max(1, n - 1)) for i in range(len(values))]
+        self.pmin = list(accumulate(values, min))  # 先頭からの最小値
+        self.pmax = list(accumulate(values, max))  # 先頭からの最大値
+        self.columns: List[List[int]] = []
+        self.count = 0  # columns に入っている点の数
+        self.ys: List[Tuple[int, int, int, int]] = []  # 列ごとの (最初, 上端, 下端, 最後) の y
+        self.ys_scale = None  # ys を変換した時のスケール
+        self.dirty = 0  # この列から先は ys を変換し直す
+
+    def clear(self) -> None:
+        self.columns = []
+        self.count = 0
+        self.ys = []
+        self.dirty = 0
+
+    def extend(self, t: int) -> None:
+        """横軸の 0..t の点が入るように、まだ入っていない点を足す"""
+        end = max(0, min(t + 1 - self.offset, len(self.values)))
+        columns = self.columns
+        values = self.values
+        if self.count < end and columns:
+            self.dirty = min(self.dirty, len(columns) - 1)  # 最後の列は点が増えるかもしれない
+        for i in range(self.count, end):
+            x = self.xs[i]
+            v = values[i]
+            if columns and columns[-1][0] == x:
+                col = columns[-1]
+                if v < col[2]:
+                    col[2] = v
+                if v > col[3]:
+                    col[3] = v
+                col[4] = v
+            else:
+                columns.append([x, v, v, v, v])
+        self.count = max(self.count, end)
+
+    def _map(self, map_y, scale) -> None:
+        """列の y を求める（スケールが変わった時は全列、それ以外は足した列だけ）"""
+        if scale != self.ys_scale:
+            self.ys_scale = scale
+            self.dirty = 0
+        ys = self.ys
+        del ys[self.dirty:]
+        for _, first, lo, hi, last in self.columns[self.dirty:]:
+            # map_y は値が大きいほど y が小さい（上）
+            ys.append((map_y(first), map_y(hi), map_y(lo), map_y(last)))
+        self.dirty = len(ys)
+
+    def lines(self, map_y, scale) -> List[Tuple[int, int, int, int]]:
+        """描く線分のリスト（同じ列の中は縦線1本、列の間は前の列の最後の点から）"""
+        self._map(map_y, scale)
+        out = []
+        prev_x = prev_y = None
+        for col, (first, top, bottom, last) in zip(self.columns, self.ys):
+            x = col[0]
+            if prev_x is not None:
+                out.append((prev_x, prev_y, x, first))
+            if top != bottom:
+                out.append((x, top, x, bottom))
+            prev_x, prev_y = x, last
+        return out
+
+    def last_point(self) -> Optional[Tuple[int, int]]:
+        """最後の点（lines の後に呼ぶ）"""
+        if not self.columns:
+            return None
+        return self.columns[-1][0], self.ys[-1][3]
+
+
+class ChartGeometry:
+    """
+    1問分のチャートの画面座標。start_question で作り、draw_chart で update(t) してから使う。
+      main_lines / index_lines: 描く線分 (x1, y1, x2, y2)
+      （指数の線は prices の index_offset 点目から始まる）
+      last_main: 銘柄線の最後の点（停止ライン用）
+      y_ticks: (y, ラベル)  x_ticks: (x, ラベルの x, ラベル)
+    """
+
+    def __init__(self, prices: Sequence[int], index_prices: Optional[Sequence[int]],
+                 span: Tuple[str, str], box: Tuple[int, int, int, int], index_offset: int = 0):
+        self.x0, self.y0, self.x1, self.y1 = box
+        self.main = _Path(prices, self.x0, self.x1)
+        self.index = (_Path(index_prices, self.x0, self.x1, index_offset, len(prices))
+                      if index_prices else None)
+        self.t = -1
+        self.scale: Optional[Tuple[float, float]] = None
+        self.main_lines: List[Tuple[int, int, int, int]] = []
+        self.index_lines: List[Tuple[int, int, int, int]] = []
+        self.last_main: Optional[Tuple[int, int]] = None
+        self.y_ticks: List[Tuple[int, str]] = []
+        self.x_ticks = self._make_x_ticks(len(prices), span)
+
+    def _make_x_ticks(self, n: int, span: Tuple[str, str]) -> List[Tuple[int, int, str]]:
+        ticks = []
+        for i in range(X_STEPS + 1):
+            frac = i / X_STEPS
+            idx = int((n - 1) * frac)
+            x = self.x0 + int((idx / max(1, n - 1)) * (self.x1 - self.x0))
+            label = interp_date_label(span, frac, monthly=True)
+            ticks.append((x, x - (len(label) * 5) // 2, label))
+        return ticks
+
+    def _scale_at(self, t: int) -> Tuple[float, float]:
+        # 共通スケール（銘柄＋指数の 0..t で min/max を取る）
+        k = min(t, len(self.main.values) - 1)
+        mi, ma = self.main.pmin[k], self.main.pmax[k]
+        if self.index is not None:
+            k = min(t - self.index.offset, len(self.index.values) - 1)
+            if k >= 0:
+                mi = min(mi, self.index.pmin[k])
+                ma = max(ma, self.index.pmax[k])
+        if mi == ma:
+            mi -= 1  # 0除算回避
+        return mi, ma
+
+    def map_y(self, v: float) -> int:
+        mi, ma = self.scale
+        r = (v - mi) / (ma - mi)
+        return int(self.y1 - r * (self.y1 - self.y0))
+
+    def update(self, t: int) -> None:
+        """t までの点を表示する状態にする（前と同じなら何もしない）"""
+        if t == self.t or not self.main.values:
+            return
+        scale = self._scale_at(t)
+        paths = [self.main] + ([self.index] if self.index is not None else [])
+        if t < self.t:
+            # 列にまとめた点は外せないので、戻った時は作り直す
+            for p in paths:
+                p.clear()
+        if scale != self.scale:
+            # 列は価格で持っているので、変わるのは列の y と目盛りだけ
+            self.scale = scale
+            self.y_ticks = []
+            for i in range(Y_STEPS + 1):
+                val = scale[0] + (scale[1] - scale[0]) * i / Y_STEPS
+                self.y_ticks.append((self.map_y(val), str(int(val))))
+        for p in paths:
+            p.extend(t)
+        self.t = t
+        self.main_lines = self.main.lines(self.map_y, scale)
+        self.index_lines = self.index.lines(self.map_y, scale) if self.index is not None else []
+        self.last_main = self.main.last_point()
@@ -0,0 +1,79 @@
+"""
+見た目を保つ間引き（M4 / LTTB）。
+
+i % step で間引いたり線形に引き伸ばしたりすると、チャートの形を決める
+急騰・急落の山や谷が落ちてしまう。ここでは残す点の番号を返す。
+
+  m4(values, width)    X を width 個の列に分け、各列の 最初・最小・最大・最後 の点を残す
+                       （width 画素で描いた時の画素は間引く前と同じになる。最大 4*width 点）
+  lttb(values, n_out)  Largest-Triangle-Three-Buckets。ちょうど n_out 点を残す
+                       （各区間で、前に選んだ点と次の区間の平均とで作る三角形が最大の点）
+
+どちらも先頭と末尾の点は必ず残し、番号は昇順で返す。
+"""
+from typing import Sequence
+
+import numpy as np
+
+METHODS = ("m4", "lttb")
+
+
+def _buckets(n: int, width: int) -> np.ndarray:
+    """各点の列番号（0..width-1）"""
+    return (np.arange(n, dtype=np.int64) * width) // n
+
+
+def m4(values: Sequence[float], width: int) -> np.ndarray:
+    y = np.asarray(values, dtype=np.float64)
+    n = y.size
+    if width <= 0 or n <= 4 * width:
+        return np.arange(n)
+    b = _buckets(n, width)
+    starts = np.flatnonzero(np.r_[True, b[1:] != b[:-1]])
+    ends = np.r_[starts[1:], n] - 1
+    # 列ごとの最小・最大（同じ値なら番号の小さい方）は、列番号→値の順に並べた時の各列の先頭
+    order_min = np.lexsort((y, b))
+    order_max = np.lexsort((-y, b))
+    keep = np.concatenate([starts, ends, order_min[starts], order_max[starts]])
+    return np.unique(keep)
+
+
+def lttb(values: Sequence[float], n_out: int) -> np.ndarray:
+    y = np.asarray(values, dtype=np.float64)
+    n = y.size
+    if n_out >= n:
+        return np.arange(n)
+    if n_out < 3:
+        return np.array([0, n - 1][:max(n_out, 0)], dtype=np.int64)
+    x = np.arange(n, dtype=np.float64)
+    # 先頭と末尾を除いた点を n_out - 2 個の区間に分ける
+    edges = (np.arange(n_out - 1, dtype=np.float64) * (n - 2) / (n_out - 2)).astype(np.int64) + 1
+    edges[-1] = n - 1
+    out = np.empty(n_out, dtype=np.int64)
+    out[0] = 0
+    out[-1] = n - 1
+    a = 0
+    for k in range(n_out - 2):
+        lo, hi = edges[k], edges[k + 1]
+        # 次の区間の平均（最後の区間の次は末尾の点）
+        if k + 2 < len(edges):
+            nlo, nhi = edges[k + 1], edges[k + 2]
+        else:
+            nlo, nhi = n - 1, n
+        cx = x[nlo:nhi].mean()
+        cy = y[nlo:nhi].mean()
+        # 三角形の面積の2倍（の絶対値）が最大の点を選ぶ
+        area = np.abs((x[a] - cx) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (cy - y[a]))
+        a = lo + int(np.argmax(area))
+        out[k + 1] = a
+    return out
+
+
+def downsample(values: Sequence[float], width: int, method: str = "lttb") -> np.ndarray:
+    """method で残す点の番号を返す（m4 は width 列、lttb は width 点）"""
+    if method == "m4":
+        return m4(values, width)
+    if method == "lttb":
+        return lttb(values, width)
+    raise ValueError(f"unknown method: {method}")
+
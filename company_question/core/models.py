@@ -12,3 +12,4 @@ class Question:
     # 追加
     index_label: Optional[str] = None
     index_prices: Optional[List[int]] = None
+    index_offset: int = 0  # index_prices[0] が prices の何点目に当たるか（指数が始まる前の点の数）
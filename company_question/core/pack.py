@@ -0,0 +1,124 @@
+"""
+バイナリ形式のクイズパック（.bin）。
+
+Python ソースのパック（packs/pack_sample.py）は import するだけで全問題の
+価格リテラルをコンパイルするので、問題数が多いと起動が遅くメモリも食う。
+バイナリのパックは mmap して索引だけを読み、問題は選ばれた時に1問ずつ組み立てる。
+
+形式（リトルエンディアン）:
+  ヘッダー  magic "QPAK", version(u16), 問題数(u32), 指数の問題番号(i32, 無ければ -1)
+  索引      問題ごとに (メタ情報のオフセット, 長さ, 価格のオフセット, 個数,
+                        指数の価格のオフセット, 個数)  すべて u32
+  本体      メタ情報は UTF-8 の JSON（ticker, name, span, choices, blurb, index_label, index_offset）
+            価格は int32 の配列（4バイト境界にそろえる）
+"""
+import json
+import mmap
+import struct
+import sys
+from array import array
+from typing import Iterable, List
+
+from core.models import Question
+
+PACK_MAGIC = b"QPAK"
+PACK_VERSION = 1
+HEADER = struct.Struct("<4sHIi")
+INDEX_ENTRY = struct.Struct("<6I")
+
+
+def _int32_bytes(values: Iterable[int]) -> bytes:
+    arr = array("i", values)
+    if sys.byteorder == "big":
+        arr.byteswap()
+    return arr.tobytes()
+
+
+def write_pack(path: str, questions: List[Question], index_question: int = -1) -> None:
+    """問題のリストをバイナリのパックに書き出す"""
+    metas = []
+    prices = []
+    index_prices = []
+    for q in questions:
+        meta = {
+            "ticker": q.ticker,
+            "name": q.name,
+            "span": list(q.span),
+            "choices": list(q.choices),
+            "blurb": q.blurb,
+            "index_label": q.index_label,
+            "index_offset": q.index_offset,
+        }
+        metas.append(json.dumps(meta, ensure_ascii=False).encode("utf-8"))
+        prices.append(_int32_bytes(q.prices))
+        index_prices.append(_int32_bytes(q.index_prices or []))
+
+    offset = HEADER.size + INDEX_ENTRY.size * len(questions)
+    entries = []
+    body = bytearray()
+    for meta, p, ip in zip(metas, prices, index_prices):
+        meta_off = offset + len(body)
+        body += meta
+        body += b"\0" * (-len(body) % 4)
+        p_off = offset + len(body)
+        body += p
+        ip_off = offset + len(body)
+        body += ip
+        entries.append(INDEX_ENTRY.pack(meta_off, len(meta), p_off, len(p) // 4, ip_off, len(ip) // 4))
+
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(PACK_MAGIC, PACK_VERSION, len(questions), index_question))
+        for e in entries:
+            f.write(e)
+        f.write(body)
+
+
+class PackReader:
+    """
+    バイナリのパックを mmap して読む。
+    len(pack) と pack.index_question は索引だけで分かり、
+    pack[i] で i 番目の Question をその場で組み立てる。
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            self.buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, count, index_question = HEADER.unpack_from(self.buf, 0)
+        if magic != PACK_MAGIC or version != PACK_VERSION:
+            raise ValueError(f"{path} is not a quiz pack")
+        self.count = count
+        self.index_question = index_question if index_question >= 0 else None
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _ints(self, offset: int, n: int) -> List[int]:
+        arr = array("i")
+        arr.frombytes(self.buf[offset:offset + 4 * n])
+        if sys.byteorder == "big":
+            arr.byteswap()
+        return arr.tolist()
+
+    def __getitem__(self, i: int) -> Question:
+        if i < 0:
+            i += self.count
+        if not 0 <= i < self.count:
+            raise IndexError(i)
+        meta_off, meta_len, p_off, p_n, ip_off, ip_n = INDEX_ENTRY.unpack_from(
+            self.buf, HEADER.size + INDEX_ENTRY.size * i)
+        meta = json.loads(self.buf[meta_off:meta_off + meta_len].decode("utf-8"))
+        return Question(
+            ticker=meta["ticker"],
+            name=meta["name"],
+            span=tuple(meta["span"]),
+            prices=self._ints(p_off, p_n),
+            choices=meta["choices"],
+            blurb=meta["blurb"],
+            index_label=meta.get("index_label"),
+            index_prices=self._ints(ip_off, ip_n) if ip_n else None,
+            index_offset=meta.get("index_offset", 0),
+        )
+
+    def close(self) -> None:
+        self.buf.close()
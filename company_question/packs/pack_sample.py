@@ -9,6 +9,8 @@ QUESTIONS = [
         prices=[10000, 9839, 10182, 10054, 9946, 9861, 10448, 10354, 10307, 9363, 9625, 9372, 9526, 9638, 9753, 9801, 10041, 10315, 10298, 10448, 10302, 10152, 10375, 10161, 9882, 9946, 9882, 10255, 9916, 9925, 9934, 9934, 10478, 10379, 10131, 9964, 10315, 10512, 10161, 9908, 9723, 9998, 10041, 9856, 10354, 10585, 10448, 10238, 10131, 9886, 9951, 10092, 9891, 10431, 10495, 10465, 10448, 10589, 10448, 10096, 10049, 10272, 10176, 10088, 10180, 10482, 10347, 10671, 10577, 10092, 10030, 10229, 10105, 10131, 10182, 9882, 9773, 9608, 9462, 9627, 9713, 9775, 9766, 9781, 9477, 9539, 9389, 9370, 9119, 9001, 9020, 9008, 8866, 8688, 8467, 8197, 8382, 8448, 8414, 8255, 8171, 7856, 7762, 7582, 7432, 7203, 7014, 7108, 6727, 6896, 7226, 7599, 7468, 7708, 7758, 7833, 8054, 7702, 7655, 8049, 7938, 7859, 7824, 7629, 7571, 7522, 7726, 7245, 6896, 6718, 6740, 6832, 6585, 6465, 6259, 6238, 5646, 5985, 6264, 6054, 5899, 5406, 5419, 6060, 5991, 5766, 5865, 5852, 6024, 5955, 5944, 5884, 6238, 6643, 6523, 6208, 6476, 5897, 5749, 5931, 5927, 6148, 6819, 7059, 7053, 6860, 6695, 6990, 7108, 7303, 7046, 6941, 6853, 6793, 6703, 6463, 6602, 6877, 6890, 6997, 7061, 6945, 7035, 7335, 7548, 7486, 7563, 7631, 7786, 7871, 7833, 7839, 7511, 7681, 7916, 8036, 8532, 8330, 8748, 8896, 8840, 8958, 8733, 8667, 8720, 8457, 8491, 8596, 8793, 8913, 8461, 9074, 8776, 9985, 9964, 10043, 10000, 10392, 10431, 10229, 10583, 10244, 10484, 10332, 9974, 9831, 9775, 10024, 10171, 10069, 10116, 9524, 9254, 9059, 8842, 8902, 9089, 8581, 8712, 8836, 9072, 9063, 8926, 8776, 8439, 8101, 8152],
         choices=['Toei Animation Co.', 'Koei Tecmo Holdings Co.', 'Konami Group Corporation', 'NEXON Co.'],
         blurb='Koei Tecmo Holdings Co. stock price quiz item. The company name is in English.',
+        index_label='Nikkei 225',
+        index_prices=[10000, 9987, 10200, 10057, 10010, 9555, 9552, 9758, 9803, 9485, 9817, 9721, 9917, 9973, 9833, 10020, 10109, 10097, 10164, 10181, 10204, 10081, 10087, 10179, 9847, 9583, 9561, 9434, 9390, 9562, 9449, 9599, 9904, 9918, 9906, 10009, 10003, 9942, 9953, 9925, 9948, 10208, 10348, 9841, 9882, 9913, 9948, 10137, 10055, 9990, 10179, 10361, 10326, 10273, 10528, 10572, 10624, 10879, 11238, 11135, 11326, 11396, 11537, 11725, 12105, 12071, 11851, 12000, 12202, 11848, 11642, 11710, 11746, 11815, 11843, 11824, 11660, 11740, 11484, 11411, 11672, 11650, 11825, 12017, 11738, 11991, 11939, 11814, 11522, 11293, 11205, 11747, 11583, 11301, 11305, 11097, 11550, 11629, 11780, 12083, 12058, 12092, 12106, 11849, 11680, 11903, 11843, 11981, 12041, 12098, 12206, 12862, 12826, 13212, 13100, 13038, 13072, 13058, 13724, 13914, 13832, 14186, 14428, 14493, 14034, 14029, 14462, 14610, 14521, 14402, 14096, 14309, 14183, 13766, 13576, 13714, 13823, 13764, 13866, 14022, 13961, 14063, 13757, 14040, 13985, 14054, 13775, 13966, 14162, 14310, 14671, 14743, 15265, 14857, 14316, 13690, 13928, 12982, 12685, 13099, 13760, 13720, 13777, 13869, 13986, 13156, 12877, 13088, 13638, 14072, 13973, 13967, 14200, 14428, 14092, 13775, 13956, 14128, 14273, 14292, 13931, 13887, 13840, 13786, 13923, 14242, 14232, 14269, 14129, 14157, 14304, 14210, 14318, 13898, 14064, 14446, 14105, 14306, 14038, 14027, 14153, 14159, 13823, 13432, 13527, 13386, 13300, 13682, 13596, 13665, 12879, 12212, 11465, 12285, 12428, 12371, 12908, 13178, 13350, 13804, 13648, 13484, 13568, 13894, 13538, 13644, 13890, 13850, 13914, 14023, 14515, 14375, 14311, 14333, 14344, 14395, 15121, 14704, 14750, 14748, 15443, 15682, 15505, 15476, 15483, 15296, 15393],
     ),
     Question(
         ticker='3659.T',
@@ -17,6 +19,8 @@ QUESTIONS = [
         prices=[10000, 10336, 10306, 9767, 9391, 9048, 9347, 9912, 9960, 9099, 9471, 9139, 9092, 9110, 8811, 8588, 9504, 10186, 10051, 10507, 10773, 10908, 11054, 10941, 10835, 10697, 10642, 10806, 10865, 11036, 10182, 10722, 11437, 11437, 11620, 11255, 11200, 11109, 11200, 10868, 10762, 11237, 11510, 10825, 11036, 10938, 11091, 11510, 11583, 11419, 11401, 11748, 11565, 11073, 11310, 11146, 10854, 11018, 11054, 10814, 10653, 10628, 10731, 10447, 10666, 10773, 10210, 10223, 9947, 9548, 9672, 10164, 9872, 9694, 9739, 9493, 9289, 10093, 10047, 10224, 10288, 10325, 10794, 10783, 10567, 10591, 10197, 9969, 9564, 9515, 9538, 9872, 9405, 9121, 9323, 9624, 10423, 10549, 10914, 10978, 11182, 11514, 11667, 11510, 11799, 10941, 10451, 10808, 9754, 9374, 10195, 9982, 8977, 8400, 8829, 8645, 10237, 10545, 9310, 9497, 9148, 9017, 9314, 9128, 9223, 9163, 9451, 9331, 9157, 9059, 8783, 8951, 8796, 8882, 9157, 9061, 9011, 9146, 9582, 9719, 9889, 8997, 9520, 10064, 10135, 10036, 10602, 10401, 10766, 10854, 11175, 11408, 12112, 12437, 11919, 11510, 12065, 11288, 10996, 10259, 10750, 10945, 10755, 10410, 10702, 9960, 9655, 9839, 10224, 10305, 10489, 10228, 10137, 10038, 9635, 9424, 9697, 9776, 9663, 9360, 7725, 7645, 8015, 7581, 7703, 7871, 8006, 7997, 8136, 8429, 8546, 8371, 8063, 7773, 7767, 7674, 7782, 7395, 7359, 7948, 7663, 7484, 7610, 7382, 7404, 7284, 7300, 7574, 7483, 7561, 7444, 7293, 7215, 7702, 7860, 7727, 8200, 8147, 8296, 8267, 9449, 9303, 9495, 9529, 9449, 9495, 9613, 9933, 10305, 10573, 10445, 10363, 10308, 10277, 9949, 10111, 9982, 9803, 10312, 10677, 11116, 12072, 12182, 12240, 12251, 12244, 12463],
         choices=['NEXON Co.', 'Toei Animation Co.', 'Square Enix Holdings Co.', 'ANYCOLOR Inc.'],
         blurb='NEXON Co. stock price quiz item. The company name is in English.',
+        index_label='Nikkei 225',
+        index_prices=[10000, 9987, 10200, 10057, 10010, 9555, 9552, 9758, 9803, 9485, 9817, 9721, 9917, 9973, 9833, 10020, 10109, 10097, 10164, 10181, 10204, 10081, 10087, 10179, 9847, 9583, 9561, 9434, 9390, 9562, 9449, 9599, 9904, 9918, 9906, 10009, 10003, 9942, 9953, 9925, 9948, 10208, 10348, 9841, 9882, 9913, 9948, 10137, 10055, 9990, 10179, 10361, 10326, 10273, 10528, 10572, 10624, 10879, 11238, 11135, 11326, 11396, 11537, 11725, 12105, 12071, 11851, 12000, 12202, 11848, 11642, 11710, 11746, 11815, 11843, 11824, 11660, 11740, 11484, 11411, 11672, 11650, 11825, 12017, 11738, 11991, 11939, 11814, 11522, 11293, 11205, 11747, 11583, 11301, 11305, 11097, 11550, 11629, 11780, 12083, 12058, 12092, 12106, 11849, 11680, 11903, 11843, 11981, 12041, 12098, 12206, 12862, 12826, 13212, 13100, 13038, 13072, 13058, 13724, 13914, 13832, 14186, 14428, 14493, 14034, 14029, 14462, 14610, 14521, 14402, 14096, 14309, 14183, 13766, 13576, 13714, 13823, 13764, 13866, 14022, 13961, 14063, 13757, 14040, 13985, 14054, 13775, 13966, 14162, 14310, 14671, 14743, 15265, 14857, 14316, 13690, 13928, 12982, 12685, 13099, 13760, 13720, 13777, 13869, 13986, 13156, 12877, 13088, 13638, 14072, 13973, 13967, 14200, 14428, 14092, 13775, 13956, 14128, 14273, 14292, 13931, 13887, 13840, 13786, 13923, 14242, 14232, 14269, 14129, 14157, 14304, 14210, 14318, 13898, 14064, 14446, 14105, 14306, 14038, 14027, 14153, 14159, 13823, 13432, 13527, 13386, 13300, 13682, 13596, 13665, 12879, 12212, 11465, 12285, 12428, 12371, 12908, 13178, 13350, 13804, 13648, 13484, 13568, 13894, 13538, 13644, 13890, 13850, 13914, 14023, 14515, 14375, 14311, 14333, 14344, 14395, 15121, 14704, 14750, 14748, 15443, 15682, 15505, 15476, 15483, 15296, 15393],
     ),
     Question(
         ticker='4816.T',
@@ -25,6 +29,8 @@ QUESTIONS = [
         prices=[10000, 10206, 10047, 10071, 10261, 10237, 10071, 10451, 10040, 9992, 10791, 11226, 11661, 12112, 12136, 10688, 10894, 11068, 10934, 11614, 11408, 11440, 11131, 11297, 11210, 10514, 10815, 10506, 10356, 10142, 9335, 10032, 10506, 10957, 10150, 10174, 10403, 10380, 10095, 10356, 10799, 10680, 10625, 10182, 9731, 10047, 10079, 10411, 10055, 10150, 10253, 10443, 10775, 10601, 10665, 10403, 10419, 11076, 10712, 10190, 10229, 10720, 11195, 10910, 11353, 11946, 10728, 10807, 10443, 10174, 10071, 10079, 10245, 9707, 9866, 10435, 9826, 9691, 9810, 9509, 9612, 9778, 9731, 10625, 10807, 10514, 10388, 10475, 10435, 10332, 10585, 10704, 10546, 10791, 10411, 10372, 11329, 12223, 11970, 12112, 12017, 11922, 12160, 12508, 13165, 15847, 14747, 15538, 15032, 14976, 14755, 14984, 14755, 14858, 13687, 15190, 15506, 14415, 14454, 12896, 12690, 13212, 13924, 12587, 11835, 12144, 11796, 12286, 12006, 12085, 11452, 11084, 10811, 10546, 10320, 10415, 10364, 10190, 10245, 9454, 10059, 9513, 9011, 9359, 9019, 8794, 8794, 9146, 9470, 9858, 9798, 9862, 9976, 9668, 9403, 8884, 9248, 9715, 10071, 11048, 11618, 11907, 11630, 12223, 12500, 12164, 12500, 12797, 12876, 12559, 12065, 11966, 12619, 12302, 12025, 12421, 12856, 13766, 13469, 13825, 14260, 13964, 14557, 14102, 14122, 14438, 14359, 14794, 14953, 14557, 13983, 13766, 13627, 13370, 12975, 13687, 14399, 12579, 12302, 12816, 13528, 13509, 13449, 13034, 12599, 11867, 11986, 12480, 12777, 12698, 12085, 12282, 12006, 12856, 13370, 14419, 13370, 13410, 12797, 12698, 13034, 12164, 12441, 12065, 11986, 12638, 12955, 12935, 12896, 12915, 12718, 12816, 12994, 12935, 12876, 13133, 12955, 12797, 12896, 13983, 13528, 13034, 13232, 12896, 12421, 12085, 11847],
         choices=['Toei Animation Co.', 'NEXON Co.', 'Koei Tecmo Holdings Co.', '(unknown)'],
         blurb='Toei Animation Co. stock price quiz item. The company name is in English.',
+        index_label='Nikkei 225',
+        index_prices=[10000, 9987, 10200, 10057, 10010, 9555, 9552, 9758, 9803, 9485, 9817, 9721, 9917, 9973, 9833, 10020, 10109, 10097, 10164, 10181, 10204, 10081, 10087, 10179, 9847, 9583, 9561, 9434, 9390, 9562, 9449, 9599, 9904, 9918, 9906, 10009, 10003, 9942, 9953, 9925, 9948, 10208, 10348, 9841, 9882, 9913, 9948, 10137, 10055, 9990, 10179, 10361, 10326, 10273, 10528, 10572, 10624, 10879, 11238, 11135, 11326, 11396, 11537, 11725, 12105, 12071, 11851, 12000, 12202, 11848, 11642, 11710, 11746, 11815, 11843, 11824, 11660, 11740, 11484, 11411, 11672, 11650, 11825, 12017, 11738, 11991, 11939, 11814, 11522, 11293, 11205, 11747, 11583, 11301, 11305, 11097, 11550, 11629, 11780, 12083, 12058, 12092, 12106, 11849, 11680, 11903, 11843, 11981, 12041, 12098, 12206, 12862, 12826, 13212, 13100, 13038, 13072, 13058, 13724, 13914, 13832, 14186, 14428, 14493, 14034, 14029, 14462, 14610, 14521, 14402, 14096, 14309, 14183, 13766, 13576, 13714, 13823, 13764, 13866, 14022, 13961, 14063, 13757, 14040, 13985, 14054, 13775, 13966, 14162, 14310, 14671, 14743, 15265, 14857, 14316, 13690, 13928, 12982, 12685, 13099, 13760, 13720, 13777, 13869, 13986, 13156, 12877, 13088, 13638, 14072, 13973, 13967, 14200, 14428, 14092, 13775, 13956, 14128, 14273, 14292, 13931, 13887, 13840, 13786, 13923, 14242, 14232, 14269, 14129, 14157, 14304, 14210, 14318, 13898, 14064, 14446, 14105, 14306, 14038, 14027, 14153, 14159, 13823, 13432, 13527, 13386, 13300, 13682, 13596, 13665, 12879, 12212, 11465, 12285, 12428, 12371, 12908, 13178, 13350, 13804, 13648, 13484, 13568, 13894, 13538, 13644, 13890, 13850, 13914, 14023, 14515, 14375, 14311, 14333, 14344, 14395, 15121, 14704, 14750, 14748, 15443, 15682, 15505, 15476, 15483, 15296, 15393],
     ),
     Question(
         ticker='5032.T',
@@ -33,6 +39,9 @@ QUESTIONS = [
         prices=[10000, 9520, 9616, 10261, 14966, 13786, 13992, 15501, 15789, 15953, 16132, 16996, 17545, 16982, 16022, 15267, 14376, 16392, 15610, 15158, 14348, 11907, 10562, 10453, 8875, 8148, 7888, 8436, 8203, 9053, 8601, 8148, 7298, 6968, 7092, 6982, 6982, 6564, 6550, 6523, 6015, 5974, 6255, 5652, 6372, 7695, 8999, 8203, 8107, 7805, 7901, 8121, 7709, 7531, 7092, 7627, 7572, 7407, 8038, 8011, 7791, 8313, 9657, 9781, 9904, 10425, 10919, 9904, 10604, 10686, 10178, 10700, 10796, 10027, 10014, 9561, 9163, 8916, 8519, 8601, 8628, 8944, 9287, 10165, 9534, 9630, 10247, 10370, 9794, 9136, 9218, 9643, 9122, 9602, 9424, 8752, 9753, 9890, 9945, 10000, 10274, 10206, 10219, 10521, 10549, 10151, 8697, 9040, 8793, 8642, 8587, 9328, 8861, 9150, 9986, 10384, 10302, 9918, 9136, 8464, 8532, 8422, 8916, 8491, 9163, 8683, 7117, 7413, 7073, 6886, 6787, 6776, 6373, 6348, 6107, 5951, 6219, 6362, 6359, 6132, 6173, 5860, 5838, 5912, 6060, 6529, 7797, 7487, 7506, 7695, 7383, 6971, 6727, 6886, 7034, 6985, 7095, 6667, 5981, 6047, 6162, 6650, 6826, 7108, 6859, 6538, 6340, 6944, 6765, 6722, 6872, 6664, 6505, 6343, 6162, 6077, 5737, 5907, 6030, 5995, 5885, 5764, 5926, 5937, 5874, 5684, 6088, 6595, 7627, 7835, 7901, 7726, 7188, 7682, 7457, 8546, 8326, 8916, 8834, 9218, 9163, 9108, 8299, 7896, 7660, 7679, 8060, 9108, 9575, 8999, 8861, 8957, 8697, 9712, 9328, 9822, 9931, 10151, 10384, 10480, 10096, 10384, 10412, 10768, 10727, 10713, 11207, 13594, 14156, 14184, 13964, 14102, 12977, 13374, 12894, 13320, 12949, 12675, 13073, 13347, 13361, 13320, 13580, 13182, 13265, 13086, 12702],
         choices=['(unknown)', 'COVER Corporation', 'Square Enix Holdings Co.', 'ANYCOLOR Inc.'],
         blurb='ANYCOLOR Inc. stock price quiz item. The company name is in English.',
+        index_label='Nikkei 225',
+        index_offset=1,
+        index_prices=[9985, 10146, 10345, 9966, 9816, 9462, 9477, 9873, 9543, 9680, 9763, 9851, 9799, 10001, 10076, 10218, 10133, 10102, 10225, 10111, 10057, 9969, 10106, 9951, 9540, 9546, 9433, 9335, 9561, 9335, 9546, 9869, 9899, 9886, 10012, 9972, 9979, 9946, 9799, 9922, 10096, 10283, 10062, 9765, 9930, 9933, 10044, 10226, 9948, 10152, 10308, 10360, 10347, 10432, 10466, 10530, 10789, 11138, 11092, 11291, 11260, 11752, 11664, 12112, 12064, 12026, 11763, 11998, 12052, 11637, 11720, 11892, 11822, 11891, 12102, 11638, 11642, 11655, 11370, 11572, 11630, 11792, 11943, 11788, 11824, 12018, 11714, 11703, 11482, 11234, 11545, 11445, 11363, 11229, 11204, 11424, 11667, 11774, 12118, 12070, 12156, 12046, 12014, 11879, 11873, 11919, 12174, 12022, 12125, 12066, 12671, 12877, 13001, 13096, 13024, 13019, 13073, 13339, 13795, 13869, 14184, 14159, 14496, 14348, 13989, 14367, 14782, 14736, 14389, 14379, 14379, 14288, 13724, 13535, 13603, 13837, 13811, 13802, 14070, 14080, 13971, 13939, 14071, 13992, 14148, 14032, 13944, 14028, 14223, 14488, 14790, 15123, 14922, 14484, 14155, 13907, 13783, 12536, 12662, 13277, 13760, 13869, 13872, 13991, 13252, 13072, 13225, 13432, 13691, 13708, 13937, 14076, 14318, 14067, 13886, 13706, 14199, 13909, 14280, 13998, 13817, 13747, 13897, 13813, 14199, 14157, 14406, 14231, 13991, 14146, 14422, 14454, 13909, 13901, 14333, 14304, 14285, 14026, 14022, 14266, 14197, 14018, 13830, 13496, 13335, 13311, 13519, 13621, 13747, 12876, 12558, 11934, 12142, 12263, 12393, 12667, 13031, 13296, 13609, 13649, 13567, 13434, 13637, 13546, 13576, 13814, 13678, 14058, 13866, 14310, 14456, 14392, 14396, 14265, 14425, 14884, 14821, 14847, 14659, 15119, 15418, 15743, 15413, 15372, 15252, 15393],
     ),
     Question(
         ticker='5253.T',
@@ -41,6 +50,8 @@ QUESTIONS = [
         prices=[10000, 9687, 9135, 9169, 9537, 10879, 9877, 9843, 11281, 11771, 11764, 13099, 13154, 13011, 13590, 14986, 15722, 16029, 19026, 20395, 18249, 19237, 18542, 17071, 17609, 17405, 16056, 16587, 16723, 15811, 16465, 15361, 14183, 14598, 14789, 15879, 16451, 17323, 17466, 18610, 16287, 17405, 16826, 17302, 18379, 18134, 18052, 15606, 15838, 15960, 17507, 18781, 18290, 19223, 20470, 20245, 21662, 21560, 20300, 18890, 18719, 17766, 18467, 19244, 18168, 18672, 17364, 18243, 20054, 19591, 19482, 18910, 17200, 17207, 16792, 17139, 16989, 16342, 16751, 16035, 16710, 16485, 16124, 15266, 14687, 14142, 12977, 12752, 12425, 11635, 11328, 11540, 12847, 13038, 11247, 11185, 11757, 12023, 12193, 13243, 12010, 14026, 13883, 13365, 13229, 13372, 14571, 14162, 13542, 13127, 13304, 10565, 11832, 11580, 11022, 11219, 12493, 12125, 11594, 11764, 12350, 12405, 12629, 12820, 11894, 12037, 11485, 11519, 10947, 10661, 10606, 14264, 15082, 15586, 16880, 17602, 18392, 17704, 16403, 17282, 18379, 18154, 17813, 18726, 18052, 17337, 19244, 18924, 18992, 18883, 19087, 18896, 21151, 23093, 17888, 17044, 17105, 18140, 18876, 18311, 18113, 19496, 18583, 17105, 15790, 13651, 16069, 16117, 14557, 14060, 14101, 15163, 16056, 13154, 13501, 13665, 13876, 14094, 13351, 13665, 14339, 15293, 15593, 15334, 15674, 14074, 13822, 14326, 14680, 14230, 14891, 14550, 14986, 15102, 14905, 15599, 15484, 15538, 14469, 13426],
         choices=['Capcom Co.', 'COVER Corporation', 'Koei Tecmo Holdings Co.', 'Toyota Motor Corporation'],
         blurb='COVER Corporation stock price quiz item. The company name is in English.',
+        index_label='Nikkei 225',
+        index_prices=[10080, 10190, 9932, 10095, 10301, 10342, 10337, 10288, 10541, 10528, 10710, 11053, 11192, 11177, 11166, 11647, 11439, 11937, 12185, 12138, 11821, 12015, 12083, 11709, 11548, 11747, 11678, 11810, 11992, 11626, 11705, 11590, 11433, 11517, 11433, 11689, 11908, 11927, 11849, 12123, 11775, 11682, 11517, 11036, 11477, 11683, 11584, 11207, 11063, 11156, 11825, 11802, 11820, 12142, 12093, 12078, 12086, 12091, 11855, 11817, 12009, 11991, 12176, 12034, 12451, 12979, 12822, 13202, 12925, 13118, 13143, 13327, 13630, 13908, 14135, 14174, 14500, 14315, 14026, 13993, 14755, 14604, 14594, 14262, 14224, 14259, 13908, 13401, 13904, 13884, 14039, 13820, 13877, 14124, 14136, 14047, 13914, 13915, 14113, 13998, 13912, 13953, 14340, 14327, 14791, 15032, 14891, 14506, 14314, 13617, 14136, 11373, 12592, 13174, 13516, 13814, 13842, 13972, 13393, 13092, 13316, 13152, 13716, 14399, 13668, 14219, 14237, 14164, 14083, 13789, 14064, 13757, 14237, 14235, 13970, 13865, 14020, 13864, 14189, 14132, 14234, 14264, 14032, 14112, 14562, 14491, 14168, 13945, 14109, 14436, 14249, 13926, 14123, 14086, 14162, 13983, 13789, 13660, 13631, 13301, 13395, 13648, 13658, 13420, 12915, 11256, 12512, 12388, 12555, 12605, 12957, 13315, 13558, 13784, 13556, 13371, 13638, 13725, 13646, 13770, 13800, 13932, 13883, 14078, 14637, 14383, 14348, 14305, 14339, 14379, 14987, 14697, 14566, 14843, 15644, 15803, 15404, 15326, 15443, 15161],
     ),
     Question(
         ticker='7203.T',
@@ -49,6 +60,9 @@ QUESTIONS = [
         prices=[10000, 9693, 9900, 9836, 9662, 9650, 9296, 9239, 9517, 9469, 9517, 9536, 9593, 9660, 9586, 9531, 9522, 9498, 9531, 9776, 9567, 9284, 9224, 9367, 9236, 8603, 8675, 8646, 8601, 8744, 8649, 8872, 9096, 9044, 9055, 9105, 9046, 8958, 9077, 8875, 8863, 8967, 9077, 8870, 8518, 8570, 8518, 8765, 9036, 8658, 8677, 8727, 8630, 8565, 8837, 8832, 9117, 9153, 9324, 9310, 9177, 9246, 9755, 9762, 10992, 10721, 10661, 10645, 10985, 11140, 10754, 10523, 10902, 11059, 11042, 11637, 11599, 11399, 11511, 11178, 11470, 11594, 11968, 12320, 12386, 12884, 13704, 13269, 13076, 12786, 12325, 12615, 12658, 12586, 12360, 12555, 12905, 13476, 13338, 13609, 13229, 13338, 13336, 13169, 13298, 12760, 12374, 12581, 12072, 12163, 12855, 13533, 13583, 14095, 14083, 14197, 14014, 14918, 15813, 16093, 16246, 16964, 17231, 17744, 17178, 16388, 16974, 18425, 18335, 17316, 17449, 17968, 17925, 17116, 16736, 16640, 17154, 17031, 16017, 15951, 16355, 16146, 16131, 15898, 15575, 15484, 14828, 14785, 14989, 15527, 15860, 15793, 15660, 15556, 14908, 14751, 14118, 12843, 11982, 11646, 12646, 12786, 12762, 13069, 13233, 12448, 11894, 11682, 12422, 12579, 12099, 12379, 12220, 12191, 12137, 12110, 12372, 12903, 12558, 12670, 12667, 12734, 12727, 12693, 12141, 12520, 12589, 12936, 12717, 13188, 14107, 14970, 14623, 13835, 13267, 13873, 13904, 14033, 13671, 13440, 13445, 13343, 12877, 13248, 13103, 13338, 13141, 13136, 13536, 13740, 12448, 11984, 11556, 11516, 11892, 11756, 12646, 12986, 12877, 13103, 12643, 12717, 12484, 12522, 12805, 12612, 12646, 12158, 12225, 11865, 11689, 11673, 11823, 11837, 12046, 11994, 13583, 13348, 12831, 12748, 13195, 13348, 13919, 14004, 13821, 13602, 13823],
         choices=['Toei Animation Co.', 'BANDAI NAMCO Holdings Inc.', 'Toyota Motor Corporation', 'COVER Corporation'],
         blurb='Toyota Motor Corporation stock price quiz item. The company name is in English.',
+        index_label='Nikkei 225',
+        index_offset=1,
+        index_prices=[9985, 10146, 10345, 9966, 9816, 9462, 9477, 9873, 9543, 9680, 9763, 9851, 9799, 10001, 10076, 10218, 10133, 10102, 10225, 10111, 10057, 9969, 10106, 9951, 9540, 9546, 9433, 9335, 9561, 9335, 9546, 9869, 9899, 9886, 10012, 9972, 9979, 9946, 9799, 9922, 10096, 10283, 10062, 9765, 9930, 9933, 10044, 10226, 9948, 10152, 10308, 10360, 10347, 10432, 10466, 10530, 10789, 11138, 11092, 11291, 11260, 11752, 11664, 12112, 12064, 12026, 11763, 11998, 12052, 11637, 11720, 11892, 11822, 11891, 12102, 11638, 11642, 11655, 11370, 11572, 11630, 11792, 11943, 11788, 11824, 12018, 11714, 11703, 11482, 11234, 11545, 11445, 11363, 11229, 11204, 11424, 11667, 11774, 12118, 12070, 12156, 12046, 12014, 11879, 11873, 11919, 12174, 12022, 12125, 12066, 12671, 12877, 13001, 13096, 13024, 13019, 13073, 13339, 13795, 13869, 14184, 14159, 14496, 14348, 13989, 14367, 14782, 14736, 14389, 14379, 14379, 14288, 13724, 13535, 13603, 13837, 13811, 13802, 14070, 14080, 13971, 13939, 14071, 13992, 14148, 14032, 13944, 14028, 14223, 14488, 14790, 15123, 14922, 14484, 14155, 13907, 13783, 12536, 12662, 13277, 13760, 13869, 13872, 13991, 13252, 13072, 13225, 13432, 13691, 13708, 13937, 14076, 14318, 14067, 13886, 13706, 14199, 13909, 14280, 13998, 13817, 13747, 13897, 13813, 14199, 14157, 14406, 14231, 13991, 14146, 14422, 14454, 13909, 13901, 14333, 14304, 14285, 14026, 14022, 14266, 14197, 14018, 13830, 13496, 13335, 13311, 13519, 13621, 13747, 12876, 12558, 11934, 12142, 12263, 12393, 12667, 13031, 13296, 13609, 13649, 13567, 13434, 13637, 13546, 13576, 13814, 13678, 14058, 13866, 14310, 14456, 14392, 14396, 14265, 14425, 14884, 14821, 14847, 14659, 15119, 15418, 15743, 15413, 15372, 15252, 15393],
     ),
     Question(
         ticker='7832.T',
@@ -57,6 +71,8 @@ QUESTIONS = [
         prices=[10000, 9674, 10044, 9872, 9772, 9297, 9399, 9619, 9558, 9346, 9676, 9545, 9712, 9687, 9421, 9328, 8781, 8624, 8760, 8886, 8846, 8797, 8767, 8765, 8573, 8275, 8210, 8183, 8033, 8070, 7827, 8188, 8479, 8474, 8498, 8485, 8624, 8606, 8440, 8400, 8230, 8406, 8475, 8113, 8088, 8262, 8469, 8411, 8486, 8559, 8647, 8929, 8810, 8845, 9103, 9233, 9582, 9726, 10039, 9694, 9803, 9927, 10078, 10098, 10314, 10181, 9676, 9948, 9833, 9511, 9192, 9478, 9357, 9213, 9319, 9301, 9272, 9768, 9989, 10051, 10246, 9945, 9957, 9989, 9596, 9715, 9472, 9304, 9071, 9053, 8968, 9059, 9121, 9174, 9159, 9012, 9292, 8870, 8935, 9056, 8908, 8824, 8690, 8331, 8130, 8125, 8014, 8198, 8150, 8346, 8581, 8970, 9213, 8991, 9186, 9449, 9345, 8935, 9227, 8445, 8812, 8684, 8733, 8609, 8525, 8452, 8536, 8424, 8262, 8253, 8172, 8488, 8504, 8554, 8559, 8649, 8758, 8784, 9437, 9242, 9094, 8858, 8593, 8774, 8935, 8926, 8826, 8854, 9106, 9272, 9242, 9083, 9502, 9526, 9372, 9343, 9446, 8792, 8753, 8485, 8697, 8985, 9216, 9298, 9195, 9623, 9363, 9511, 9812, 9954, 9703, 9703, 10323, 9906, 9526, 9136, 9531, 9514, 9886, 10039, 9676, 9351, 9278, 9520, 9387, 9455, 9741, 10568, 10964, 10984, 11037, 10967, 10453, 10341, 10214, 10586, 11117, 11401, 12960, 13931, 14318, 14551, 15053, 14764, 14953, 14631, 14811, 14855, 15322, 15464, 14838, 14031, 13240, 14232, 14528, 14593, 14158, 14616, 13633, 14203, 13863, 13630, 14076, 13361, 13441, 13683, 13665, 14223, 14451, 14826, 14944, 14161, 13727, 13674, 13155, 13429, 14312, 14454, 14711, 15080, 16140, 16411, 16119, 15549, 15139, 14882, 14773],
         choices=['NEXON Co.', 'BANDAI NAMCO Holdings Inc.', 'Nintendo Co.', '(unknown)'],
         blurb='BANDAI NAMCO Holdings Inc. stock price quiz item. The company name is in English.',
+        index_label='Nikkei 225',
+        index_prices=[10000, 9987, 10200, 10057, 10010, 9555, 9552, 9758, 9803, 9485, 9817, 9721, 9917, 9973, 9833, 10020, 10109, 10097, 10164, 10181, 10204, 10081, 10087, 10179, 9847, 9583, 9561, 9434, 9390, 9562, 9449, 9599, 9904, 9918, 9906, 10009, 10003, 9942, 9953, 9925, 9948, 10208, 10348, 9841, 9882, 9913, 9948, 10137, 10055, 9990, 10179, 10361, 10326, 10273, 10528, 10572, 10624, 10879, 11238, 11135, 11326, 11396, 11537, 11725, 12105, 12071, 11851, 12000, 12202, 11848, 11642, 11710, 11746, 11815, 11843, 11824, 11660, 11740, 11484, 11411, 11672, 11650, 11825, 12017, 11738, 11991, 11939, 11814, 11522, 11293, 11205, 11747, 11583, 11301, 11305, 11097, 11550, 11629, 11780, 12083, 12058, 12092, 12106, 11849, 11680, 11903, 11843, 11981, 12041, 12098, 12206, 12862, 12826, 13212, 13100, 13038, 13072, 13058, 13724, 13914, 13832, 14186, 14428, 14493, 14034, 14029, 14462, 14610, 14521, 14402, 14096, 14309, 14183, 13766, 13576, 13714, 13823, 13764, 13866, 14022, 13961, 14063, 13757, 14040, 13985, 14054, 13775, 13966, 14162, 14310, 14671, 14743, 15265, 14857, 14316, 13690, 13928, 12982, 12685, 13099, 13760, 13720, 13777, 13869, 13986, 13156, 12877, 13088, 13638, 14072, 13973, 13967, 14200, 14428, 14092, 13775, 13956, 14128, 14273, 14292, 13931, 13887, 13840, 13786, 13923, 14242, 14232, 14269, 14129, 14157, 14304, 14210, 14318, 13898, 14064, 14446, 14105, 14306, 14038, 14027, 14153, 14159, 13823, 13432, 13527, 13386, 13300, 13682, 13596, 13665, 12879, 12212, 11465, 12285, 12428, 12371, 12908, 13178, 13350, 13804, 13648, 13484, 13568, 13894, 13538, 13644, 13890, 13850, 13914, 14023, 14515, 14375, 14311, 14333, 14344, 14395, 15121, 14704, 14750, 14748, 15443, 15682, 15505, 15476, 15483, 15296, 15393],
     ),
     Question(
         ticker='7974.T',
@@ -65,6 +81,8 @@ QUESTIONS = [
         prices=[10000, 9995, 10205, 10744, 10826, 10417, 10581, 10594, 10604, 10559, 10707, 10569, 10632, 10629, 10425, 10126, 9909, 10294, 10390, 10341, 10170, 10091, 10009, 10067, 9792, 9856, 9816, 9687, 9601, 9538, 9613, 9648, 9760, 9802, 9774, 9848, 9293, 9343, 9568, 9275, 8969, 9067, 9153, 8869, 9007, 8888, 8900, 8984, 9184, 9466, 9419, 9736, 9666, 9837, 9965, 10033, 10082, 10375, 10611, 10289, 10489, 10594, 10599, 10727, 10900, 10930, 10909, 11417, 11534, 11056, 10956, 11187, 11252, 11282, 11126, 11128, 10912, 10946, 11017, 10730, 10760, 10807, 10975, 11072, 11154, 11126, 10972, 10898, 10772, 10786, 10935, 11119, 10721, 10683, 10821, 10711, 11131, 11861, 12282, 12350, 11987, 12010, 12103, 11930, 11903, 12127, 11930, 12162, 12234, 12886, 13199, 14227, 13903, 14188, 13959, 14483, 14842, 14654, 15251, 15538, 14710, 14898, 14856, 14584, 14554, 14400, 14635, 14532, 14462, 14265, 13555, 13637, 13427, 13288, 13129, 13393, 13264, 13302, 14770, 14889, 14623, 14511, 14635, 15496, 15330, 14962, 14728, 14863, 15115, 14982, 15561, 15393, 15934, 15318, 14940, 14498, 14617, 13859, 13392, 13570, 14215, 14451, 14202, 13780, 13878, 13593, 13201, 13213, 13430, 14001, 13476, 13558, 13793, 13910, 14041, 14145, 14288, 14262, 14183, 14446, 14181, 14316, 14299, 14931, 15505, 16276, 15824, 15976, 16223, 16058, 16214, 15882, 15967, 16748, 15586, 16738, 17948, 17913, 18736, 19147, 19690, 20592, 19804, 19541, 19568, 17519, 17825, 17983, 18718, 19314, 17869, 17470, 16468, 18123, 18114, 17816, 19961, 21266, 21047, 21021, 20382, 19725, 20951, 21590, 20478, 20846, 20425, 20916, 23245, 22562, 23866, 22763, 23113, 22203, 21931, 22711, 23113, 22439, 22054, 23604, 24838, 25214, 24199, 24076, 23516, 22956, 23236],
         choices=['Square Enix Holdings Co.', 'Nintendo Co.', 'Toho Co.', 'Koei Tecmo Holdings Co.'],
         blurb='Nintendo Co. stock price quiz item. The company name is in English.',
+        index_label='Nikkei 225',
+        index_prices=[10000, 9987, 10200, 10057, 10010, 9555, 9552, 9758, 9803, 9485, 9817, 9721, 9917, 9973, 9833, 10020, 10109, 10097, 10164, 10181, 10204, 10081, 10087, 10179, 9847, 9583, 9561, 9434, 9390, 9562, 9449, 9599, 9904, 9918, 9906, 10009, 10003, 9942, 9953, 9925, 9948, 10208, 10348, 9841, 9882, 9913, 9948, 10137, 10055, 9990, 10179, 10361, 10326, 10273, 10528, 10572, 10624, 10879, 11238, 11135, 11326, 11396, 11537, 11725, 12105, 12071, 11851, 12000, 12202, 11848, 11642, 11710, 11746, 11815, 11843, 11824, 11660, 11740, 11484, 11411, 11672, 11650, 11825, 12017, 11738, 11991, 11939, 11814, 11522, 11293, 11205, 11747, 11583, 11301, 11305, 11097, 11550, 11629, 11780, 12083, 12058, 12092, 12106, 11849, 11680, 11903, 11843, 11981, 12041, 12098, 12206, 12862, 12826, 13212, 13100, 13038, 13072, 13058, 13724, 13914, 13832, 14186, 14428, 14493, 14034, 14029, 14462, 14610, 14521, 14402, 14096, 14309, 14183, 13766, 13576, 13714, 13823, 13764, 13866, 14022, 13961, 14063, 13757, 14040, 13985, 14054, 13775, 13966, 14162, 14310, 14671, 14743, 15265, 14857, 14316, 13690, 13928, 12982, 12685, 13099, 13760, 13720, 13777, 13869, 13986, 13156, 12877, 13088, 13638, 14072, 13973, 13967, 14200, 14428, 14092, 13775, 13956, 14128, 14273, 14292, 13931, 13887, 13840, 13786, 13923, 14242, 14232, 14269, 14129, 14157, 14304, 14210, 14318, 13898, 14064, 14446, 14105, 14306, 14038, 14027, 14153, 14159, 13823, 13432, 13527, 13386, 13300, 13682, 13596, 13665, 12879, 12212, 11465, 12285, 12428, 12371, 12908, 13178, 13350, 13804, 13648, 13484, 13568, 13894, 13538, 13644, 13890, 13850, 13914, 14023, 14515, 14375, 14311, 14333, 14344, 14395, 15121, 14704, 14750, 14748, 15443, 15682, 15505, 15476, 15483, 15296, 15393],
     ),
     Question(
         ticker='9602.T',
@@ -73,6 +91,8 @@ QUESTIONS = [
         prices=[10000, 9830, 10170, 9736, 9887, 9642, 9943, 9981, 9755, 9217, 9717, 9792, 9868, 10000, 9698, 9292, 9660, 9981, 10094, 10057, 9925, 9849, 9906, 10113, 9736, 9642, 9642, 9585, 9132, 9038, 8528, 8679, 9028, 9028, 8972, 8943, 9000, 8943, 8925, 8972, 8915, 8962, 9321, 9236, 9349, 9302, 9387, 9566, 9604, 9604, 9943, 9981, 9868, 9887, 10189, 10321, 10264, 10774, 10774, 10358, 10396, 10623, 10513, 10521, 10760, 10326, 10240, 10370, 10375, 10117, 10272, 10811, 10549, 10355, 10291, 10364, 10430, 10542, 10304, 10257, 10266, 10453, 10645, 10566, 10694, 10409, 10223, 10032, 9766, 9574, 9494, 9581, 9221, 9181, 9279, 9415, 9809, 9828, 9589, 9566, 9585, 9723, 9681, 10040, 10104, 9764, 8877, 8942, 8998, 8998, 9296, 9330, 9130, 9017, 9023, 9070, 9132, 8932, 8862, 8881, 9304, 9366, 9187, 9208, 9249, 9457, 9660, 9655, 9470, 9236, 9160, 9208, 9379, 10045, 10083, 9906, 9734, 9458, 9606, 9351, 9234, 9285, 9213, 9589, 9660, 8853, 8658, 8766, 8768, 8875, 8936, 8660, 8540, 9583, 9921, 9894, 10175, 9700, 9745, 10019, 9911, 10057, 10430, 10615, 10921, 11036, 10870, 11028, 11138, 11140, 11004, 10932, 10881, 10721, 10968, 10834, 11006, 10994, 11134, 11515, 11334, 11215, 11357, 11681, 12330, 12581, 12249, 12909, 12672, 12504, 11836, 11508, 11453, 11942, 12453, 12394, 13074, 13221, 13436, 13372, 13494, 13547, 13562, 13370, 13092, 12887, 13036, 13721, 13732, 14143, 14045, 14375, 14077, 15057, 14932, 15666, 14800, 14613, 14483, 14104, 14440, 13881, 14634, 14457, 14489, 14498, 14791, 15028, 15764, 15377, 15440, 15747, 15532, 15653, 15636, 17851, 18308, 17894, 18300, 17587, 18258, 18592, 18209, 18383, 17751, 17547, 17396],
         choices=['COVER Corporation', 'Square Enix Holdings Co.', 'Toho Co.', 'Capcom Co.'],
         blurb='Toho Co. stock price quiz item. The company name is in English.',
+        index_label='Nikkei 225',
+        index_prices=[10000, 9987, 10200, 10057, 10010, 9555, 9552, 9758, 9803, 9485, 9817, 9721, 9917, 9973, 9833, 10020, 10109, 10097, 10164, 10181, 10204, 10081, 10087, 10179, 9847, 9583, 9561, 9434, 9390, 9562, 9449, 9599, 9904, 9918, 9906, 10009, 10003, 9942, 9953, 9925, 9948, 10208, 10348, 9841, 9882, 9913, 9948, 10137, 10055, 9990, 10179, 10361, 10326, 10273, 10528, 10572, 10624, 10879, 11238, 11135, 11326, 11396, 11537, 11725, 12105, 12071, 11851, 12000, 12202, 11848, 11642, 11710, 11746, 11815, 11843, 11824, 11660, 11740, 11484, 11411, 11672, 11650, 11825, 12017, 11738, 11991, 11939, 11814, 11522, 11293, 11205, 11747, 11583, 11301, 11305, 11097, 11550, 11629, 11780, 12083, 12058, 12092, 12106, 11849, 11680, 11903, 11843, 11981, 12041, 12098, 12206, 12862, 12826, 13212, 13100, 13038, 13072, 13058, 13724, 13914, 13832, 14186, 14428, 14493, 14034, 14029, 14462, 14610, 14521, 14402, 14096, 14309, 14183, 13766, 13576, 13714, 13823, 13764, 13866, 14022, 13961, 14063, 13757, 14040, 13985, 14054, 13775, 13966, 14162, 14310, 14671, 14743, 15265, 14857, 14316, 13690, 13928, 12982, 12685, 13099, 13760, 13720, 13777, 13869, 13986, 13156, 12877, 13088, 13638, 14072, 13973, 13967, 14200, 14428, 14092, 13775, 13956, 14128, 14273, 14292, 13931, 13887, 13840, 13786, 13923, 14242, 14232, 14269, 14129, 14157, 14304, 14210, 14318, 13898, 14064, 14446, 14105, 14306, 14038, 14027, 14153, 14159, 13823, 13432, 13527, 13386, 13300, 13682, 13596, 13665, 12879, 12212, 11465, 12285, 12428, 12371, 12908, 13178, 13350, 13804, 13648, 13484, 13568, 13894, 13538, 13644, 13890, 13850, 13914, 14023, 14515, 14375, 14311, 14333, 14344, 14395, 15121, 14704, 14750, 14748, 15443, 15682, 15505, 15476, 15483, 15296, 15393],
     ),
     Question(
         ticker='9684.T',
@@ -81,6 +101,8 @@ QUESTIONS = [
         prices=[10000, 9935, 10278, 10212, 10180, 10033, 10392, 10605, 10801, 10507, 10882, 10850, 10654, 10850, 10948, 11029, 10948, 10703, 10474, 10556, 10131, 10114, 10278, 10376, 10033, 9935, 9951, 10016, 10033, 10245, 9935, 9935, 10163, 10049, 9902, 10033, 10163, 10229, 10196, 9951, 9837, 10376, 10376, 10065, 10408, 10294, 10261, 10392, 10392, 10327, 10343, 10539, 10458, 10735, 10866, 10882, 11029, 11275, 11062, 10621, 10327, 10425, 10508, 10815, 11216, 12320, 11377, 11296, 10750, 10475, 10281, 10443, 10572, 10340, 10521, 10592, 9087, 8917, 8725, 8755, 8807, 8846, 9080, 9149, 8690, 8500, 8405, 8472, 8404, 8324, 8384, 8371, 8059, 8248, 8288, 8026, 8252, 8783, 8801, 8779, 8590, 8314, 8386, 8356, 8098, 7995, 7778, 7685, 7946, 8273, 8815, 9415, 9314, 9408, 9489, 9387, 9454, 10160, 10549, 10966, 11029, 10686, 10430, 9757, 9817, 9783, 10190, 9838, 9513, 9127, 9047, 8967, 8879, 9015, 9279, 9364, 10054, 10054, 8608, 7908, 7954, 7725, 7426, 8085, 7706, 7534, 7371, 7402, 7848, 7895, 7824, 7619, 8052, 8301, 8046, 8106, 8234, 7786, 7575, 7779, 7962, 8391, 8549, 8727, 8933, 9039, 8824, 8881, 9010, 9330, 9292, 9376, 9670, 9441, 9461, 9650, 9614, 9758, 9897, 9056, 9322, 9366, 9851, 9926, 9869, 10028, 10127, 10229, 10020, 10240, 10126, 10106, 10044, 10098, 10074, 10139, 10508, 10286, 10941, 11404, 11453, 11596, 11567, 11587, 11668, 11350, 11248, 11315, 11232, 11438, 11405, 11391, 10881, 11708, 11944, 11737, 11577, 13474, 13835, 14054, 14673, 14319, 14735, 14833, 14712, 14763, 14626, 15668, 17141, 17263, 17655, 17132, 16183, 15881, 15873, 16577, 17026, 16675, 17198, 17435, 18243, 18595, 17908, 17296, 16609, 16389, 16373],
         choices=['Koei Tecmo Holdings Co.', '(unknown)', 'Square Enix Holdings Co.', 'NEXON Co.'],
         blurb='Square Enix Holdings Co. stock price quiz item. The company name is in English.',
+        index_label='Nikkei 225',
+        index_prices=[10000, 9987, 10200, 10057, 10010, 9555, 9552, 9758, 9803, 9485, 9817, 9721, 9917, 9973, 9833, 10020, 10109, 10097, 10164, 10181, 10204, 10081, 10087, 10179, 9847, 9583, 9561, 9434, 9390, 9562, 9449, 9599, 9904, 9918, 9906, 10009, 10003, 9942, 9953, 9925, 9948, 10208, 10348, 9841, 9882, 9913, 9948, 10137, 10055, 9990, 10179, 10361, 10326, 10273, 10528, 10572, 10624, 10879, 11238, 11135, 11326, 11396, 11537, 11725, 12105, 12071, 11851, 12000, 12202, 11848, 11642, 11710, 11746, 11815, 11843, 11824, 11660, 11740, 11484, 11411, 11672, 11650, 11825, 12017, 11738, 11991, 11939, 11814, 11522, 11293, 11205, 11747, 11583, 11301, 11305, 11097, 11550, 11629, 11780, 12083, 12058, 12092, 12106, 11849, 11680, 11903, 11843, 11981, 12041, 12098, 12206, 12862, 12826, 13212, 13100, 13038, 13072, 13058, 13724, 13914, 13832, 14186, 14428, 14493, 14034, 14029, 14462, 14610, 14521, 14402, 14096, 14309, 14183, 13766, 13576, 13714, 13823, 13764, 13866, 14022, 13961, 14063, 13757, 14040, 13985, 14054, 13775, 13966, 14162, 14310, 14671, 14743, 15265, 14857, 14316, 13690, 13928, 12982, 12685, 13099, 13760, 13720, 13777, 13869, 13986, 13156, 12877, 13088, 13638, 14072, 13973, 13967, 14200, 14428, 14092, 13775, 13956, 14128, 14273, 14292, 13931, 13887, 13840, 13786, 13923, 14242, 14232, 14269, 14129, 14157, 14304, 14210, 14318, 13898, 14064, 14446, 14105, 14306, 14038, 14027, 14153, 14159, 13823, 13432, 13527, 13386, 13300, 13682, 13596, 13665, 12879, 12212, 11465, 12285, 12428, 12371, 12908, 13178, 13350, 13804, 13648, 13484, 13568, 13894, 13538, 13644, 13890, 13850, 13914, 14023, 14515, 14375, 14311, 14333, 14344, 14395, 15121, 14704, 14750, 14748, 15443, 15682, 15505, 15476, 15483, 15296, 15393],
     ),
     Question(
         ticker='9697.T',
@@ -89,6 +111,8 @@ QUESTIONS = [
         prices=[10000, 9865, 10324, 9959, 10014, 9757, 10270, 10122, 10297, 9500, 10068, 10135, 10284, 11203, 11338, 11527, 11824, 11892, 11770, 11730, 11392, 11338, 11824, 11770, 11486, 11541, 11500, 11378, 10959, 11027, 11014, 10946, 11419, 11392, 11541, 11311, 11595, 11851, 12135, 11838, 11662, 11851, 12054, 11811, 12486, 12743, 12608, 12797, 12797, 12770, 12811, 13892, 13351, 13514, 13838, 14405, 14486, 14459, 15189, 14676, 14541, 15432, 15749, 15392, 14951, 14965, 14727, 15281, 15527, 15281, 15057, 15332, 15492, 15359, 16565, 16778, 16773, 16268, 16330, 15765, 16311, 16362, 16832, 16886, 16397, 15738, 14535, 15149, 14608, 14524, 14632, 14732, 14530, 14292, 14605, 12678, 13286, 13592, 13616, 13765, 13757, 13327, 13468, 13046, 13049, 12600, 12297, 12338, 12195, 12314, 13557, 14762, 14386, 15205, 15062, 15035, 15557, 15227, 15505, 16162, 16157, 16246, 16351, 16124, 16573, 16295, 16881, 16273, 15276, 14754, 14714, 14400, 14273, 14141, 13430, 14159, 14022, 14300, 14762, 14808, 14335, 14684, 15084, 16330, 16216, 15311, 15446, 15838, 16373, 16395, 16730, 16978, 17822, 17751, 16832, 16162, 17038, 15397, 15332, 15978, 16503, 17124, 16557, 16773, 17697, 17530, 17378, 17438, 17843, 18492, 18097, 17757, 17416, 17595, 17503, 17341, 17973, 16551, 17065, 17876, 19157, 18011, 18416, 18773, 18973, 19195, 19108, 18616, 18557, 18459, 18486, 18222, 18205, 18146, 17746, 17881, 18816, 19227, 20216, 20643, 20676, 21151, 21449, 20005, 19730, 18573, 18605, 18946, 20027, 20930, 19762, 19703, 19027, 20665, 21200, 20870, 20805, 22524, 22389, 21546, 22292, 22086, 22849, 23659, 23081, 23238, 23816, 25000, 25784, 25697, 26384, 24924, 24054, 23427, 23027, 24146, 24470, 23324, 21465, 21205, 21930, 22751, 22097, 21811, 21486, 21914, 21622],
         choices=['ANYCOLOR Inc.', 'Capcom Co.', 'NEXON Co.', 'BANDAI NAMCO Holdings Inc.'],
         blurb='Capcom Co. stock price quiz item. The company name is in English.',
+        index_label='Nikkei 225',
+        index_prices=[10000, 9987, 10200, 10057, 10010, 9555, 9552, 9758, 9803, 9485, 9817, 9721, 9917, 9973, 9833, 10020, 10109, 10097, 10164, 10181, 10204, 10081, 10087, 10179, 9847, 9583, 9561, 9434, 9390, 9562, 9449, 9599, 9904, 9918, 9906, 10009, 10003, 9942, 9953, 9925, 9948, 10208, 10348, 9841, 9882, 9913, 9948, 10137, 10055, 9990, 10179, 10361, 10326, 10273, 10528, 10572, 10624, 10879, 11238, 11135, 11326, 11396, 11537, 11725, 12105, 12071, 11851, 12000, 12202, 11848, 11642, 11710, 11746, 11815, 11843, 11824, 11660, 11740, 11484, 11411, 11672, 11650, 11825, 12017, 11738, 11991, 11939, 11814, 11522, 11293, 11205, 11747, 11583, 11301, 11305, 11097, 11550, 11629, 11780, 12083, 12058, 12092, 12106, 11849, 11680, 11903, 11843, 11981, 12041, 12098, 12206, 12862, 12826, 13212, 13100, 13038, 13072, 13058, 13724, 13914, 13832, 14186, 14428, 14493, 14034, 14029, 14462, 14610, 14521, 14402, 14096, 14309, 14183, 13766, 13576, 13714, 13823, 13764, 13866, 14022, 13961, 14063, 13757, 14040, 13985, 14054, 13775, 13966, 14162, 14310, 14671, 14743, 15265, 14857, 14316, 13690, 13928, 12982, 12685, 13099, 13760, 13720, 13777, 13869, 13986, 13156, 12877, 13088, 13638, 14072, 13973, 13967, 14200, 14428, 14092, 13775, 13956, 14128, 14273, 14292, 13931, 13887, 13840, 13786, 13923, 14242, 14232, 14269, 14129, 14157, 14304, 14210, 14318, 13898, 14064, 14446, 14105, 14306, 14038, 14027, 14153, 14159, 13823, 13432, 13527, 13386, 13300, 13682, 13596, 13665, 12879, 12212, 11465, 12285, 12428, 12371, 12908, 13178, 13350, 13804, 13648, 13484, 13568, 13894, 13538, 13644, 13890, 13850, 13914, 14023, 14515, 14375, 14311, 14333, 14344, 14395, 15121, 14704, 14750, 14748, 15443, 15682, 15505, 15476, 15483, 15296, 15393],
     ),
     Question(
         ticker='9766.T',
@@ -97,6 +121,8 @@ QUESTIONS = [
         prices=[10000, 9738, 10110, 9752, 9297, 9283, 9600, 9269, 8979, 8524, 9200, 8676, 8966, 9007, 9283, 8745, 8855, 9324, 9076, 9338, 8855, 8690, 8662, 8593, 8317, 8234, 8248, 8234, 8097, 8124, 7903, 8386, 8828, 8772, 8607, 8455, 8648, 8841, 8634, 8524, 8331, 8634, 8897, 8566, 8759, 8593, 8441, 8372, 8786, 8786, 8869, 8952, 8745, 8993, 9172, 9214, 9697, 10179, 10593, 10138, 10221, 10331, 10470, 10770, 10679, 10407, 10208, 10537, 10487, 10211, 10334, 10371, 10378, 10466, 10549, 10848, 11226, 11349, 11255, 11143, 11655, 11669, 11687, 11690, 11524, 11332, 11156, 10968, 10817, 10714, 10585, 11074, 11132, 11194, 11148, 10719, 10543, 10585, 11010, 10594, 10063, 9978, 10090, 10272, 10192, 10392, 9768, 10121, 10139, 10183, 11265, 11861, 11797, 12490, 12211, 12349, 12610, 12741, 13119, 13594, 13303, 13793, 14145, 13979, 13783, 13459, 14172, 14124, 14166, 13945, 13828, 13439, 12921, 12992, 12810, 13043, 12890, 12989, 14883, 15800, 15400, 14428, 15048, 15386, 15503, 15117, 14855, 14972, 15497, 15972, 16076, 15945, 16779, 16559, 16297, 15814, 16028, 15752, 15497, 16110, 16345, 17097, 17517, 17931, 18386, 18103, 18848, 19090, 19655, 20786, 20062, 18862, 20248, 19903, 19448, 18979, 19172, 19434, 19572, 20524, 19876, 19931, 20241, 20290, 20634, 21490, 20924, 20862, 20779, 20566, 20503, 19979, 19676, 19641, 18924, 18931, 19655, 19752, 25159, 25407, 25828, 26359, 25641, 25234, 24545, 23083, 23290, 24166, 24517, 25276, 24034, 24331, 23393, 25979, 26421, 27414, 26600, 28207, 28152, 26262, 27041, 26117, 27883, 27690, 27241, 27228, 27366, 28710, 30303, 30614, 31276, 29124, 28393, 27793, 27352, 28476, 28241, 28159, 31145, 32414, 34814, 34917, 33076, 32352, 30897, 30400, 30124],
         choices=['Toei Animation Co.', 'Konami Group Corporation', 'Capcom Co.', 'Toyota Motor Corporation'],
         blurb='Konami Group Corporation stock price quiz item. The company name is in English.',
+        index_label='Nikkei 225',
+        index_prices=[10000, 9987, 10200, 10057, 10010, 9555, 9552, 9758, 9803, 9485, 9817, 9721, 9917, 9973, 9833, 10020, 10109, 10097, 10164, 10181, 10204, 10081, 10087, 10179, 9847, 9583, 9561, 9434, 9390, 9562, 9449, 9599, 9904, 9918, 9906, 10009, 10003, 9942, 9953, 9925, 9948, 10208, 10348, 9841, 9882, 9913, 9948, 10137, 10055, 9990, 10179, 10361, 10326, 10273, 10528, 10572, 10624, 10879, 11238, 11135, 11326, 11396, 11537, 11725, 12105, 12071, 11851, 12000, 12202, 11848, 11642, 11710, 11746, 11815, 11843, 11824, 11660, 11740, 11484, 11411, 11672, 11650, 11825, 12017, 11738, 11991, 11939, 11814, 11522, 11293, 11205, 11747, 11583, 11301, 11305, 11097, 11550, 11629, 11780, 12083, 12058, 12092, 12106, 11849, 11680, 11903, 11843, 11981, 12041, 12098, 12206, 12862, 12826, 13212, 13100, 13038, 13072, 13058, 13724, 13914, 13832, 14186, 14428, 14493, 14034, 14029, 14462, 14610, 14521, 14402, 14096, 14309, 14183, 13766, 13576, 13714, 13823, 13764, 13866, 14022, 13961, 14063, 13757, 14040, 13985, 14054, 13775, 13966, 14162, 14310, 14671, 14743, 15265, 14857, 14316, 13690, 13928, 12982, 12685, 13099, 13760, 13720, 13777, 13869, 13986, 13156, 12877, 13088, 13638, 14072, 13973, 13967, 14200, 14428, 14092, 13775, 13956, 14128, 14273, 14292, 13931, 13887, 13840, 13786, 13923, 14242, 14232, 14269, 14129, 14157, 14304, 14210, 14318, 13898, 14064, 14446, 14105, 14306, 14038, 14027, 14153, 14159, 13823, 13432, 13527, 13386, 13300, 13682, 13596, 13665, 12879, 12212, 11465, 12285, 12428, 12371, 12908, 13178, 13350, 13804, 13648, 13484, 13568, 13894, 13538, 13644, 13890, 13850, 13914, 14023, 14515, 14375, 14311, 14333, 14344, 14395, 15121, 14704, 14750, 14748, 15443, 15682, 15505, 15476, 15483, 15296, 15393],
     ),
     Question(
         ticker='^N225.2022-09-01',
@@ -105,5 +131,7 @@ QUESTIONS = [
         prices=[10000, 10161, 10360, 9981, 9831, 9477, 9492, 9888, 9557, 9694, 9778, 9866, 9814, 10016, 10091, 10233, 10148, 10118, 10240, 10126, 10073, 9984, 10121, 9967, 9554, 9561, 9448, 9349, 9575, 9349, 9560, 9884, 9914, 9901, 10027, 9987, 9994, 9961, 9813, 9937, 10111, 10299, 10077, 9780, 9945, 9948, 10059, 10242, 9963, 10168, 10324, 10376, 10362, 10448, 10482, 10546, 10805, 11155, 11109, 11308, 11277, 11769, 11682, 12130, 12082, 12044, 11781, 12016, 12071, 11655, 11738, 11910, 11840, 11909, 12121, 11656, 11660, 11672, 11387, 11590, 11648, 11810, 11961, 11806, 11842, 12036, 11732, 11721, 11499, 11251, 11563, 11463, 11380, 11246, 11221, 11442, 11684, 11792, 12136, 12089, 12175, 12064, 12032, 11897, 11891, 11937, 12193, 12040, 12143, 12085, 12690, 12896, 13021, 13116, 13044, 13038, 13092, 13359, 13816, 13890, 14205, 14181, 14518, 14370, 14010, 14388, 14804, 14759, 14411, 14400, 14400, 14310, 13745, 13555, 13624, 13858, 13832, 13823, 14092, 14101, 13992, 13960, 14093, 14013, 14169, 14053, 13965, 14050, 14244, 14510, 14813, 15146, 14944, 14506, 14176, 13928, 13804, 12555, 12681, 13297, 13781, 13890, 13893, 14012, 13272, 13092, 13245, 13453, 13711, 13729, 13958, 14098, 14340, 14088, 13907, 13727, 14221, 13930, 14302, 14020, 13838, 13768, 13918, 13834, 14220, 14179, 14428, 14252, 14012, 14168, 14444, 14476, 13930, 13922, 14354, 14325, 14306, 14047, 14043, 14287, 14218, 14040, 13851, 13516, 13355, 13331, 13540, 13641, 13768, 12896, 12577, 11953, 12160, 12281, 12411, 12686, 13051, 13317, 13630, 13670, 13588, 13454, 13658, 13567, 13597, 13835, 13698, 14079, 13887, 14332, 14478, 14414, 14418, 14287, 14447, 14907, 14844, 14870, 14681, 15142, 15442, 15766, 15436, 15395, 15275, 15417],
         choices=['(unknown)', 'Konami Group Corporation', 'NEXON Co.', 'Capcom Co.'],
         blurb='(unknown) stock price quiz item. The company name is in English.',
+        index_label='Nikkei 225',
+        index_prices=[9985, 10146, 10345, 9966, 9816, 9462, 9477, 9873, 9543, 9680, 9763, 9851, 9799, 10001, 10076, 10218, 10133, 10102, 10225, 10111, 10057, 9969, 10106, 9951, 9540, 9546, 9433, 9335, 9561, 9335, 9546, 9869, 9899, 9886, 10012, 9972, 9979, 9946, 9799, 9922, 10096, 10283, 10062, 9765, 9930, 9933, 10044, 10226, 9948, 10152, 10308, 10360, 10347, 10432, 10466, 10530, 10789, 11138, 11092, 11291, 11260, 11752, 11664, 12112, 12064, 12026, 11763, 11998, 12052, 11637, 11720, 11892, 11822, 11891, 12102, 11638, 11642, 11655, 11370, 11572, 11630, 11792, 11943, 11788, 11824, 12018, 11714, 11703, 11482, 11234, 11545, 11445, 11363, 11229, 11204, 11424, 11667, 11774, 12118, 12070, 12156, 12046, 12014, 11879, 11873, 11919, 12174, 12022, 12125, 12066, 12671, 12877, 13001, 13096, 13024, 13019, 13073, 13339, 13795, 13869, 14184, 14159, 14496, 14348, 13989, 14367, 14782, 14736, 14389, 14379, 14379, 14288, 13724, 13535, 13603, 13837, 13811, 13802, 14070, 14080, 13971, 13939, 14071, 13992, 14148, 14032, 13944, 14028, 14223, 14488, 14790, 15123, 14922, 14484, 14155, 13907, 13783, 12536, 12662, 13277, 13760, 13869, 13872, 13991, 13252, 13072, 13225, 13432, 13691, 13708, 13937, 14076, 14318, 14067, 13886, 13706, 14199, 13909, 14280, 13998, 13817, 13747, 13897, 13813, 14199, 14157, 14406, 14231, 13991, 14146, 14422, 14454, 13909, 13901, 14333, 14304, 14285, 14026, 14022, 14266, 14197, 14018, 13830, 13496, 13335, 13311, 13519, 13621, 13747, 12876, 12558, 11934, 12142, 12263, 12393, 12667, 13031, 13296, 13609, 13649, 13567, 13434, 13637, 13546, 13576, 13814, 13678, 14058, 13866, 14310, 14456, 14392, 14396, 14265, 14425, 14884, 14821, 14847, 14659, 15119, 15418, 15743, 15413, 15372, 15252, 15393],
     ),
 ]
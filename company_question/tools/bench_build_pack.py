@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+"""
+build_pack のベンチマーク。
+
+合成した銘柄のCSV（yf.download と同じ2段ヘッダーの形式）を --tickers 個作り、
+以前の逐次版（DictReader・i % step・リスト内包表記）と
+今の版（スライス・NumPy・プロセスプール）でパックを作る時間を比べる。
+出力したパックが一致することも確かめる。
+
+使用例:
+  uv run python tools/bench_build_pack.py                       # 5000銘柄
+  uv run python tools/bench_build_pack.py --tickers 500 --workers 1 4 8
+  uv run python tools/bench_build_pack.py --corpus /tmp/corpus  # 作ったCSVを使い回す
+"""
+import argparse
+import csv
+import filecmp
+import glob
+import os
+import random
+import tempfile
+import time
+from datetime import date, timedelta
+from typing import Dict, List
+
+import build_pack
+from build_pack import RNG_SEED, Series, build_questions_py, parse_all
+
+ROWS = 740  # 1銘柄の行数（約3年分の日足）
+
+
+def make_corpus(out_dir: str, tickers: int, seed: int) -> List[str]:
+    """合成したCSVを書き出してパスを返す（既にあれば作らない）"""
+    os.makedirs(out_dir, exist_ok=True)
+    paths = sorted(glob.glob(os.path.join(out_dir, "*.csv")))
+    if len(paths) >= tickers:
+        return paths[:tickers]
+
+    rng = random.Random(seed)
+    start = date(2022, 8, 30)
+    dates = []
+    d = start
+    while len(dates) < ROWS:
+        if d.weekday() < 5:
+            dates.append(d.isoformat())
+        d += timedelta(days=1)
+
+    paths = []
+    for k in range(tickers):
+        code = 1000 + k
+        ticker = f"{code}.T"
+        path = os.path.join(out_dir, f"{code}_T_{dates[0]}_to_{dates[-1]}.csv")
+        price = rng.uniform(300, 20000)
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            w = csv.writer(f, lineterminator="\n")
+            w.writerow(["Date", "Adj Close", "Close", "High", "Low", "Open", "Volume"])
+            w.writerow([""] + [ticker] * 6)
+            for day in dates:
+                o = price
+                price = max(1.0, price * (1.0 + rng.gauss(0.0, 0.02)))
+                w.writerow([day, price * 0.95, price, max(o, price), min(o, price), o,
+                            rng.randrange(10_000, 5_000_000)])
+        paths.append(path)
+    return paths
+
+
+# ---- 以前の逐次版（比較用にそのまま残しておく） ----
+def legacy_parse_csv(path: str, step: int, scale: int, name_fallback: str) -> Series:
+    base = os.path.basename(path)
+    parts = base.split("_")
+    if len(parts) >= 2:
+        ticker = f"{parts[0]}.{parts[1]}".replace("..", ".")
+    else:
+        ticker = os.path.splitext(base)[0]
+
+    dates: List[str] = []
+    closes: List[float] = []
+    with open(path, "r", encoding="utf-8-sig", newline="") as f:
+        r = csv.DictReader(f)
+        for i, row in enumerate(r):
+            if step > 1 and (i % step) != 0:
+                continue
+            d = (row.get("Date") or row.get("Datetime") or "").strip()
+            c = row.get("Close")
+            if not d or c is None or c == "":
+                continue
+            try:
+                cval = float(c)
+            except ValueError:
+                continue
+            dates.append(d)
+            closes.append(cval)
+
+    base_close = closes[0]
+    prices_norm = [int(round((v / base_close) * scale)) for v in closes]
+    return Series(ticker=ticker, name=name_fallback, span=(dates[0], dates[-1]), prices=prices_norm)
+
+
+def legacy_build_questions_py(series_list: List[Series], name_map: Dict[str, str], out_path: str) -> None:
+    random.seed(RNG_SEED)
+    all_names = []
+    for s in series_list:
+        if s.ticker in name_map:
+            s.name = name_map[s.ticker]
+        elif not s.name or s.name == s.ticker:
+            s.name = s.ticker
+        all_names.append(s.name)
+
+    with open(out_path, "w", encoding="utf-8", newline="\n") as w:
+        w.write("# Auto-generated by tools/build_pack.py\n")
+        w.write("from core.models import Question\n\n")
+        w.write("QUESTIONS = [\n")
+        for s in series_list:
+            pool = [n for n in all_names if n != s.name]
+            if len(pool) >= 3:
+                distractors = random.sample(pool, 3)
+            else:
+                distractors = (pool + [f"{s.ticker}-A", f"{s.ticker}-B", f"{s.ticker}-C"])[:3]
+            choices = distractors + [s.name]
+            random.shuffle(choices)
+            blurb = f"{s.name} stock price quiz item. The company name is in English."
+            w.write("    Question(\n")
+            w.write(f"        ticker={s.ticker!r},\n")
+            w.write(f"        name={s.name!r},\n")
+            w.write(f"        span=({s.span[0]!r}, {s.span[1]!r}),\n")
+            w.write("        prices=[")
+            w.write(", ".join(str(x) for x in s.prices))
+            w.write("],\n")
+            w.write("        choices=[")
+            w.write(", ".join(repr(c) for c in choices))
+            w.write("],\n")
+            w.write(f"        blurb={blurb!r},\n")
+            w.write("    ),\n")
+        w.write("]\n")
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Benchmark build_pack on a synthetic corpus.")
+    ap.add_argument("--tickers", type=int, default=5000)
+    ap.add_argument("--corpus", type=str, default="", help="合成CSVの置き場（省略時は一時ディレクトリ）")
+    ap.add_argument("--step", type=int, default=3)
+    ap.add_argument("--scale", type=int, default=build_pack.DEFAULT_SCALE)
+    ap.add_argument("--workers", type=int, nargs="*", default=[1, os.cpu_count() or 1])
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--skip-legacy", action="store_true", help="以前の版を計らない")
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        corpus = args.corpus or os.path.join(tmp, "corpus")
+        t0 = time.perf_counter()
+        paths = make_corpus(corpus, args.tickers, args.seed)
+        print(f"corpus: {len(paths)} tickers x {ROWS} rows  ({time.perf_counter() - t0:.1f}s)")
+        # 社名は1割を未登録（"(unknown)" のまま）にする
+        name_map = {f"{1000 + k}.T": f"Company {k}" for k in range(len(paths)) if k % 10}
+
+        legacy_out = os.path.join(tmp, "pack_legacy.py")
+        if not args.skip_legacy:
+            t0 = time.perf_counter()
+            series = [legacy_parse_csv(p, args.step, args.scale, "(unknown)") for p in paths]
+            t1 = time.perf_counter()
+            legacy_build_questions_py(series, name_map, legacy_out)
+            t2 = time.perf_counter()
+            print(f"  legacy           parse={t1 - t0:6.2f}s  write={t2 - t1:6.2f}s  total={t2 - t0:6.2f}s")
+
+        for workers in args.workers:
+            out = os.path.join(tmp, f"pack_w{workers}.py")
+            t0 = time.perf_counter()
+            series = parse_all(paths, args.step, args.scale, "(unknown)", workers=workers)
+            t1 = time.perf_counter()
+            build_questions_py(series, name_map, out)
+            t2 = time.perf_counter()
+            same = "" if args.skip_legacy else (
+                "  same" if filecmp.cmp(out, legacy_out, shallow=False) else "  DIFFERENT")
+            print(f"  workers={workers:<3}      parse={t1 - t0:6.2f}s  write={t2 - t1:6.2f}s  "
+                  f"total={t2 - t0:6.2f}s{same}")
+
+
+if __name__ == "__main__":
+    main()
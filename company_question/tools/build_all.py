@@ -2,34 +2,195 @@
 # -*- coding: utf-8 -*-
 """
 name_map の生成 → クイズパック生成 を 1コマンドで実行する統合スクリプト。
-既存の tools/build_name_map.py と tools/build_pack.py を順番に呼び出します。
+tools/build_name_map.py と tools/build_pack.py を同じプロセスの中で呼び出します
+（子プロセスを起動しないので、インタプリタの起動と import は1回だけ）。
+
+各段は入力のハッシュを data/.build_cache/manifest.json に記録し、
+前回と同じで出力もそのままなら飛ばします。
+  name_map  毎回実行（社名キャッシュから書き出すので速い。期限切れ・取得失敗の社名だけ問い合わせる）
+            出力: --name-map（内容が変わらなければ書き直さない）
+  series    入力: 各CSVの中身のハッシュ, step/scale など
+            銘柄ごとに解析結果をキャッシュし、中身が変わったCSVだけ解析し直す
+  pack      入力: series, name_map の中身            出力: --pack-out
 
 例:
-  uv run python tools/build_all.py --csv-dir data/raw --pack-out packs/pack_sample.py
+  uv run python tools/build_all.py --csv-dir data/raw --pack-out packs/pack_sample.bin
   # 既存の name_map を再利用したい場合
   uv run python tools/build_all.py --csv-dir data/raw --skip-name-map --name-map tools/name_map.csv
+  # キャッシュを無視してすべて作り直す
+  uv run python tools/build_all.py --csv-dir data/raw --force
 """
 import argparse
+import glob
+import hashlib
+import json
 import os
-import subprocess
 import sys
-from typing import List, Optional
+import time
+from dataclasses import asdict
+from typing import Callable, Dict, List, Optional, Sequence
+
+import build_name_map
+import build_pack
+from build_pack import INDEX_LABEL, INDEX_TICKER, Series
+from name_cache import NameCache
+
+DEFAULT_CACHE_DIR = "data/.build_cache"
+CACHE_VERSION = 1  # キャッシュの形式を変えたら上げる
+# このモジュールの中身が変わったら、解析もパックも作り直す
+CODE_MODULES = ("build_pack", "core.downsample", "core.align", "core.pack", "core.models")
+
+
+def _digest(obj) -> str:
+    return hashlib.sha256(json.dumps(obj, sort_keys=True, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+
+def code_version(hash_file: "FileHasher") -> str:
+    return _digest([CACHE_VERSION] + [hash_file(sys.modules[m].__file__) for m in CODE_MODULES])
+
+
+class FileHasher:
+    """
+    ファイルの中身の SHA-256。サイズと更新時刻が前回と同じなら記録済みの値を使う
+    （変わっていないCSVを毎回読み直さない）。
+    """
+
+    def __init__(self, known: Dict[str, List]):
+        self.known = known  # path -> [size, mtime_ns, sha256]（manifest に保存する）
+
+    def __call__(self, path: str) -> str:
+        st = os.stat(path)
+        rec = self.known.get(path)
+        if rec and rec[0] == st.st_size and rec[1] == st.st_mtime_ns:
+            return rec[2]
+        h = hashlib.sha256()
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                h.update(block)
+        self.known[path] = [st.st_size, st.st_mtime_ns, h.hexdigest()]
+        return h.hexdigest()
+
+
+class Pipeline:
+    """
+    小さな DAG。段ごとに「入力」（JSON にできる値）と依存する段、実行する関数を登録する。
+    段のキー = 入力と、依存する段の指紋（出力ファイルがある段はその中身のハッシュ）のハッシュ。
+    build(name) は依存する段から順に、キーが前回と違うか出力が無い・書き換えられた段だけを実行する。
+    出力ファイルの無い段（series）は結果が要る時にだけ実行する。
+    always の段（name_map）はキーに関係なく毎回実行する（後ろの段は出力の中身で判定する）。
+    """
+
+    def __init__(self, cache_dir: str, force: bool = False):
+        self.cache_dir = cache_dir
+        self.force = force
+        self.manifest_path = os.path.join(cache_dir, "manifest.json")
+        self.manifest: Dict = {"stages": {}, "files": {}}
+        if os.path.exists(self.manifest_path):
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                self.manifest = json.load(f)
+        self.hash_file = FileHasher(self.manifest.setdefault("files", {}))
+        self.stages: Dict[str, Dict] = {}
+        self.keys: Dict[str, str] = {}
+        self.results: Dict[str, object] = {}
+        self.done: set = set()
+
+    def add(self, name: str, inputs: Callable[[], object], run: Callable[[Callable[[str], object]], object],
+            deps: Sequence[str] = (), output: Optional[str] = None, always: bool = False) -> None:
+        """run は get(依存する段の名前) -> その段の結果 を受け取る"""
+        self.stages[name] = {"inputs": inputs, "run": run, "deps": list(deps), "output": output,
+                             "always": always}
+
+    def key(self, name: str) -> str:
+        if name not in self.keys:
+            st = self.stages[name]
+            self.keys[name] = _digest([name, st["inputs"](), [self.fingerprint(d) for d in st["deps"]]])
+        return self.keys[name]
+
+    def fingerprint(self, name: str) -> str:
+        """後ろの段から見たこの段の中身（出力ファイルがあれば、作り直した後の中身のハッシュ）"""
+        output = self.stages[name]["output"]
+        if output is None:
+            return self.key(name)
+        self.build(name)
+        return self.hash_file(output)
+
+    def result(self, name: str):
+        if name not in self.results:
+            st = self.stages[name]
+            t0 = time.perf_counter()
+            self.results[name] = st["run"](self.result)
+            print(f"[INFO] {name}: done ({time.perf_counter() - t0:.2f}s)")
+        return self.results[name]
+
+    def build(self, name: str) -> None:
+        if name in self.done:
+            return
+        st = self.stages[name]
+        key = self.key(name)
+        output = st["output"]
+        rec = self.manifest["stages"].get(name)
+        up_to_date = (not self.force and not st["always"] and output is not None and os.path.exists(output)
+                      and rec is not None and rec.get("key") == key
+                      and rec.get("output") == self.hash_file(output))
+        if up_to_date:
+            print(f"[INFO] {name}: up to date, skipped")
+        else:
+            self.result(name)
+            if output is not None:
+                self.manifest["stages"][name] = {"key": key, "output": self.hash_file(output)}
+        self.done.add(name)
 
+    def save(self) -> None:
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp = self.manifest_path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self.manifest, f, ensure_ascii=False, indent=1, sort_keys=True)
+        os.replace(tmp, self.manifest_path)
 
-def find_script(name: str) -> str:
-    """tools/ 配下 or カレントから探す"""
-    candidates = [os.path.join("tools", name), name]
-    for c in candidates:
-        if os.path.exists(c):
-            return c
-    raise SystemExit(f"{name} が見つかりません。プロジェクトルートで実行していますか？")
 
+class SeriesCache:
+    """
+    CSV 1本の解析結果（Series）を JSON で置いておく。
+    キーは CSV の中身のハッシュと解析の引数なので、中身が変わったCSVだけ解析し直す。
+    """
 
-def run(cmd: List[str]) -> None:
-    print("+", " ".join(cmd))
-    res = subprocess.run(cmd)
-    if res.returncode != 0:
-        sys.exit(res.returncode)
+    def __init__(self, cache_dir: str, hash_file: FileHasher):
+        self.dir = os.path.join(cache_dir, "series")
+        self.hash_file = hash_file
+        self.code = code_version(hash_file)
+
+    def key(self, path: str, params: Dict) -> str:
+        return _digest([self.code, self.hash_file(path), params])
+
+    def load(self, key: str) -> Optional[Series]:
+        p = os.path.join(self.dir, key + ".json")
+        if not os.path.exists(p):
+            return None
+        with open(p, "r", encoding="utf-8") as f:
+            d = json.load(f)
+        d["span"] = tuple(d["span"])
+        return Series(**d)
+
+    def store(self, key: str, s: Series) -> None:
+        os.makedirs(self.dir, exist_ok=True)
+        p = os.path.join(self.dir, key + ".json")
+        tmp = p + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(asdict(s), f, ensure_ascii=False)
+        os.replace(tmp, p)
+
+    def parse(self, paths: List[str], params: Dict, workers: Optional[int]) -> List[Series]:
+        """paths の順に Series を返す。キャッシュに無いものだけ build_pack.parse_all で解析する"""
+        keys = [self.key(p, params) for p in paths]
+        out: List[Optional[Series]] = [self.load(k) for k in keys]
+        miss = [i for i, s in enumerate(out) if s is None]
+        print(f"[INFO] series cache: {len(paths) - len(miss)} hit, {len(miss)} to parse")
+        if miss:
+            parsed = build_pack.parse_all([paths[i] for i in miss], workers=workers, **params)
+            for i, s in zip(miss, parsed):
+                self.store(keys[i], s)
+                out[i] = s
+        return out
 
 
 def main():
@@ -40,48 +201,99 @@ def main():
     p.add_argument("--tickers", nargs="*", help="name_map作成時に追加で問い合わせるティッカー")
     # 出力系
     p.add_argument("--name-map", default="tools/name_map.csv", help="name_map の出力/再利用パス")
-    p.add_argument("--pack-out", default="packs/pack_sample.py", help="生成するパックの出力先")
+    p.add_argument("--pack-out", default="packs/pack_sample.bin",
+                   help="生成するパックの出力先（.bin / .py。main.py は既定で packs/pack_sample.bin を読む）")
     # ビルドオプション（従来と同じ既定）
     p.add_argument("--step", type=int, default=3, help="間引きステップ（例: 3）")
+    p.add_argument("--downsample", choices=build_pack.DOWNSAMPLE_METHODS, default="step",
+                   help="間引き方（build_pack.py と同じ）")
+    p.add_argument("--points", type=int, default=build_pack.CHART_WIDTH, help="lttb/m4 で残す点数・列数")
     p.add_argument("--scale", type=int, default=10000, help="初日=scale で正規化")
+    p.add_argument("--workers", type=int, default=None, help="CSV解析のプロセス数（既定: CPU 数、1: 逐次）")
     p.add_argument("--sleep", type=float, default=0.5, help="yfinance問い合わせの待機秒")
     # 制御
     p.add_argument("--skip-name-map", action="store_true", help="name_map の生成をスキップして既存CSVを使う")
-    p.add_argument("--python", default=sys.executable, help="子プロセスで使うPython（既定: 現在のPython）")
+    p.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR, help=f"ビルドのキャッシュ（既定: {DEFAULT_CACHE_DIR}）")
+    p.add_argument("--force", action="store_true", help="キャッシュを無視してすべての段を実行する")
 
     args = p.parse_args()
 
-    # スクリプトを探す（tools/ またはカレント）
-    path_build_name = find_script("build_name_map.py")
-    path_build_pack = find_script("build_pack.py")
+    csv_paths: List[str] = []
+    if args.csv_dir:
+        csv_paths.extend(glob.glob(os.path.join(args.csv_dir, "*.csv")))
+    if args.csv_files:
+        csv_paths.extend(args.csv_files)
+    csv_paths = sorted(set(csv_paths))
+    if not csv_paths:
+        raise SystemExit("No CSV files. Use --csv-dir or --csv-files")
+
+    pipe = Pipeline(args.cache_dir, force=args.force)
+    series_cache = SeriesCache(args.cache_dir, pipe.hash_file)
 
     # --- 1) name_map 生成（スキップ可） ---
     if not args.skip_name_map:
-        nm_cmd = [args.python, path_build_name]
-        if args.tickers:
-            nm_cmd += ["--tickers"] + args.tickers
-        if args.csv_dir:
-            nm_cmd += ["--from-csv-dir", args.csv_dir]
         # 入力が csv_files の場合でも、name_map は csv_dir から拾う設計にしています。
-        # 必要ならここで csv_files からティッカー抽出する実装を足せます。
-        nm_cmd += ["--out", args.name_map, "--sleep", str(args.sleep)]
-        run(nm_cmd)
+        name_tickers: List[str] = list(args.tickers or [])
+        if args.csv_dir:
+            name_tickers.extend(build_name_map.tickers_from_csv_dir(args.csv_dir))
+        name_tickers = sorted({build_name_map.normalize_ticker(t) for t in name_tickers})
+
+        def run_name_map(get):
+            cache = NameCache(build_name_map.DEFAULT_CACHE)
+            try:
+                build_name_map.build_name_map(name_tickers, args.name_map, cache,
+                                              rate=1.0 / args.sleep if args.sleep > 0 else None)
+            finally:
+                cache.close()
+            return args.name_map
+
+        # 社名の有効期限はキャッシュが管理するので、この段は毎回実行する
+        pipe.add("name_map", inputs=lambda: name_tickers, run=run_name_map, output=args.name_map, always=True)
+        name_deps = ["name_map"]
     else:
         if not os.path.exists(args.name_map):
             raise SystemExit(f"--skip-name-map 指定ですが {args.name_map} が存在しません。")
+        name_deps = []
 
-    # --- 2) パック生成 ---
-    pack_cmd = [args.python, path_build_pack]
-    if args.csv_dir:
-        pack_cmd += ["--csv-dir", args.csv_dir]
-    if args.csv_files:
-        pack_cmd += ["--csv-files"] + args.csv_files
-    pack_cmd += ["--step", str(args.step), "--scale", str(args.scale)]
-    # name_map のパスは、スキップ時も存在すれば渡す（既存の動作と同じになるように）
-    if os.path.exists(args.name_map):
-        pack_cmd += ["--name-map", args.name_map]
-    pack_cmd += ["--out", args.pack_out]
-    run(pack_cmd)
+    # --- 2) CSV の解析（変わった銘柄だけ）と指数の位置合わせ ---
+    params = {"step": args.step, "scale": args.scale, "name_fallback": "(unknown)",
+              "downsample": args.downsample, "points": args.points}
+
+    def run_series(get):
+        series_list = series_cache.parse(csv_paths, params, args.workers)
+        # 指数は間引かずに読み込み、各銘柄の取引日で引き当てる（build_pack.parse_index と同じ）
+        index_paths = [c for c in csv_paths if build_pack.ticker_from_path(c).startswith(INDEX_TICKER)]
+        if index_paths:
+            index_params = dict(params, step=1, name_fallback=INDEX_LABEL, downsample="step")
+            index = series_cache.parse(index_paths[:1], index_params, 1)[0]
+            build_pack.attach_index(series_list, index)
+        return series_list
+
+    pipe.add("series", inputs=lambda: [series_cache.code, params, [[c, pipe.hash_file(c)] for c in csv_paths]],
+             run=run_series)
+
+    # --- 3) パック生成 ---
+    def run_pack(get):
+        series_list = get("series")
+        # name_map は、スキップ時も存在すれば使う（既存の動作と同じになるように）
+        name_map: Dict[str, str] = {}
+        if os.path.exists(args.name_map):
+            name_map = build_pack.read_name_map(args.name_map)
+        if args.pack_out.endswith(".bin"):
+            build_pack.build_questions_bin(series_list, name_map=name_map, out_path=args.pack_out)
+        else:
+            build_pack.build_questions_py(series_list, name_map=name_map, out_path=args.pack_out)
+        return args.pack_out
+
+    name_map_hash = (lambda: pipe.hash_file(args.name_map) if os.path.exists(args.name_map) else None)
+    pipe.add("pack",
+             inputs=lambda: [series_cache.code, args.pack_out, None if name_deps else name_map_hash()],
+             run=run_pack, deps=["series"] + name_deps, output=args.pack_out)
+
+    try:
+        pipe.build("pack")
+    finally:
+        pipe.save()
 
     print(f"[OK] 完了: {args.pack_out}")
 
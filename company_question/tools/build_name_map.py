@@ -2,18 +2,29 @@
 # -*- coding: utf-8 -*-
 """
 yfinance から ticker→company name の対応表を作る。
+社名は data/name_cache.sqlite（tools/name_cache.py）にキャッシュし、
+無い銘柄・期限切れの銘柄だけをスレッドプールで並列に問い合わせる。
+CSV はキャッシュから書き出すので、銘柄が変わらなければ問い合わせは0回。
+
 使い方の例:
   uv run python tools/build_name_map.py --tickers 7832 3659 9766 ...
   uv run python tools/build_name_map.py --from-csv-dir data/raw --out tools/name_map.csv
+  uv run python tools/build_name_map.py --from-csv-dir data/raw --refresh   # キャッシュを無視して取り直す
 """
 import argparse
 import glob
 import os
 import re
 import time
-from typing import Dict, List
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, List, Optional
+
+from name_cache import DAY, NameCache, write_name_map
+
+DEFAULT_CACHE = "data/name_cache.sqlite"
 
-import yfinance as yf
+# ticker -> 社名（取れなければ None）。差し替えられるように関数で渡す
+NameSource = Callable[[str], Optional[str]]
 
 
 def normalize_ticker(t: str) -> str:
@@ -30,23 +41,83 @@ def tickers_from_csv_dir(csv_dir: str) -> List[str]:
             out.append(f"{m.group(1)}.T")
     return sorted(set(out))
 
-def fetch_name(ticker: str) -> str:
-    # できるだけ丁寧に（無料APIなので少し待機）
-    t = yf.Ticker(ticker)
-    try:
-        info = t.get_info()       # 新しい yfinance では get_info 推奨
-    except Exception:
-        time.sleep(0.5)
-        info = {}
-    name = info.get("longName") or info.get("shortName") or ticker
-    return name
+def yfinance_name(ticker: str) -> Optional[str]:
+    # yfinance の import は重いので、問い合わせが必要になった時だけ
+    import yfinance as yf
+    info = yf.Ticker(ticker).get_info()  # 新しい yfinance では get_info 推奨
+    return info.get("longName") or info.get("shortName") or None
+
+
+def fetch_name(ticker: str, source: NameSource = yfinance_name, limiter=None,
+               retries: int = 3, backoff: float = 0.5) -> Optional[str]:
+    """社名を問い合わせる。失敗したら指数バックオフで retries 回まで試し、だめなら None"""
+    from fetch_stock import backoff_delay
+    for attempt in range(max(1, retries)):
+        if limiter is not None:
+            limiter.acquire()
+        try:
+            return source(ticker)
+        except Exception:
+            if attempt + 1 < retries:
+                time.sleep(backoff_delay(attempt, backoff))
+    return None
+
+
+def fetch_names(tickers: List[str], source: NameSource = yfinance_name, workers: int = 4,
+                rate: Optional[float] = None, burst: int = 1, retries: int = 3,
+                backoff: float = 0.5) -> Dict[str, Optional[str]]:
+    """
+    複数銘柄の社名をスレッドプールで並列に問い合わせる（同時に workers 件まで）。
+    ペースは全スレッド共通のトークンバケット（rate 回/秒）で制限する。
+    """
+    from fetch_stock import TokenBucket
+    limiter = TokenBucket(rate, burst) if rate else None
+    out: Dict[str, Optional[str]] = {}
+    total = len(tickers)
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        futures = {pool.submit(fetch_name, t, source, limiter, retries, backoff): t for t in tickers}
+        for done, fut in enumerate(as_completed(futures), 1):
+            t = futures[fut]
+            out[t] = fut.result()
+            if out[t]:
+                print(f"[{done}/{total}] {t} -> {out[t]}")
+            else:
+                print(f"[{done}/{total}] [WARN] {t}: name not found (retry after miss TTL)")
+    return out
+
+
+def build_name_map(tickers: List[str], out: str, cache: NameCache, source: NameSource = yfinance_name,
+                   refresh: bool = False, **fetch_kwargs) -> Dict[str, str]:
+    """
+    キャッシュに無い・期限切れの銘柄だけを問い合わせてキャッシュに入れ、
+    tickers 全部の社名を out（CSV）に書き出す。
+    """
+    missing = list(tickers) if refresh else cache.stale(tickers)
+    print(f"[INFO] name cache: {len(tickers) - len(missing)} hit, {len(missing)} to fetch")
+    if missing:
+        fetched = fetch_names(missing, source, **fetch_kwargs)
+        cache.put_many(fetched.items())
+
+    names = cache.names(tickers)
+    if write_name_map(out, names):
+        print(f"[OK] wrote: {out}")
+    else:
+        print(f"[OK] unchanged: {out}")
+    return names
 
 def main():
     ap = argparse.ArgumentParser()
     ap.add_argument("--tickers", nargs="*", help="銘柄（例: 7832 3659.T ...）")
     ap.add_argument("--from-csv-dir", type=str, help="data/raw など、CSVからティッカーを推定")
     ap.add_argument("--out", type=str, default="tools/name_map.csv")
-    ap.add_argument("--sleep", type=float, default=0.5, help="API呼び出しの間隔秒")
+    ap.add_argument("--sleep", type=float, default=0.5, help="API呼び出しの間隔秒。--rate 未指定時は 1/sleep 回/秒に制限")
+    ap.add_argument("--workers", type=int, default=4, help="同時に問い合わせるスレッド数（1 なら逐次）")
+    ap.add_argument("--rate", type=float, help="全体で1秒あたりの最大問い合わせ数")
+    ap.add_argument("--retries", type=int, default=3, help="1銘柄あたりの試行回数")
+    ap.add_argument("--cache", type=str, default=DEFAULT_CACHE, help=f"社名キャッシュ（SQLite、既定: {DEFAULT_CACHE}）")
+    ap.add_argument("--ttl-days", type=float, default=30.0, help="取得した社名の有効日数")
+    ap.add_argument("--miss-ttl-days", type=float, default=1.0, help="取得できなかった銘柄を取り直すまでの日数")
+    ap.add_argument("--refresh", action="store_true", help="キャッシュの期限に関係なく全銘柄を問い合わせる")
     args = ap.parse_args()
 
     tickers: List[str] = []
@@ -59,19 +130,13 @@ def main():
 
     tickers = sorted({normalize_ticker(t) for t in tickers})
 
-    rows: Dict[str, str] = {}
-    for i, t in enumerate(tickers, 1):
-        name = fetch_name(t)
-        rows[t] = name
-        print(f"[{i}/{len(tickers)}] {t} -> {name}")
-        time.sleep(args.sleep)
-
-    os.makedirs(os.path.dirname(args.out), exist_ok=True)
-    with open(args.out, "w", encoding="utf-8", newline="") as f:
-        f.write("ticker,name\n")
-        for t in sorted(rows):
-            f.write(f"{t},{rows[t]}\n")
-    print(f"[OK] wrote: {args.out}")
+    rate = args.rate if args.rate else (1.0 / args.sleep if args.sleep > 0 else None)
+    cache = NameCache(args.cache, ttl=args.ttl_days * DAY, miss_ttl=args.miss_ttl_days * DAY)
+    try:
+        build_name_map(tickers, args.out, cache, refresh=args.refresh,
+                       workers=args.workers, rate=rate, retries=args.retries)
+    finally:
+        cache.close()
 
 if __name__ == "__main__":
     main()
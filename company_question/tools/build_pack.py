@@ -10,18 +10,41 @@ CSVファイルからクイズパックを生成してpacks/pack_generated.pyに
   uv run python tools/build_pack.py --csv-files data/raw/5032_T_2022-08-28_to_2025-09-06.csv
   uv run python tools/build_pack.py --csv-dir data/raw --step 3 --scale 10000 --out packs/pack_sample.py \
       --name-map tools/name_map.csv
+  # 株価ストア（tools/price_store.py）から作る場合
+  uv run python tools/build_pack.py --store data/store
+
+CSVの解析はプロセスプールで並列に行います（--workers、既定は CPU 数、1 なら逐次）。
+結果は入力の順に集めるので、並列数によらず出力は RNG_SEED だけで決まります。
 """
 import argparse
+import bisect
 import csv
 import glob
 import os
 import random
-from dataclasses import dataclass
-from typing import Dict, List, Tuple
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from price_store import PriceStore
+
+# core/ を読めるようにプロジェクトのルートをパスに入れる
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from core.models import Question  # noqa: E402
+from core.pack import write_pack  # noqa: E402
+from core.downsample import METHODS, downsample as visual_downsample  # noqa: E402
+from core.align import align_many  # noqa: E402
 
 # -------- Settings (defaults) --------
 DEFAULT_SCALE = 10000  # normalized base value
 RNG_SEED = 42          # deterministic choices
+CHART_WIDTH = 226      # main.py のチャート枠の幅（画素）= --downsample lttb/m4 の既定の点数・列数
+DOWNSAMPLE_METHODS = ("step",) + METHODS
+INDEX_TICKER = "^N225"    # 重ね描きする指数（ファイル名・ストアの銘柄名の先頭）
+INDEX_LABEL = "Nikkei 225"
 
 
 @dataclass
@@ -30,6 +53,10 @@ class Series:
     name: str                  # e.g. ANYCOLOR Inc.
     span: Tuple[str, str]      # (start_date, end_date)
     prices: List[int]          # normalized ints
+    dates: List[str] = field(default_factory=list)  # trading date of each price
+    index_label: Optional[str] = None
+    index_prices: Optional[List[int]] = None        # index value on dates[index_offset:]
+    index_offset: int = 0                           # leading points dated before the index starts
 
 
 def ensure_dir(p: str) -> None:
@@ -54,49 +81,110 @@ def read_name_map(path: str) -> Dict[str, str]:
     return mp
 
 
-def parse_csv(path: str, step: int, scale: int, name_fallback: str) -> Series:
-    """
-    yfinance CSVを読み込み、正規化されたSeriesを返します。
-    - step: ダウンサンプリングの間隔 (例: 3 => 3行ごと)
-    - scale: 基準正規化値 (最初の終値 -> scale)
-    """
+def ticker_from_path(path: str) -> str:
     # infer ticker from filename: replace '_' back to '.'
     # e.g. data/raw/5032_T_2022-08-28_to_2025-09-06.csv -> 5032.T
     base = os.path.basename(path)
     parts = base.split("_")
     if len(parts) >= 2:
-        ticker = f"{parts[0]}.{parts[1]}".replace("..", ".")
-    else:
-        # フォールバック：拡張子を除いたファイル名などを使う等、適宜対処
-        ticker = os.path.splitext(base)[0]
+        return f"{parts[0]}.{parts[1]}".replace("..", ".")
+    # フォールバック：拡張子を除いたファイル名などを使う等、適宜対処
+    return os.path.splitext(base)[0]
+
+
+def parse_csv(path: str, step: int, scale: int, name_fallback: str,
+              downsample: str = "step", points: int = CHART_WIDTH) -> Series:
+    """
+    yfinance CSVを読み込み、正規化されたSeriesを返します。
+    - step: ダウンサンプリングの間隔 (例: 3 => 3行ごと)。downsample="step" の時だけ使います
+    - scale: 基準正規化値 (最初の終値 -> scale)
+    - downsample: "step" (step 行ごと) / "lttb" (points 点) / "m4" (points 列)
+    """
+    ticker = ticker_from_path(path)
 
-    dates: List[str] = []
-    closes: List[float] = []
     with open(path, "r", encoding="utf-8-sig", newline="") as f:
-        r = csv.DictReader(f)
-        for i, row in enumerate(r):
-            # down-sampling
-            if step > 1 and (i % step) != 0:
-                continue
-            d = (row.get("Date") or row.get("Datetime") or "").strip()
-            c = row.get("Close")
-            if not d or c is None or c == "":
+        r = csv.reader(f)
+        header = next(r, [])
+        # DictReader と同じく空行は行として数えない
+        rows = [row for row in r if row]
+
+    # down-sampling: 行番号が step の倍数の行だけ（スライス）
+    if step > 1 and downsample == "step":
+        rows = rows[::step]
+
+    date_col = header.index("Date") if "Date" in header else (
+        header.index("Datetime") if "Datetime" in header else None)
+    close_col = header.index("Close") if "Close" in header else None
+
+    dates: List[str] = []
+    closes: List[str] = []
+    if date_col is not None and close_col is not None:
+        for row in rows:
+            if len(row) <= max(date_col, close_col):
                 continue
-            try:
-                cval = float(c)
-            except ValueError:
+            d = row[date_col].strip()
+            c = row[close_col]
+            if not d or c == "":
                 continue
             dates.append(d)
-            closes.append(cval)
+            closes.append(c)
 
-    if not closes:
-        raise RuntimeError(f"No close prices in {path}")
+    # 数値に変換できない終値（yf.download の2段目のヘッダーなど）は落とす
+    try:
+        values = np.array(closes, dtype=np.float64)
+    except ValueError:
+        keep = [i for i, c in enumerate(closes) if _is_float(c)]
+        dates = [dates[i] for i in keep]
+        values = np.array([closes[i] for i in keep], dtype=np.float64)
+
+    return make_series(ticker, dates, values, scale, name_fallback, path, downsample, points)
+
+
+def _is_float(s: str) -> bool:
+    try:
+        float(s)
+    except ValueError:
+        return False
+    return True
+
+
+def parse_store(store_root: str, ticker: str, step: int, scale: int, name_fallback: str,
+                start: Optional[str] = None, end: Optional[str] = None,
+                downsample: str = "step", points: int = CHART_WIDTH) -> Series:
+    """
+    株価ストアの Close 列（memmap、コピーなし）から正規化されたSeriesを返します。
+    間引きは保存済みの行に対して step 行ごと（スライス）、または downsample の方法です。
+    """
+    store = PriceStore(store_root)
+    cols = store.load(ticker, start, end)
+    step = max(1, step) if downsample == "step" else 1
+    dates = [str(d) for d in cols["Date"][::step]]
+    closes = cols["Close"][::step]
+    return make_series(ticker, dates, closes, scale, name_fallback, store.path(ticker), downsample, points)
+
+
+def make_series(ticker: str, dates: List[str], closes: np.ndarray, scale: int,
+                name_fallback: str, source: str,
+                downsample: str = "step", points: int = CHART_WIDTH) -> Series:
+    """
+    終値の列を先頭=scale で正規化して Series にします。
+    downsample が "lttb" / "m4" なら、山・谷を残すように points 点（列）に間引きます。
+    """
+    closes = np.asarray(closes, dtype=np.float64)
+    if closes.size == 0:
+        raise RuntimeError(f"No close prices in {source}")
+
+    if downsample != "step":
+        keep = visual_downsample(closes, points, downsample)
+        closes = closes[keep]
+        dates = [dates[i] for i in keep.tolist()]
 
     base_close = closes[0]
     if base_close == 0:
-        raise RuntimeError(f"First close price is zero in {path}")
+        raise RuntimeError(f"First close price is zero in {source}")
 
-    prices_norm = [int(round((v / base_close) * scale)) for v in closes]
+    # np.rint は round() と同じ偶数丸め
+    prices_norm = np.rint((closes / base_close) * scale).astype(np.int64).tolist()
     span = (dates[0], dates[-1])
 
     return Series(
@@ -104,9 +192,100 @@ def parse_csv(path: str, step: int, scale: int, name_fallback: str) -> Series:
         name=name_fallback,
         span=span,
         prices=prices_norm,
+        dates=list(dates),
     )
 
 
+def _parse_csv_job(args: Tuple[str, int, int, str, str, int]) -> Series:
+    return parse_csv(*args)
+
+
+def _parse_store_job(args: Tuple[str, str, int, int, str, Optional[str], Optional[str], str, int]) -> Series:
+    return parse_store(*args)
+
+
+def parse_all(csv_paths: List[str], step: int, scale: int, name_fallback: str,
+              store_root: Optional[str] = None, store_tickers: Sequence[str] = (),
+              start: Optional[str] = None, end: Optional[str] = None,
+              workers: Optional[int] = None,
+              downsample: str = "step", points: int = CHART_WIDTH) -> List[Series]:
+    """
+    CSV と株価ストアの銘柄をまとめて解析します。
+    workers が 1 なら逐次、それ以外はプロセスプールで並列に解析します。
+    結果は常に csv_paths、store_tickers の順です。
+    """
+    csv_jobs = [(p, step, scale, name_fallback, downsample, points) for p in csv_paths]
+    store_jobs = [(store_root, t, step, scale, name_fallback, start, end, downsample, points)
+                  for t in store_tickers]
+    if workers == 1 or len(csv_jobs) + len(store_jobs) <= 1:
+        return ([_parse_csv_job(j) for j in csv_jobs]
+                + [_parse_store_job(j) for j in store_jobs])
+
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        n = len(csv_jobs) + len(store_jobs)
+        chunksize = max(1, n // (4 * (workers or os.cpu_count() or 1)))
+        series = list(ex.map(_parse_csv_job, csv_jobs, chunksize=chunksize))
+        series += list(ex.map(_parse_store_job, store_jobs, chunksize=chunksize))
+    return series
+
+
+def parse_index(csv_paths: List[str], scale: int,
+                store_root: Optional[str] = None, store_tickers: Sequence[str] = (),
+                start: Optional[str] = None, end: Optional[str] = None) -> Optional[Series]:
+    """
+    指数（INDEX_TICKER）を間引かずに読み込みます。無ければ None。
+    位置合わせは全取引日で行うので、問題の系列の間引き方によらず正確です。
+    """
+    paths = [p for p in csv_paths if ticker_from_path(p).startswith(INDEX_TICKER)]
+    if paths:
+        return parse_csv(paths[0], 1, scale, INDEX_LABEL)
+    tickers = [t for t in store_tickers if t.startswith(INDEX_TICKER)]
+    if store_root and tickers:
+        return parse_store(store_root, tickers[0], 1, scale, INDEX_LABEL, start, end)
+    return None
+
+
+def attach_index(series_list: List[Series], index: Series) -> None:
+    """
+    各 Series の取引日について、その日以前で最後の指数の値を index_prices に入れます
+    （core/align.py の as-of 結合）。指数が始まる前の点は値を作らず、
+    その点の数を index_offset に入れます（prices[index_offset:] と index_prices が対応）。
+    """
+    aligned = align_many(index.dates, index.prices, [s.dates for s in series_list])
+    for s, (offset, values) in zip(series_list, aligned):
+        if not values:
+            continue  # 期間全体が指数の開始より前
+        s.index_label = INDEX_LABEL
+        s.index_prices = values
+        s.index_offset = offset
+
+
+class _NamesExcept(Sequence):
+    """
+    all_names から name と同じ要素を除いた列（コピーを作らない）。
+    random.sample に渡すと、除いたリストを作って渡した時と同じ結果になります。
+    """
+
+    def __init__(self, all_names: List[str], skip: List[int]):
+        self.all_names = all_names
+        self.skip = skip  # name がある位置（昇順）
+
+    def __len__(self) -> int:
+        return len(self.all_names) - len(self.skip)
+
+    def __getitem__(self, j: int) -> str:
+        # j 番目の残りの要素 = 位置 j + (それまでに飛ばした数)
+        i = j
+        k = bisect.bisect_right(self.skip, i)
+        while k:
+            i = j + k
+            k2 = bisect.bisect_right(self.skip, i)
+            if k2 == k:
+                break
+            k = k2
+        return self.all_names[i]
+
+
 def to_identifier(s: str) -> str:
     """必要に応じてPythonの変数名として安全な識別子に変換します."""
     out = []
@@ -123,15 +302,13 @@ def to_identifier(s: str) -> str:
     return v
 
 
-def build_questions_py(series_list: List[Series],
-                       name_map: Dict[str, str],
-                       out_path: str) -> None:
+def quiz_entries(series_list: List[Series],
+                 name_map: Dict[str, str]) -> Iterator[Tuple[Series, List[str], str]]:
     """
-    `QUESTIONS`リストを定義するPythonモジュールを英語で出力します。
-    選択肢は他の企業名からサンプリングして構築されます。
+    Series ごとに (Series, 選択肢, 解説) を返します。
+    選択肢は他の企業名からサンプリングして構築されます（RNG_SEED で決まる）。
     """
-    ensure_dir(os.path.dirname(out_path))
-    random.seed(RNG_SEED)
+    rng = random.Random(RNG_SEED)
 
     # fill names from name_map if present
     all_names = []
@@ -143,26 +320,44 @@ def build_questions_py(series_list: List[Series],
             s.name = s.ticker
         all_names.append(s.name)
 
+    positions: Dict[str, List[int]] = {}
+    for i, n in enumerate(all_names):
+        positions.setdefault(n, []).append(i)
+    small_pools: Dict[str, List[str]] = {}  # 選択肢が3つ未満しかない名前 -> 残りの名前
+
+    for s in series_list:
+        # build 3 distractors
+        pool = _NamesExcept(all_names, positions[s.name])
+        if len(pool) >= 3:
+            distractors = rng.sample(pool, 3)
+        else:
+            # not enough pool -> repeat ticker-based fillers
+            if s.name not in small_pools:
+                small_pools[s.name] = [n for n in all_names if n != s.name]
+            distractors = (small_pools[s.name] + [f"{s.ticker}-A", f"{s.ticker}-B", f"{s.ticker}-C"])[:3]
+
+        # shuffle choices with correct answer
+        choices = distractors + [s.name]
+        rng.shuffle(choices)
+
+        # minimal English blurb placeholder (edit later if needed)
+        blurb = f"{s.name} stock price quiz item. The company name is in English."
+        yield s, choices, blurb
+
+
+def build_questions_py(series_list: List[Series],
+                       name_map: Dict[str, str],
+                       out_path: str) -> None:
+    """
+    `QUESTIONS`リストを定義するPythonモジュールを英語で出力します。
+    """
+    ensure_dir(os.path.dirname(out_path))
+
     with open(out_path, "w", encoding="utf-8", newline="\n") as w:
         w.write("# Auto-generated by tools/build_pack.py\n")
         w.write("from core.models import Question\n\n")
         w.write("QUESTIONS = [\n")
-        for s in series_list:
-            # build 3 distractors
-            pool = [n for n in all_names if n != s.name]
-            if len(pool) >= 3:
-                distractors = random.sample(pool, 3)
-            else:
-                # not enough pool -> repeat ticker-based fillers
-                distractors = (pool + [f"{s.ticker}-A", f"{s.ticker}-B", f"{s.ticker}-C"])[:3]
-
-            # shuffle choices with correct answer
-            choices = distractors + [s.name]
-            random.shuffle(choices)
-
-            # minimal English blurb placeholder (edit later if needed)
-            blurb = f"{s.name} stock price quiz item. The company name is in English."
-
+        for s, choices, blurb in quiz_entries(series_list, name_map):
             # write Question entry
             w.write("    Question(\n")
             w.write(f"        ticker={s.ticker!r},\n")
@@ -178,19 +373,64 @@ def build_questions_py(series_list: List[Series],
             w.write(", ".join(repr(c) for c in choices))
             w.write("],\n")
             w.write(f"        blurb={blurb!r},\n")
+            if s.index_prices is not None:
+                w.write(f"        index_label={s.index_label!r},\n")
+                if s.index_offset:
+                    w.write(f"        index_offset={s.index_offset},\n")
+                w.write("        index_prices=[")
+                w.write(", ".join(str(x) for x in s.index_prices))
+                w.write("],\n")
             w.write("    ),\n")
         w.write("]\n")
 
     print(f"[OK] Wrote {out_path} with {len(series_list)} questions.")
 
 
+def build_questions_bin(series_list: List[Series],
+                        name_map: Dict[str, str],
+                        out_path: str) -> None:
+    """
+    バイナリのパック（core/pack.py）を出力します。問題の中身は build_questions_py と同じです。
+    日経平均（^N225）の問題の番号をヘッダーに入れておくので、ゲームは索引だけで見つけられます。
+    """
+    ensure_dir(os.path.dirname(out_path))
+    questions: List[Question] = []
+    index_question = -1
+    for s, choices, blurb in quiz_entries(series_list, name_map):
+        if index_question < 0 and s.ticker.startswith(INDEX_TICKER):
+            index_question = len(questions)
+        questions.append(Question(
+            ticker=s.ticker,
+            name=s.name,
+            span=s.span,
+            prices=s.prices,
+            choices=choices,
+            blurb=blurb,
+            index_label=s.index_label,
+            index_prices=s.index_prices,
+            index_offset=s.index_offset,
+        ))
+    write_pack(out_path, questions, index_question)
+    print(f"[OK] Wrote {out_path} with {len(series_list)} questions.")
+
+
 def main():
     ap = argparse.ArgumentParser(description="Build Pyxel quiz pack from CSVs.")
     ap.add_argument("--csv-dir", type=str, help="Directory containing CSVs (glob: *.csv)")
     ap.add_argument("--csv-files", nargs="*", help="Explicit CSV files")
+    ap.add_argument("--store", type=str, help="Per-ticker price store directory (tools/price_store.py)")
+    ap.add_argument("--tickers", nargs="*", help="Tickers to take from --store (default: all)")
+    ap.add_argument("--start", type=str, help="First date to take from --store (inclusive)")
+    ap.add_argument("--end", type=str, help="Last date to take from --store (exclusive)")
+    ap.add_argument("--workers", type=int, default=None, help="Parser processes (default: CPU count, 1: serial)")
     ap.add_argument("--step", type=int, default=3, help="Down-sampling step (default: 3)")
+    ap.add_argument("--downsample", choices=DOWNSAMPLE_METHODS, default="step",
+                    help="step: every --step rows, lttb/m4: keep peaks and troughs (default: step)")
+    ap.add_argument("--points", type=int, default=CHART_WIDTH,
+                    help=f"Points (lttb) or pixel columns (m4) to keep (default: {CHART_WIDTH})")
     ap.add_argument("--scale", type=int, default=DEFAULT_SCALE, help="Normalization base (default: 10000)")
-    ap.add_argument("--out", type=str, default="packs/pack_generated.py", help="Output pack path")
+    ap.add_argument("--out", type=str, default="packs/pack_generated.py",
+                    help="Output pack path (.py: Python module, .bin: binary pack)")
     ap.add_argument("--name-map", type=str, default="", help="CSV with header: ticker,name (English)")
     args = ap.parse_args()
 
@@ -201,20 +441,37 @@ def main():
         csv_paths.extend(args.csv_files)
     csv_paths = sorted(set(csv_paths))
 
-    if not csv_paths:
-        raise SystemExit("No CSV files. Use --csv-dir or --csv-files")
+    store = PriceStore(args.store) if args.store else None
+    store_tickers: List[str] = []
+    if store is not None:
+        store_tickers = sorted(set(args.tickers or store.tickers()))
+
+    if not csv_paths and not store_tickers:
+        raise SystemExit("No CSV files. Use --csv-dir, --csv-files or --store")
 
     name_map: Dict[str, str] = {}
     if args.name_map and os.path.exists(args.name_map):
         name_map = read_name_map(args.name_map)
 
-    series_list: List[Series] = []
-    for p in csv_paths:
-        # fallback company name: use ticker until name_map fills it
-        s = parse_csv(p, step=args.step, scale=args.scale, name_fallback="(unknown)")
-        series_list.append(s)
+    # fallback company name: use ticker until name_map fills it
+    series_list = parse_all(csv_paths, step=args.step, scale=args.scale, name_fallback="(unknown)",
+                            store_root=args.store, store_tickers=store_tickers,
+                            start=args.start, end=args.end, workers=args.workers,
+                            downsample=args.downsample, points=args.points)
+
+    # 指数の重ね描き用に、各問題の取引日で指数の値を引き当てておく
+    index = parse_index(csv_paths, scale=args.scale, store_root=args.store, store_tickers=store_tickers,
+                        start=args.start, end=args.end)
+    if index is not None:
+        attach_index(series_list, index)
+        print(f"[INFO] Aligned {INDEX_LABEL} ({index.span[0]}..{index.span[1]}) to {len(series_list)} series.")
+    else:
+        print(f"[WARN] No {INDEX_TICKER} data; questions have no index overlay.")
 
-    build_questions_py(series_list, name_map=name_map, out_path=args.out)
+    if args.out.endswith(".bin"):
+        build_questions_bin(series_list, name_map=name_map, out_path=args.out)
+    else:
+        build_questions_py(series_list, name_map=name_map, out_path=args.out)
 
 
 if __name__ == "__main__":
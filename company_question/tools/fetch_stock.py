@@ -1,16 +1,24 @@
 # UTF-8
 import argparse
 import os
+import random
+import threading
 import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta, timezone
-from typing import Iterable, List, Optional
+from typing import Callable, Iterable, List, Optional, Tuple
 
 import pandas as pd
-import yfinance as yf
+
+from price_store import PriceStore, Row
 
 
 JST = timezone(timedelta(hours=9))
 
+# データ取得元: source(ticker, start, end, interval) -> DataFrame
+Source = Callable[[str, Optional[str], Optional[str], str], pd.DataFrame]
+
 
 def ensure_dir(path: str) -> None:
     if not os.path.exists(path):
@@ -64,6 +72,119 @@ def daterange_3y_if_missing(start: Optional[str], end: Optional[str]) -> tuple[O
     return start, end
 
 
+class TokenBucket:
+    """
+    全スレッド共通のレート制限（トークンバケット）。
+    rate 個/秒でトークンが貯まり、最大 burst 個まで持てる。
+    acquire() はトークンが1個取れるまで待つ。
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.tokens = float(self.burst)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1.0:
+                    self.tokens -= 1.0
+                    return
+                wait = (1.0 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+def backoff_delay(attempt: int, base: float, cap: float = 30.0,
+                  rng: Optional[random.Random] = None) -> float:
+    """
+    指数バックオフ＋ジッター（full jitter）。attempt は 0 始まりの失敗回数。
+    0 〜 min(cap, base * 2**attempt) の一様乱数を返すので、
+    同時に失敗したスレッドがそろって再試行することがない。
+    """
+    r = rng or random
+    return r.uniform(0.0, min(cap, base * (2 ** attempt)))
+
+
+def yfinance_source(ticker: str, start: Optional[str], end: Optional[str], interval: str) -> pd.DataFrame:
+    """
+    yfinance から取得する。
+    yf.download は内部で共有の辞書を使うので並列に呼べない。
+    銘柄ごとの Ticker.history を使い、日付はタイムゾーンを外した日付にそろえる。
+    """
+    import yfinance as yf
+
+    tk = yf.Ticker(ticker)
+    if start and end:
+        df = tk.history(start=start, end=end, interval=interval, auto_adjust=False)
+    else:
+        # 期間が空なら period 指定（ただし本スクリプトでは通常使わない）
+        df = tk.history(period="3y", interval=interval, auto_adjust=False)
+    if isinstance(df, pd.DataFrame) and not df.empty:
+        if getattr(df.index, "tz", None) is not None:
+            df.index = df.index.tz_localize(None)
+        df.index = df.index.normalize()
+        df.index.name = "Date"
+        cols = [c for c in ("Open", "High", "Low", "Close", "Adj Close", "Volume") if c in df.columns]
+        df = df[cols]
+    return df
+
+
+STUB_EPOCH = "2015-01-01"  # StubSource の疑似データの開始日
+
+
+class StubSource:
+    """
+    ネットワークを使わないテスト用の取得元。
+    銘柄ごとに決まった乱数でランダムウォークの株価を作る（同じ銘柄なら毎回同じ値）。
+    - fail_rate: 各呼び出しが失敗する確率（リトライ・バックオフの確認用）
+    - latency: 1回の呼び出しにかかる秒数（並列化の効果の確認用）
+    """
+
+    def __init__(self, seed: int = 0, fail_rate: float = 0.0, latency: float = 0.0):
+        self.seed = seed
+        self.fail_rate = fail_rate
+        self.latency = latency
+        self.calls = 0
+        self.failures = 0
+        self.lock = threading.Lock()
+        self.rng = random.Random(seed)
+
+    def __call__(self, ticker: str, start: Optional[str], end: Optional[str], interval: str) -> pd.DataFrame:
+        with self.lock:
+            self.calls += 1
+            fail = self.rng.random() < self.fail_rate
+            if fail:
+                self.failures += 1
+        if self.latency:
+            time.sleep(self.latency)
+        if fail:
+            raise RuntimeError(f"stub failure for {ticker}")
+
+        start, end = daterange_3y_if_missing(start, end)
+        freq = {"1d": "B", "1wk": "W-FRI", "1mo": "MS"}[interval]
+        # 期間によらず同じ日には同じ値になるよう、STUB_EPOCH から歩かせて切り出す
+        # end は yfinance と同じく含まない
+        dates = pd.date_range(start=STUB_EPOCH, end=pd.Timestamp(end) - pd.Timedelta(days=1), freq=freq, name="Date")
+        rng = random.Random(zlib.crc32(ticker.encode("utf-8")) ^ self.seed)
+        price = rng.uniform(500, 10000)
+        rows = []
+        for _ in dates:
+            open_ = price
+            price = max(1.0, price * (1.0 + rng.gauss(0.0, 0.02)))
+            high = max(open_, price) * (1.0 + abs(rng.gauss(0.0, 0.005)))
+            low = min(open_, price) * (1.0 - abs(rng.gauss(0.0, 0.005)))
+            rows.append((open_, high, low, price, price, rng.randrange(10_000, 5_000_000)))
+        df = pd.DataFrame(rows, index=dates, columns=["Open", "High", "Low", "Close", "Adj Close", "Volume"])
+        return df[df.index >= pd.Timestamp(start)]
+
+
 def safe_history(
     ticker: str,
     start: Optional[str],
@@ -71,25 +192,31 @@ def safe_history(
     interval: str = "1d",
     retries: int = 3,
     sleep_sec: float = 1.0,
+    source: Source = yfinance_source,
+    limiter: Optional[TokenBucket] = None,
+    rng: Optional[random.Random] = None,
+    allow_empty: bool = False,
 ) -> pd.DataFrame:
     """
-    yfinance 取得の簡易リトライラッパー。
+    取得の簡易リトライラッパー。
+    呼び出しごとに limiter のトークンを取り、失敗したら sleep_sec を基準に
+    ジッター付きの指数バックオフで待ってから再試行する。
+    allow_empty=True なら空の結果（差分取得で新しい行が無い時）もそのまま返す。
     """
     last_err: Optional[Exception] = None
     for i in range(retries):
         try:
-            if start and end:
-                df = yf.download(ticker, start=start, end=end, interval=interval, progress=False, auto_adjust=False)
-            else:
-                # 期間が空なら period 指定（ただし本スクリプトでは通常使わない）
-                df = yf.download(ticker, period="3y", interval=interval, progress=False, auto_adjust=False)
-            if isinstance(df, pd.DataFrame) and not df.empty:
+            if limiter is not None:
+                limiter.acquire()
+            df = source(ticker, start, end, interval)
+            if isinstance(df, pd.DataFrame) and (allow_empty or not df.empty):
                 return df
             # 空なら例外化してリトライ
             raise RuntimeError(f"empty dataframe for {ticker}")
         except Exception as e:
             last_err = e
-            time.sleep(sleep_sec * (i + 1))
+            if i + 1 < retries:
+                time.sleep(backoff_delay(i, sleep_sec, rng=rng))
     assert last_err is not None
     raise last_err
 
@@ -119,6 +246,103 @@ def save_csv(df: pd.DataFrame, out_dir: str, ticker: str, start: Optional[str],
     return out_path
 
 
+def frame_to_rows(df: pd.DataFrame) -> List[Row]:
+    """取得した DataFrame をストアの行 (Date, Open, High, Low, Close, Adj Close, Volume) にする"""
+    if isinstance(df.columns, pd.MultiIndex):
+        # yf.download 形式（列が (Price, Ticker) の2段）なら1段にする
+        df = df.droplevel(1, axis=1)
+    rows: List[Row] = []
+    for d, r in df.iterrows():
+        if pd.isna(r["Close"]):
+            continue
+        adj = r["Adj Close"] if "Adj Close" in df.columns else r["Close"]
+        rows.append((
+            pd.Timestamp(d).date().isoformat(),
+            float(r["Open"]), float(r["High"]), float(r["Low"]), float(r["Close"]), float(adj),
+            int(r["Volume"]) if not pd.isna(r["Volume"]) else 0,
+        ))
+    return rows
+
+
+def fetch_one(
+    ticker: str,
+    start: Optional[str],
+    end: Optional[str],
+    interval: str,
+    out_dir: str,
+    source: Source,
+    limiter: Optional[TokenBucket],
+    retries: int,
+    backoff: float,
+    store: Optional[PriceStore] = None,
+    export: bool = False,
+) -> Tuple[str, int]:
+    """
+    1銘柄を取得して保存し、(保存先, 行数) を返す。
+    store を指定すると、ストアに無い末尾の期間だけを取得して追記する（行数は追記した数）。
+    export=True ならストアから従来形式のCSVも out_dir に書き出す（同じ銘柄の前のCSVは置き換える）。
+    """
+    if store is None:
+        df = safe_history(ticker, start, end, interval=interval, retries=retries,
+                          sleep_sec=backoff, source=source, limiter=limiter)
+        path = save_csv(df, out_dir, ticker, start, end)
+        return path, len(df)
+
+    appended = 0
+    fetch_start = store.next_start(ticker, start)
+    if not (fetch_start and end and fetch_start >= end):
+        df = safe_history(ticker, fetch_start, end, interval=interval, retries=retries,
+                          sleep_sec=backoff, source=source, limiter=limiter, allow_empty=True)
+        appended = store.append(ticker, frame_to_rows(df))
+    path = store.path(ticker)
+    if export:
+        path = store.export_csv(ticker, out_dir, start, end) or path
+    return path, appended
+
+
+def fetch_all(
+    tickers: List[str],
+    start: Optional[str],
+    end: Optional[str],
+    interval: str,
+    out_dir: str,
+    source: Source = yfinance_source,
+    workers: int = 4,
+    limiter: Optional[TokenBucket] = None,
+    retries: int = 3,
+    backoff: float = 1.0,
+    store: Optional[PriceStore] = None,
+    export: bool = False,
+) -> Tuple[List[str], List[str]]:
+    """
+    複数銘柄をスレッドプールで並列に取得する。
+    取得のペースは limiter（全スレッド共通）で制限し、終わった順に進捗を表示する。
+    (成功した銘柄, 失敗した銘柄) を返す。
+    """
+    ok: List[str] = []
+    failed: List[str] = []
+    total = len(tickers)
+    t0 = time.monotonic()
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        futures = {
+            pool.submit(fetch_one, t, start, end, interval, out_dir, source, limiter, retries, backoff,
+                        store, export): t
+            for t in tickers
+        }
+        for done, fut in enumerate(as_completed(futures), 1):
+            t = futures[fut]
+            elapsed = time.monotonic() - t0
+            try:
+                path, rows = fut.result()
+                ok.append(t)
+                label = "appended" if store is not None else "rows"
+                print(f"[{done}/{total}] {t} -> saved: {path}  {label}={rows}  ({elapsed:.1f}s)")
+            except Exception as e:
+                failed.append(t)
+                print(f"[{done}/{total}] [WARN] failed: {t} reason={e}  ({elapsed:.1f}s)")
+    return sorted(ok), sorted(failed)
+
+
 def main():
     parser = argparse.ArgumentParser(description="Fetch stock prices via yfinance and save as CSV.")
     parser.add_argument("--tickers", nargs="*", help="銘柄コード（例: 7203 6758.T 9984.T）スペース区切り複数可")
@@ -127,7 +351,18 @@ def main():
     parser.add_argument("--end", type=str, help="終了日 YYYY-MM-DD（未指定なら今日）")
     parser.add_argument("--out", type=str, default="data/raw", help="出力ディレクトリ（既定: data/raw）")
     parser.add_argument("--interval", type=str, default="1d", choices=["1d", "1wk", "1mo"], help="取得間隔")
-    parser.add_argument("--sleep", type=float, default=1.0, help="連続取得の待機秒（無料利用の礼儀）")
+    parser.add_argument("--sleep", type=float, default=1.0, help="連続取得の待機秒（無料利用の礼儀）。--rate 未指定時は 1/sleep 回/秒に制限")
+    parser.add_argument("--workers", type=int, default=4, help="同時に取得するスレッド数（1 なら逐次）")
+    parser.add_argument("--rate", type=float, help="全体で1秒あたりの最大リクエスト数")
+    parser.add_argument("--burst", type=int, default=1, help="レート制限で連続して送れるリクエスト数")
+    parser.add_argument("--retries", type=int, default=3, help="1銘柄あたりの試行回数")
+    parser.add_argument("--backoff", type=float, default=1.0, help="リトライ待ちの基準秒（指数＋ジッター）")
+    parser.add_argument("--source", choices=["yfinance", "stub"], default="yfinance",
+                        help="取得元（stub はネットワークを使わない試験用の疑似データ）")
+    parser.add_argument("--stub-fail-rate", type=float, default=0.0, help="stub の失敗確率")
+    parser.add_argument("--stub-latency", type=float, default=0.0, help="stub の1回あたりの待ち秒")
+    parser.add_argument("--store", type=str, help="銘柄ごとの株価ストア（例: data/store）。指定すると未取得の末尾だけを取得して追記")
+    parser.add_argument("--export", action="store_true", help="--store 使用時、従来形式のCSVも --out に書き出す（同じ銘柄の前のCSVは置き換える）")
     args = parser.parse_args()
 
     tickers = load_tickers(args)
@@ -137,15 +372,25 @@ def main():
     print(f"[INFO] period={start} -> {end}, interval={args.interval}")
     print(f"[INFO] out_dir={args.out}")
 
-    for i, t in enumerate(tickers, 1):
-        try:
-            print(f"[{i}/{len(tickers)}] fetching {t} ...")
-            df = safe_history(t, start, end, interval=args.interval)
-            path = save_csv(df, args.out, t, start, end)
-            print(f"  -> saved: {path}  rows={len(df)}")
-        except Exception as e:
-            print(f"[WARN] failed: {t} reason={e}")
-        time.sleep(args.sleep)
+    if args.source == "stub":
+        source: Source = StubSource(fail_rate=args.stub_fail_rate, latency=args.stub_latency)
+    else:
+        source = yfinance_source
+    rate = args.rate if args.rate else (1.0 / args.sleep if args.sleep > 0 else None)
+    limiter = TokenBucket(rate, args.burst) if rate else None
+    print(f"[INFO] source={args.source} workers={args.workers} rate={rate or 'unlimited'}/s")
+    store = PriceStore(args.store) if args.store else None
+    if store is not None:
+        print(f"[INFO] store={args.store} export={args.export}")
+
+    t0 = time.monotonic()
+    ok, failed = fetch_all(tickers, start, end, args.interval, args.out, source=source,
+                           workers=args.workers, limiter=limiter,
+                           retries=args.retries, backoff=args.backoff,
+                           store=store, export=args.export)
+    print(f"[INFO] done: ok={len(ok)} failed={len(failed)} elapsed={time.monotonic() - t0:.1f}s")
+    if failed:
+        print(f"[WARN] failed tickers: {failed}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+"""
+ticker -> 社名 の永続キャッシュ（SQLite、有効期限付き）。
+
+build_name_map.py は毎回すべての銘柄を yfinance に問い合わせていたが、
+社名はほとんど変わらない。ここに (ticker, 社名, 取得時刻, 最後に問い合わせた時刻, 成否) を
+貯めておき、無い銘柄と期限切れの銘柄だけを問い合わせる。
+
+  成功した社名      ttl（既定 30日）だけ有効
+  取得に失敗した銘柄  社名の代わりに ticker を入れ、miss_ttl（既定 1日）で取り直す
+  期限切れの取り直しに失敗した時は、前に取れた社名をそのまま残し、
+  問い合わせた時刻だけを進める（miss_ttl の間は取り直さない）
+
+name_map.csv はキャッシュから書き出す（内容が変わらなければ書き直さない）。
+"""
+import csv
+import io
+import os
+import sqlite3
+import time
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+DAY = 24 * 60 * 60
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS names (
+    ticker     TEXT PRIMARY KEY,
+    name       TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    checked_at REAL NOT NULL,
+    ok         INTEGER NOT NULL
+)
+"""
+
+
+class NameCache:
+    """
+    SQLite の1ファイルに社名を貯める。
+    fresh() は期限内の社名を返し、stale() は問い合わせが必要な銘柄を返す。
+    """
+
+    def __init__(self, path: str, ttl: float = 30 * DAY, miss_ttl: float = DAY):
+        self.path = path
+        self.ttl = ttl
+        self.miss_ttl = miss_ttl
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.db = sqlite3.connect(path)
+        self.db.execute(_SCHEMA)
+        columns = [row[1] for row in self.db.execute("PRAGMA table_info(names)")]
+        if "checked_at" not in columns:
+            # checked_at が無かった頃のキャッシュ
+            self.db.execute("ALTER TABLE names ADD COLUMN checked_at REAL NOT NULL DEFAULT 0")
+            self.db.execute("UPDATE names SET checked_at = fetched_at")
+        self.db.commit()
+
+    def close(self) -> None:
+        self.db.close()
+
+    def _rows(self, tickers: Sequence[str]) -> Dict[str, Tuple[str, float, float, int]]:
+        rows: Dict[str, Tuple[str, float, float, int]] = {}
+        # SQLite の変数の上限を超えないように分けて引く
+        for i in range(0, len(tickers), 500):
+            chunk = list(tickers[i:i + 500])
+            marks = ",".join("?" * len(chunk))
+            for t, name, fetched_at, checked_at, ok in self.db.execute(
+                    f"SELECT ticker, name, fetched_at, checked_at, ok FROM names WHERE ticker IN ({marks})",
+                    chunk):
+                rows[t] = (name, fetched_at, checked_at, ok)
+        return rows
+
+    def fresh(self, tickers: Sequence[str], now: Optional[float] = None) -> Dict[str, str]:
+        """期限内の社名（失敗した銘柄は ticker のまま）"""
+        now = time.time() if now is None else now
+        out: Dict[str, str] = {}
+        for t, (name, fetched_at, checked_at, ok) in self._rows(tickers).items():
+            if ok and now - fetched_at < self.ttl:
+                out[t] = name
+            elif now - checked_at < self.miss_ttl and (not ok or checked_at > fetched_at):
+                # 取得に失敗したばかり（前に取れた社名があればそれを使う）
+                out[t] = name
+        return out
+
+    def stale(self, tickers: Sequence[str], now: Optional[float] = None) -> List[str]:
+        """キャッシュに無い、または期限切れの銘柄"""
+        fresh = self.fresh(tickers, now)
+        return [t for t in tickers if t not in fresh]
+
+    def put(self, ticker: str, name: Optional[str], now: Optional[float] = None) -> None:
+        """name が None なら取得失敗（前に取れた社名が無い時だけ ticker を入れる）"""
+        self.put_many([(ticker, name)], now)
+
+    def put_many(self, items: Iterable[Tuple[str, Optional[str]]], now: Optional[float] = None) -> None:
+        now = time.time() if now is None else now
+        items = list(items)
+        found = [(t, name, now, now) for t, name in items if name]
+        failed = [t for t, name in items if not name]
+        with self.db:
+            self.db.executemany(
+                "INSERT OR REPLACE INTO names (ticker, name, fetched_at, checked_at, ok) VALUES (?, ?, ?, ?, 1)",
+                found)
+            # 失敗: 既にある行は社名を残して問い合わせた時刻だけ進め、無ければ ticker を入れる
+            self.db.executemany("UPDATE names SET checked_at = ? WHERE ticker = ?", [(now, t) for t in failed])
+            self.db.executemany(
+                "INSERT OR IGNORE INTO names (ticker, name, fetched_at, checked_at, ok) VALUES (?, ?, ?, ?, 0)",
+                [(t, t, now, now) for t in failed])
+
+    def names(self, tickers: Sequence[str]) -> Dict[str, str]:
+        """期限に関係なく、キャッシュにある社名"""
+        return {t: row[0] for t, row in self._rows(tickers).items()}
+
+
+def write_name_map(path: str, names: Dict[str, str]) -> bool:
+    """
+    ヘッダー付きCSV（ticker,name）を書き出す。社名のカンマは引用符で囲む。
+    内容が同じなら書き直さずに False を返す。
+    """
+    buf = io.StringIO()
+    w = csv.writer(buf, lineterminator="\n")
+    w.writerow(["ticker", "name"])
+    for t in sorted(names):
+        w.writerow([t, names[t]])
+    text = buf.getvalue()
+
+    if os.path.exists(path):
+        with open(path, "r", encoding="utf-8", newline="") as f:
+            if f.read() == text:
+                return False
+    if os.path.dirname(path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        f.write(text)
+    return True
@@ -0,0 +1,259 @@
+# -*- coding: utf-8 -*-
+"""
+銘柄ごとの株価ストア（列ごとのバイナリ・追記専用）。
+
+data/store/<ticker>/ に 1銘柄 1ディレクトリで日足を貯めていく。
+列ごとに1ファイルの生の配列（リトルエンディアン）で、numpy.memmap でそのまま読める。
+
+  Date.i8        1970-01-01 からの日数（int64、昇順）= 日付の索引
+  Open.f4 High.f4 Low.f4 Close.f4 AdjClose.f4   float32
+  Volume.i8      int64
+
+追記は各列の末尾に書き足すだけ。Date.i8 を最後に書くので、途中で止まっても
+Date.i8 の長さまでが有効な行になる（それより長い列は次の追記で切り詰める）。
+fetch_stock.py は最後に保存した日付の翌日から先だけを取得する。
+
+CSV は取り込み（import_csv）と書き出し（export_csv、従来の <ticker>_<start>_to_<end>.csv）に使う。
+
+使用例:
+  uv run python tools/price_store.py --store data/store --import-csv data/raw/*.csv
+  uv run python tools/price_store.py --store data/store --export data/raw --start 2022-08-30 --end 2025-09-08
+"""
+import argparse
+import csv
+import os
+import re
+from datetime import date, timedelta
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+FIELDS = ["Date", "Open", "High", "Low", "Close", "Adj Close", "Volume"]
+
+# 列名 -> (ファイル名, dtype)
+COLUMNS: Dict[str, Tuple[str, str]] = {
+    "Open": ("Open.f4", "<f4"),
+    "High": ("High.f4", "<f4"),
+    "Low": ("Low.f4", "<f4"),
+    "Close": ("Close.f4", "<f4"),
+    "Adj Close": ("AdjClose.f4", "<f4"),
+    "Volume": ("Volume.i8", "<i8"),
+}
+DATE_FILE = "Date.i8"
+
+# (Date, Open, High, Low, Close, Adj Close, Volume)
+Row = Tuple[str, float, float, float, float, float, int]
+
+_SPAN_RE = re.compile(r"^(.*?)_\d{4}-\d{2}-\d{2}_to_\d{4}-\d{2}-\d{2}$")
+
+
+def ticker_to_stem(ticker: str) -> str:
+    """7203.T -> 7203_T（従来のCSVと同じ置き換え）"""
+    return ticker.replace(".", "_")
+
+
+def stem_to_ticker(stem: str) -> str:
+    """7203_T -> 7203.T"""
+    head, sep, tail = stem.rpartition("_")
+    return f"{head}.{tail}" if sep else stem
+
+
+def ticker_from_csv_path(path: str) -> str:
+    """data/raw/7203_T_2022-08-30_to_2025-09-08.csv -> 7203.T"""
+    stem = os.path.splitext(os.path.basename(path))[0]
+    m = _SPAN_RE.match(stem)
+    return stem_to_ticker(m.group(1) if m else stem)
+
+
+def to_days(d: str) -> int:
+    """YYYY-MM-DD -> 1970-01-01 からの日数"""
+    return int(np.datetime64(d[:10], "D").astype(np.int64))
+
+
+def from_days(n: int) -> str:
+    return str(np.datetime64(int(n), "D"))
+
+
+class PriceStore:
+    def __init__(self, root: str = "data/store"):
+        self.root = root
+
+    def path(self, ticker: str) -> str:
+        return os.path.join(self.root, ticker_to_stem(ticker))
+
+    def tickers(self) -> List[str]:
+        if not os.path.isdir(self.root):
+            return []
+        return sorted(
+            stem_to_ticker(d) for d in os.listdir(self.root)
+            if os.path.exists(os.path.join(self.root, d, DATE_FILE))
+        )
+
+    def length(self, ticker: str) -> int:
+        """保存済みの行数"""
+        p = os.path.join(self.path(ticker), DATE_FILE)
+        return os.path.getsize(p) // 8 if os.path.exists(p) else 0
+
+    def last_date(self, ticker: str) -> Optional[str]:
+        """
+        最後に保存した日付（YYYY-MM-DD）。まだ無ければ None。
+        Date.i8 の末尾 8 バイトだけを読む。
+        """
+        n = self.length(ticker)
+        if n == 0:
+            return None
+        with open(os.path.join(self.path(ticker), DATE_FILE), "rb") as f:
+            f.seek((n - 1) * 8)
+            return from_days(np.frombuffer(f.read(8), dtype="<i8")[0])
+
+    def next_start(self, ticker: str, start: Optional[str]) -> Optional[str]:
+        """
+        次に取得を始める日付。保存済みなら最後の日付の翌日、無ければ start。
+        """
+        last = self.last_date(ticker)
+        if last is None:
+            return start
+        nxt = (date.fromisoformat(last) + timedelta(days=1)).isoformat()
+        return max(nxt, start) if start else nxt
+
+    def append(self, ticker: str, rows: Iterable[Row]) -> int:
+        """
+        最後に保存した日付より新しい行だけを日付順に追記し、追記した行数を返す。
+        """
+        last = self.last_date(ticker)
+        new_rows = sorted((r for r in rows if last is None or r[0][:10] > last), key=lambda r: r[0])
+        if not new_rows:
+            return 0
+        d = self.path(ticker)
+        os.makedirs(d, exist_ok=True)
+        n = self.length(ticker)
+
+        for i, (field, (fname, dtype)) in enumerate(COLUMNS.items(), 1):
+            arr = np.array([r[i] for r in new_rows], dtype=dtype)
+            self._append_file(os.path.join(d, fname), n * arr.itemsize, arr)
+        days = np.array([to_days(r[0]) for r in new_rows], dtype="<i8")
+        self._append_file(os.path.join(d, DATE_FILE), n * 8, days)
+        return len(new_rows)
+
+    @staticmethod
+    def _append_file(path: str, valid_bytes: int, arr: np.ndarray) -> None:
+        # 前回途中で止まった分があれば切り詰めてから書き足す
+        with open(path, "ab") as f:
+            if f.tell() != valid_bytes:
+                f.truncate(valid_bytes)
+                f.seek(valid_bytes)
+            f.write(arr.tobytes())
+
+    def load(self, ticker: str, start: Optional[str] = None,
+             end: Optional[str] = None) -> Dict[str, np.ndarray]:
+        """
+        列ごとの配列を返す（キーは "Date" と COLUMNS の列名）。
+        ファイルを memmap するだけでコピーはしない。"Date" は datetime64[D]。
+        start は含み、end は含まない（yfinance と同じ）。期間は日付の索引を二分探索して切り出す。
+        """
+        n = self.length(ticker)
+        d = self.path(ticker)
+        if n == 0:
+            out = {"Date": np.empty(0, dtype="datetime64[D]")}
+            out.update({field: np.empty(0, dtype=dtype) for field, (_, dtype) in COLUMNS.items()})
+            return out
+        days = np.memmap(os.path.join(d, DATE_FILE), dtype="<i8", mode="r", shape=(n,))
+        lo = int(np.searchsorted(days, to_days(start), "left")) if start else 0
+        hi = int(np.searchsorted(days, to_days(end), "left")) if end else n
+        out = {"Date": days[lo:hi].view("datetime64[D]")}
+        for field, (fname, dtype) in COLUMNS.items():
+            col = np.memmap(os.path.join(d, fname), dtype=dtype, mode="r", shape=(n,))
+            out[field] = col[lo:hi]
+        return out
+
+    def read(self, ticker: str, start: Optional[str] = None, end: Optional[str] = None) -> List[Row]:
+        """
+        保存済みの行を返す。start は含み、end は含まない（yfinance と同じ）。
+        """
+        cols = self.load(ticker, start, end)
+        dates = [str(d) for d in cols["Date"]]
+        values = [cols[field].tolist() for field in COLUMNS]
+        return [(d, *vals) for d, *vals in zip(dates, *values)]
+
+    def export_csv(self, ticker: str, out_dir: str,
+                   start: Optional[str] = None, end: Optional[str] = None) -> Optional[str]:
+        """
+        従来の fetch_stock.save_csv と同じ名前・列のCSVを書き出す。
+        start/end を省略したときは保存済みの全期間を書き、ファイル名には実際の先頭・末尾の日付を入れる。
+        期間が変わるとファイル名も変わるので、同じ銘柄の前に書き出したCSVは消す
+        （残すと build_pack --csv-dir で同じ銘柄の問題が重複する）。
+        """
+        rows = self.read(ticker, start, end)
+        if not rows:
+            return None
+        os.makedirs(out_dir, exist_ok=True)
+        stem = ticker_to_stem(ticker)
+        span_start = start or rows[0][0]
+        span_end = end or rows[-1][0]
+        name = f"{stem}_{span_start}_to_{span_end}.csv"
+        out_path = os.path.join(out_dir, name)
+        with open(out_path, "w", encoding="utf-8", newline="") as f:
+            w = csv.writer(f, lineterminator="\n")
+            w.writerow(FIELDS)
+            w.writerows(rows)
+
+        # 7203 と 7203_T を取り違えないように、期間の部分は日付の文字だけに限る
+        old = re.compile(re.escape(stem) + r"_[0-9-]+_to_[0-9-]+\.csv")
+        for other in os.listdir(out_dir):
+            if other != name and old.fullmatch(other):
+                os.remove(os.path.join(out_dir, other))
+        return out_path
+
+    def import_csv(self, path: str, ticker: Optional[str] = None) -> int:
+        """
+        yfinance 形式のCSV（fetch_stock の従来の出力）を取り込み、追記した行数を返す。
+        日付や終値が読めない行（yf.download の2段目のヘッダーなど）は飛ばす。
+        """
+        rows: List[Row] = []
+        with open(path, "r", encoding="utf-8-sig", newline="") as f:
+            for row in csv.DictReader(f):
+                d = (row.get("Date") or row.get("Datetime") or "").strip()[:10]
+                try:
+                    close = float(row["Close"])
+                    rows.append((
+                        d,
+                        float(row.get("Open") or close),
+                        float(row.get("High") or close),
+                        float(row.get("Low") or close),
+                        close,
+                        float(row.get("Adj Close") or close),
+                        int(float(row.get("Volume") or 0)),
+                    ))
+                except (KeyError, TypeError, ValueError):
+                    continue
+        rows = [r for r in rows if re.match(r"^\d{4}-\d{2}-\d{2}$", r[0])]
+        return self.append(ticker or ticker_from_csv_path(path), rows)
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Import CSVs into / export CSVs from the per-ticker price store.")
+    ap.add_argument("--store", default="data/store", help="ストアのディレクトリ")
+    ap.add_argument("--import-csv", nargs="*", help="取り込むCSV（yfinance 形式）")
+    ap.add_argument("--export", help="従来形式のCSVを書き出すディレクトリ")
+    ap.add_argument("--tickers", nargs="*", help="書き出す銘柄（省略時は全部）")
+    ap.add_argument("--start", help="開始日 YYYY-MM-DD（含む）")
+    ap.add_argument("--end", help="終了日 YYYY-MM-DD（含まない）")
+    args = ap.parse_args()
+
+    if not args.import_csv and not args.export:
+        raise SystemExit("--import-csv か --export を指定してください。")
+
+    store = PriceStore(args.store)
+    for p in args.import_csv or []:
+        n = store.import_csv(p)
+        print(f"{p} -> {store.path(ticker_from_csv_path(p))}  appended={n}")
+
+    if args.export:
+        tickers: Sequence[str] = args.tickers or store.tickers()
+        for t in tickers:
+            path = store.export_csv(t, args.export, args.start, args.end)
+            print(f"{t} -> {path or '(no rows)'}")
+
+
+if __name__ == "__main__":
+    main()